@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for the Auto-Placer, run against a simulated desktop
+or a replay of a recorded real run.
+"""
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Time-to-layout benchmarks on a simulated desktop.
+
+Every mode places the same generated layout on a fresh SimulatedDesktop and
+reports the wall-clock time until every window is placed (p50/p99 over the
+runs), how often the desktop was enumerated and read, and the CPU time used.
+Runs anywhere, including Linux:
+
+    python -m benchmarks.placement --apps 1 10 50 200 --runs 5
+    python -m benchmarks.placement --json results.json
+    python -m benchmarks.placement --baseline results.json
+"""
+import argparse
+import json
+import logging
+import math
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+from src.utils.backend import set_backend
+from src.utils.config_manager import AppConfig
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.placement_engine import PlacementEngine
+from src.utils.process_tracker import ProcessTracker
+from src.utils.simulated_desktop import Latency, SimulatedApp, SimulatedDesktop
+from src.utils.stabilizer import PlacementStabilizer
+from src.utils.startup_model import StartupHistory
+from src.utils.window_manager import WindowManager
+
+# The flow this app started with waits a fixed two seconds for every app
+LEGACY_WAIT = 2.0
+# Startup medians of the generated apps, in seconds
+STARTUP_MEDIANS = (0.4, 0.8, 1.5, 3.0)
+
+@dataclass
+class RunResult:
+    """Measurements of one benchmark run."""
+    seconds: float
+    cpu_seconds: float
+    failed: int
+    enumerations: int
+    searches: int
+    window_reads: int
+    process_snapshots: int
+    moves: int
+
+@dataclass
+class Summary:
+    """A mode's measurements for one layout size, over all runs."""
+    mode: str
+    apps: int
+    p50_ms: float
+    p99_ms: float
+    cpu_ms: float
+    failed: float
+    enumerations: float
+    searches: float
+    window_reads: float
+    process_snapshots: float
+    moves: float
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of values."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def generate_layout(count: int, seed: int) -> List[SimulatedApp]:
+    """Builds count app profiles with mixed startup times; some start through a launcher."""
+    rng = random.Random(seed)
+    return [SimulatedApp(f"C:\\Apps\\app{index}.exe", Latency(rng.choice(STARTUP_MEDIANS), 0.4),
+                         launcher=rng.random() < 0.1)
+            for index in range(count)]
+
+def layout_configs(apps: List[SimulatedApp]) -> List[AppConfig]:
+    """Places the apps on a grid of 320x240 cells."""
+    columns = 6
+    return [AppConfig(app.executable, (index % columns * 320, index // columns % 4 * 240), (320, 240))
+            for index, app in enumerate(apps)]
+
+def engine_for(desktop: SimulatedDesktop, events: bool, workers: int,
+               stabilizer: Optional[PlacementStabilizer] = None) -> PlacementEngine:
+    """An engine with time-scaled waits and an in-memory startup history."""
+    pipeline = LaunchPipeline(
+        max_workers=workers,
+        window_timeout=30.0 / desktop.speed,
+        poll_interval=0.1 / desktop.speed,
+        tracker=ProcessTracker(min_refresh_interval=0.05 / desktop.speed),
+        event_source=desktop.create_event_source() if events else None,
+        stabilizer=stabilizer
+    )
+    engine = PlacementEngine(pipeline)
+    engine.set_history(StartupHistory())
+    return engine
+
+def run_legacy(desktop: SimulatedDesktop, configs: List[AppConfig], workers: int) -> int:
+    """The original open_apps flow: open everything, sleep, then find and move each app by path."""
+    for config in configs:
+        WindowManager.open_app(config.shortcut_path)
+    time.sleep(LEGACY_WAIT / desktop.speed)
+    failed = 0
+    for config in configs:
+        try:
+            WindowManager.move_and_resize_window(config.shortcut_path, config.position, config.size)
+        except Exception:
+            failed += 1
+    return failed
+
+def run_polling(desktop: SimulatedDesktop, configs: List[AppConfig], workers: int) -> int:
+    """Concurrent launches; each waiter polls a shared window snapshot."""
+    results = engine_for(desktop, False, workers).run(configs)
+    return sum(not result.success for result in results)
+
+def run_events(desktop: SimulatedDesktop, configs: List[AppConfig], workers: int) -> int:
+    """Concurrent launches woken by window events."""
+    results = engine_for(desktop, True, workers).run(configs)
+    return sum(not result.success for result in results)
+
+def run_reapply(desktop: SimulatedDesktop, configs: List[AppConfig], workers: int) -> int:
+    """Incremental apply when every app is already open: one enumeration and a batched move."""
+    for config in configs:
+        desktop.add_window(config.shortcut_path)
+    results = engine_for(desktop, True, workers).run(configs, incremental=True)
+    return sum(not result.success for result in results)
+
+MODES: Dict[str, Callable[[SimulatedDesktop, List[AppConfig], int], int]] = {
+    "legacy": run_legacy,
+    "polling": run_polling,
+    "events": run_events,
+    "reapply": run_reapply,
+}
+
+def run_once(mode: str, count: int, seed: int, speed: float, workers: int, background: int) -> RunResult:
+    """Runs one mode on a fresh desktop."""
+    apps = generate_layout(count, seed)
+    desktop = SimulatedDesktop(apps, speed=speed, seed=seed)
+    for index in range(background):
+        desktop.add_window(f"C:\\Background\\other{index}.exe")
+    desktop.counters.reset()
+    set_backend(desktop)
+    try:
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        failed = MODES[mode](desktop, layout_configs(apps), workers)
+        seconds = time.perf_counter() - start
+        cpu_seconds = time.process_time() - cpu_start
+    finally:
+        set_backend(None)
+        desktop.close()
+    counters = desktop.counters
+    return RunResult(seconds, cpu_seconds, failed, counters.enumerations, counters.searches,
+                     counters.window_reads, counters.process_snapshots, counters.moves)
+
+def summarize(mode: str, count: int, runs: List[RunResult]) -> Summary:
+    """Aggregates runs: latency percentiles, and means of everything else."""
+    def mean(name: str) -> float:
+        return sum(getattr(run, name) for run in runs) / len(runs)
+
+    times = [run.seconds * 1000 for run in runs]
+    return Summary(mode, count, percentile(times, 0.5), percentile(times, 0.99), mean("cpu_seconds") * 1000,
+                   mean("failed"), mean("enumerations"), mean("searches"), mean("window_reads"),
+                   mean("process_snapshots"), mean("moves"))
+
+def print_table(summaries: List[Summary], speed: float) -> None:
+    """Prints one line per mode and layout size."""
+    print(f"Wall-clock times at {speed:g}x simulated speed")
+    print(f"{'mode':<9} {'apps':>5} {'p50 ms':>9} {'p99 ms':>9} {'cpu ms':>8} {'failed':>7} "
+          f"{'enums':>7} {'searches':>8} {'reads':>8} {'procs':>6} {'moves':>6}")
+    for s in summaries:
+        print(f"{s.mode:<9} {s.apps:>5} {s.p50_ms:>9.1f} {s.p99_ms:>9.1f} {s.cpu_ms:>8.1f} {s.failed:>7.1f} "
+              f"{s.enumerations:>7.1f} {s.searches:>8.1f} {s.window_reads:>8.0f} {s.process_snapshots:>6.1f} "
+              f"{s.moves:>6.1f}")
+
+def check_baseline(summaries: List[Summary], path: str, tolerance: float) -> List[str]:
+    """Returns a message for every mode and size whose p50 regressed beyond tolerance."""
+    with open(path, 'r') as f:
+        baseline = {(item["mode"], item["apps"]): item for item in json.load(f)["results"]}
+    regressions = []
+    for s in summaries:
+        previous = baseline.get((s.mode, s.apps))
+        if previous and s.p50_ms > previous["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{s.mode} with {s.apps} apps: p50 {s.p50_ms:.1f} ms, "
+                               f"baseline {previous['p50_ms']:.1f} ms")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark layout placement on a simulated desktop")
+    parser.add_argument("--apps", type=int, nargs="+", default=[1, 10, 50, 200], help="Layout sizes to run")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="Modes to run")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per mode and size")
+    parser.add_argument("--speed", type=float, default=20.0, help="Simulated time compression factor")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent launches in the pipeline modes")
+    parser.add_argument("--background", type=int, default=40,
+                        help="Windows of unrelated apps already on the desktop")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for app profiles and latencies")
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="Fail if p50 regressed against a --json file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p50 regression (fraction)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show the placement code's log")
+    args = parser.parse_args(argv)
+    # The legacy mode logs every window it fails to find
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    summaries = []
+    for count in args.apps:
+        for mode in args.modes:
+            runs = [run_once(mode, count, args.seed + run, args.speed, args.workers, args.background)
+                    for run in range(args.runs)]
+            summaries.append(summarize(mode, count, runs))
+    print_table(summaries, args.speed)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({"speed": args.speed, "results": [asdict(s) for s in summaries]}, f, indent=4)
+    if args.baseline:
+        regressions = check_baseline(summaries, args.baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""
+Replays recorded placement runs on a simulated desktop.
+
+A recording made with ``apply --record`` holds the window events and timings
+of a real run. Each replay launches the recorded layout through the current
+placement code, feeds every launch the events its app produced in the
+recording, and compares the outcome with the recorded one: which window each
+app got, whether it was placed and stayed in place, how soon its window was
+ready and how long the whole layout took. Times are reported in recorded seconds, whatever the
+replay speed. Runs anywhere, including Linux:
+
+    python -m benchmarks.replay session.json.gz --runs 5 --speed 10
+    python -m benchmarks.replay session.json.gz --json replay.json
+    python -m benchmarks.replay session.json.gz --baseline replay.json
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from benchmarks.placement import engine_for, percentile
+from src.utils.backend import set_backend
+from src.utils.layout_diff import DEFAULT_TOLERANCE, rect_matches
+from src.utils.replay_desktop import ReplayDesktop
+from src.utils.session_recording import SessionRecording, placed_windows
+from src.utils.stabilizer import SETTLE_DELAY, PlacementStabilizer
+
+@dataclass
+class ReplayRun:
+    """Outcome of one replay, in recorded seconds."""
+    seconds: float
+    failed: int
+    mismatched: List[str]
+    misplaced: int
+    first_windows: Dict[str, float]
+
+@dataclass
+class ReplaySummary:
+    """Replays of one recording, compared with the recorded run."""
+    recording: str
+    runs: int
+    recorded_s: float
+    p50_s: float
+    p99_s: float
+    recorded_failed: int
+    failed: float
+    mismatched: float
+    misplaced: float
+    recorded_first_window_s: float
+    first_window_s: float
+
+def replay_once(recording: SessionRecording, speed: float, events: bool, workers: int, watch: float) -> ReplayRun:
+    """Replays a recording once on a fresh desktop."""
+    desktop = ReplayDesktop(recording, speed=speed)
+    set_backend(desktop)
+    try:
+        # Watched like a real run, so apps that restore their own geometry are moved back
+        stabilizer = PlacementStabilizer(watch / speed, settle_delay=SETTLE_DELAY / speed) if watch > 0 else None
+        engine = engine_for(desktop, events, workers, stabilizer)
+        desktop.begin()
+        start = time.perf_counter()
+        results = engine.run(recording.layout, incremental=recording.incremental)
+        seconds = (time.perf_counter() - start) * speed
+    finally:
+        set_backend(None)
+        desktop.close()
+
+    placed = placed_windows(results, desktop.moves)
+    mismatched = [result.shortcut_path for result in recording.results
+                  if result.hwnd is not None and placed.get(result.key) != result.hwnd]
+    # A window that did not end up where its config says is as bad as a failure
+    final_rects = {}
+    for result in results:
+        hwnd = placed.get((result.config.shortcut_path, tuple(result.config.position), tuple(result.config.size)))
+        if hwnd is not None and hwnd in desktop.windows:
+            final_rects[hwnd] = (desktop.windows[hwnd].rect, result.config)
+    misplaced = sum(not rect_matches(rect, config.position, config.size, DEFAULT_TOLERANCE)
+                    for rect, config in final_rects.values())
+    first_windows = {result.config.shortcut_path: result.first_window * speed
+                     for result in results if result.first_window is not None}
+    return ReplayRun(seconds, sum(not result.success for result in results), mismatched, misplaced, first_windows)
+
+def median(values: List[float]) -> float:
+    """Returns the median of values, or 0 if there are none."""
+    return percentile(values, 0.5) if values else 0.0
+
+def summarize(path: str, recording: SessionRecording, runs: List[ReplayRun]) -> ReplaySummary:
+    """Aggregates replays: latency percentiles, and means of everything else."""
+    times = [run.seconds for run in runs]
+    recorded_first = [result.first_window for result in recording.results if result.first_window is not None]
+    first = [seconds for run in runs for seconds in run.first_windows.values()]
+    return ReplaySummary(path, len(runs), recording.duration, percentile(times, 0.5), percentile(times, 0.99),
+                         sum(not result.success for result in recording.results),
+                         sum(run.failed for run in runs) / len(runs),
+                         sum(len(run.mismatched) for run in runs) / len(runs),
+                         sum(run.misplaced for run in runs) / len(runs),
+                         median(recorded_first), median(first))
+
+def print_summary(summary: ReplaySummary, recording: SessionRecording, runs: List[ReplayRun], speed: float) -> None:
+    """Prints the recorded run next to the replays, and every app that got a different window."""
+    print(f"{summary.recording}: {len(recording.layout)} apps, {len(recording.launches)} launches, "
+          f"{len(recording.events)} window events; replayed {summary.runs}x at {speed:g}x speed")
+    print(f"{'':<9} {'p50 s':>8} {'p99 s':>8} {'failed':>7} {'mismatched':>11} {'misplaced':>10} "
+          f"{'first window p50 s':>19}")
+    print(f"{'recorded':<9} {summary.recorded_s:>8.2f} {'-':>8} {summary.recorded_failed:>7} {'-':>11} {'-':>10} "
+          f"{summary.recorded_first_window_s:>19.2f}")
+    print(f"{'replay':<9} {summary.p50_s:>8.2f} {summary.p99_s:>8.2f} {summary.failed:>7.1f} "
+          f"{summary.mismatched:>11.1f} {summary.misplaced:>10.1f} {summary.first_window_s:>19.2f}")
+    mismatches: Dict[str, int] = {}
+    for run in runs:
+        for shortcut_path in run.mismatched:
+            mismatches[shortcut_path] = mismatches.get(shortcut_path, 0) + 1
+    for shortcut_path, count in sorted(mismatches.items()):
+        print(f"  {shortcut_path}: placed a different window than recorded in {count}/{len(runs)} runs")
+
+def check_regressions(summary: ReplaySummary, baseline_path: Optional[str], tolerance: float) -> List[str]:
+    """Returns a message for every way the replays did worse than the recording or the baseline."""
+    regressions = []
+    if summary.mismatched:
+        regressions.append(f"{summary.mismatched:.1f} apps per run placed a different window than recorded")
+    if summary.misplaced:
+        regressions.append(f"{summary.misplaced:.1f} windows per run did not end up in their configured rect")
+    if summary.failed > summary.recorded_failed:
+        regressions.append(f"{summary.failed:.1f} apps per run failed, {summary.recorded_failed} in the recording")
+    if baseline_path:
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)
+        if summary.p50_s > baseline["p50_s"] * (1 + tolerance):
+            regressions.append(f"p50 {summary.p50_s:.2f} s, baseline {baseline['p50_s']:.2f} s")
+        if summary.first_window_s > baseline["first_window_s"] * (1 + tolerance):
+            regressions.append(f"first window p50 {summary.first_window_s:.2f} s, "
+                               f"baseline {baseline['first_window_s']:.2f} s")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded placement runs on a simulated desktop")
+    parser.add_argument("recording", help="A recording written by 'apply --record'")
+    parser.add_argument("--runs", type=int, default=5, help="Replays of the recording")
+    parser.add_argument("--speed", type=float, default=10.0, help="Time compression factor")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent launches")
+    parser.add_argument("--polling", action="store_true", help="Poll for windows instead of using window events")
+    parser.add_argument("--watch", type=float, metavar="SECONDS",
+                        help="Watch placed windows for drift, in recorded seconds (default: as recorded; 0 disables)")
+    parser.add_argument("--json", metavar="PATH", help="Write the summary as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="Also fail if latency regressed against a --json file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed latency regression (fraction)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show the placement code's log")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    try:
+        recording = SessionRecording.load(args.recording)
+    except (OSError, ValueError) as e:
+        print(f"Could not load recording {args.recording}: {e}", file=sys.stderr)
+        return 2
+
+    watch = recording.watch if args.watch is None else args.watch
+    runs = [replay_once(recording, args.speed, not args.polling, args.workers, watch)
+            for _ in range(args.runs)]
+    summary = summarize(args.recording, recording, runs)
+    print_summary(summary, recording, runs, args.speed)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(asdict(summary), f, indent=4)
+    regressions = check_regressions(summary, args.baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
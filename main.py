@@ -1,14 +1,25 @@
 import logging
-from src.gui.app_placer import AppPlacerGUI
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import sys
 
 def main():
     """Main entry point for the application."""
+    # Any arguments select the headless command-line mode, which never imports the GUI
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    from src.gui.app_placer import AppPlacerGUI
+    from src.utils.monitors import enable_dpi_awareness
+
+    # Work in physical pixels on every monitor, whatever its scale factor
+    enable_dpi_awareness()
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     app = AppPlacerGUI()
     app.run()
 
@@ -0,0 +1,331 @@
+"""
+Command-line interface for applying layouts without the GUI.
+
+Only the modules a command needs are imported, and never a GUI toolkit, so
+a hotkey or login script can restore a workspace with minimal overhead.
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Time from entering main() until placement can start
+STARTUP_BUDGET_MS = 150.0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for all commands."""
+    parser = argparse.ArgumentParser(prog="auto-placer", description="Open and place application windows.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    apply_parser = commands.add_parser("apply", help="Open and place the apps of a layout file")
+    apply_parser.add_argument("layout", help="Path to a layout JSON file")
+    apply_parser.add_argument("--relaunch", action="store_true",
+                              help="Launch every app even if a window is already open")
+    apply_parser.add_argument("--workers", type=int, default=8, help="Maximum concurrent launches")
+    apply_parser.add_argument("--max-starting", type=float, default=4.0,
+                              help="Total weight of apps allowed to start at once")
+    apply_parser.add_argument("--adaptive", action="store_true",
+                              help="Hold back launches while CPU or disk is saturated")
+    apply_parser.add_argument("--timeout", type=float, default=15.0, help="Per-app window timeout in seconds")
+    apply_parser.add_argument("--watch", type=float, default=3.0, metavar="SECONDS",
+                              help="Move windows back if their app moves them within this time (0 disables)")
+    apply_parser.add_argument("--timings", action="store_true", help="Print startup and placement timings")
+    apply_parser.add_argument("--trace", metavar="PATH",
+                              help="Write a Chrome trace of every app's phases and print a per-app summary")
+    apply_parser.add_argument("--record", metavar="PATH",
+                              help="Record the run's window events for benchmarks.replay (runs without the daemon)")
+    apply_parser.add_argument("--no-daemon", action="store_true",
+                              help="Run in this process even if a placement daemon is running")
+    apply_parser.set_defaults(handler=cmd_apply)
+
+    capture_parser = commands.add_parser("capture", help="Save the windows on the desktop as a layout file")
+    capture_parser.add_argument("output", help="Path of the layout JSON file to write")
+    capture_parser.add_argument("--include", action="append", default=[], metavar="PATTERN",
+                                help="Only capture executables matching this wildcard (repeatable)")
+    capture_parser.add_argument("--exclude", action="append", default=[], metavar="PATTERN",
+                                help="Skip executables matching this wildcard (repeatable)")
+    capture_parser.add_argument("--title", metavar="REGEX", help="Only capture windows whose title matches")
+    capture_parser.add_argument("--min-size", type=int, nargs=2, default=[100, 100], metavar=("WIDTH", "HEIGHT"),
+                                help="Skip windows smaller than this")
+    capture_parser.add_argument("--untitled", action="store_true", help="Also capture windows without a title")
+    capture_parser.add_argument("--shortcuts", action="store_true",
+                                help="Launch apps through their Start Menu shortcuts where possible")
+    capture_parser.add_argument("--relative", choices=["monitor", "percent"],
+                                help="Store positions relative to each window's monitor")
+    capture_parser.add_argument("--timings", action="store_true", help="Print the capture time")
+    capture_parser.add_argument("--no-daemon", action="store_true",
+                                help="Run in this process even if a placement daemon is running")
+    capture_parser.set_defaults(handler=cmd_capture)
+
+    tile_parser = commands.add_parser("tile", help="Tile the windows of a layout file without overlaps")
+    tile_parser.add_argument("layout", help="Path to a layout JSON file")
+    tile_parser.add_argument("-o", "--output", help="Where to write the tiled layout (default: in place)")
+    tile_parser.add_argument("--gap", type=int, default=8, help="Pixels between windows and screen edges")
+    tile_parser.add_argument("--mode", choices=["auto", "fast", "optimal"], default="auto",
+                             help="Search every tiling (optimal; monitors with more than 8 windows use the fast "
+                                  "partition, as searching grows about 4x per window) or always use the fast "
+                                  "partition (default: optimal up to 4 windows per monitor)")
+    tile_parser.add_argument("--monitor", action="append", metavar="MONITOR",
+                             help="Only tile on this monitor: index, device name or primary (repeatable)")
+    tile_parser.add_argument("--timings", action="store_true", help="Print the solver time")
+    tile_parser.set_defaults(handler=cmd_tile)
+
+    profile_parser = commands.add_parser("profile", help="Manage the layout profile library")
+    profile_commands = profile_parser.add_subparsers(dest="profile_command", required=True)
+    import_parser = profile_commands.add_parser("import", help="Import layout JSON files as profiles")
+    import_parser.add_argument("layouts", nargs="+", help="Layout JSON files; each is named after its file")
+    import_parser.add_argument("--tag", action="append", default=[], help="Tag the imported profiles (repeatable)")
+    import_parser.add_argument("--variant", default="", help="Monitor-set variant to import as")
+    list_parser = profile_commands.add_parser("list", help="List profiles")
+    list_parser.add_argument("query", nargs="?", default="", help="Only list profiles whose name contains this")
+    list_parser.add_argument("--tag", action="append", default=[], help="Only list profiles with this tag (repeatable)")
+    export_parser = profile_commands.add_parser("export", help="Write a profile to a layout JSON file")
+    export_parser.add_argument("name", help="Profile name")
+    export_parser.add_argument("output", help="Path of the layout JSON file to write")
+    export_parser.add_argument("--variant", help="Monitor-set variant to export")
+    profile_parser.set_defaults(handler=cmd_profile)
+
+    daemon_parser = commands.add_parser("daemon", help="Run the resident placement daemon")
+    daemon_parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    daemon_parser.set_defaults(handler=cmd_daemon)
+
+    return parser
+
+def print_results(results) -> None:
+    """Prints one line per placement result."""
+    for result in results:
+        status = "reused" if result.reused and result.success else "ok" if result.success else "FAILED"
+        detail = f" ({result.error})" if result.error else ""
+        print(f"{status:>7}  {result.elapsed:6.2f}s  {result.config.shortcut_path}{detail}")
+
+def cmd_apply(args: argparse.Namespace, started: float) -> int:
+    """Applies a layout file and returns the process exit code."""
+    from .utils.daemon import DaemonClient
+    from .utils.launch_pipeline import PlacementResult
+    from .utils.tracing import PlacementTrace
+
+    trace = PlacementTrace() if args.trace else None
+    # Only a run in this process can be recorded
+    client = None if args.no_daemon or args.record else DaemonClient.discover()
+    if client is not None:
+        startup_ms = (time.perf_counter() - started) * 1000
+        # The daemon runs with the same options as a run in this process would
+        options = {"workers": args.workers, "timeout": args.timeout, "watch": args.watch,
+                   "max_starting": args.max_starting, "adaptive": args.adaptive}
+        response = client.request("apply", layout=os.path.abspath(args.layout), incremental=not args.relaunch,
+                                  trace=trace is not None, options=options)
+        if not response.get("ok"):
+            print(f"Daemon could not apply {args.layout}: {response.get('error')}", file=sys.stderr)
+            return 2
+        results = [PlacementResult.from_dict(item) for item in response["results"]]
+        if trace is not None and "trace" in response:
+            trace.merge(PlacementTrace.from_dict(response["trace"]))
+    else:
+        results, startup_ms = apply_locally(args, started, trace)
+        if results is None:
+            return 2
+    total_ms = (time.perf_counter() - started) * 1000
+
+    print_results(results)
+    if args.timings:
+        print(f"startup {startup_ms:.1f} ms, total {total_ms:.1f} ms")
+    if trace is not None:
+        print()
+        print(trace.format_summary())
+        try:
+            trace.save(args.trace)
+            print(f"Trace written to {args.trace}")
+        except OSError as e:
+            print(f"Could not write trace {args.trace}: {e}", file=sys.stderr)
+
+    return 0 if all(result.success for result in results) else 1
+
+def apply_locally(args: argparse.Namespace, started: float, trace=None):
+    """Runs a placement in this process; returns (results, startup_ms)."""
+    from .utils.backend import current_backend, set_backend
+    from .utils.config_manager import ConfigManager
+    from .utils.launch_pipeline import LaunchPipeline
+    from .utils.launch_scheduler import LaunchScheduler, default_load_probe
+    from .utils.placement_engine import PlacementEngine
+    from .utils.session_recording import SessionRecorder
+    from .utils.stabilizer import PlacementStabilizer
+
+    try:
+        configs = ConfigManager.load_configs(args.layout)
+    except Exception as e:
+        print(f"Could not load layout {args.layout}: {e}", file=sys.stderr)
+        return None, 0.0
+
+    # The recorder must be in place before the event source is created
+    recorder = SessionRecorder(current_backend()) if args.record else None
+    if recorder is not None:
+        set_backend(recorder)
+
+    scheduler = LaunchScheduler(args.max_starting, probe=default_load_probe() if args.adaptive else None)
+    pipeline = LaunchPipeline(max_workers=args.workers, window_timeout=args.timeout,
+                              event_source=current_backend().create_event_source(), scheduler=scheduler,
+                              stabilizer=PlacementStabilizer(args.watch) if args.watch > 0 else None)
+    engine = PlacementEngine(pipeline)
+
+    startup_ms = (time.perf_counter() - started) * 1000
+    if startup_ms > STARTUP_BUDGET_MS:
+        logger.warning(f"Startup took {startup_ms:.0f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)")
+
+    if recorder is None:
+        return engine.run(configs, incremental=not args.relaunch, layout_path=args.layout, trace=trace), startup_ms
+
+    recorder.begin(configs, not args.relaunch, args.watch)
+    try:
+        results = engine.run(configs, incremental=not args.relaunch, layout_path=args.layout, trace=trace)
+    finally:
+        set_backend(recorder.backend)
+    try:
+        recorder.finish(results).save(args.record)
+        print(f"Recording written to {args.record}")
+    except OSError as e:
+        print(f"Could not write recording {args.record}: {e}", file=sys.stderr)
+    return results, startup_ms
+
+def cmd_capture(args: argparse.Namespace, started: float) -> int:
+    """Captures the desktop into a layout file and returns the process exit code."""
+    from .utils.config_manager import AppConfig, ConfigManager
+    from .utils.daemon import DaemonClient
+    from .utils.desktop_capture import CaptureFilter, capture_desktop, shortcut_index
+    from .utils.geometry import to_relative
+    from .utils.monitors import current_topology
+    from .utils.window_snapshot import WindowSnapshot
+
+    try:
+        capture_filter = CaptureFilter(args.include, args.exclude, args.title, tuple(args.min_size), args.untitled)
+    except re.error as e:
+        print(f"Invalid title pattern: {e}", file=sys.stderr)
+        return 2
+
+    output = os.path.abspath(args.output)
+    client = None if args.no_daemon else DaemonClient.discover()
+    try:
+        if client is not None:
+            response = client.request("capture", filter=capture_filter.to_dict(), shortcuts=args.shortcuts)
+            if not response.get("ok"):
+                raise RuntimeError(response.get("error"))
+            configs = [AppConfig.from_dict(item) for item in response["configs"]]
+        else:
+            snapshot = WindowSnapshot()
+            snapshot.refresh()
+            shortcuts = shortcut_index() if args.shortcuts else None
+            configs = capture_desktop(snapshot, capture_filter, shortcuts)
+        if args.relative:
+            topology = current_topology()
+            configs = [to_relative(config, topology, args.relative) for config in configs]
+        ConfigManager.save_configs(configs, output)
+    except Exception as e:
+        print(f"Could not capture the desktop: {e}", file=sys.stderr)
+        return 2
+
+    for config in configs:
+        print(f"{config.position[0]:>7g},{config.position[1]:<7g} {config.size[0]:>6g}x{config.size[1]:<6g} "
+              f"{config.shortcut_path}")
+    if args.timings:
+        print(f"total {(time.perf_counter() - started) * 1000:.1f} ms")
+    return 0
+
+def cmd_tile(args: argparse.Namespace, started: float) -> int:
+    """Tiles a layout file and returns the process exit code."""
+    from .utils.config_manager import ConfigManager
+    from .utils.monitors import current_topology
+    from .utils.tiling import solve_tiling
+
+    try:
+        configs = ConfigManager.load_configs(args.layout)
+    except Exception as e:
+        print(f"Could not load layout {args.layout}: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        topology = current_topology()
+        monitors = [topology.select(selector) for selector in args.monitor] if args.monitor else None
+        solve_started = time.perf_counter()
+        configs = solve_tiling(configs, topology, args.gap, args.mode, monitors)
+        solve_ms = (time.perf_counter() - solve_started) * 1000
+        ConfigManager.save_configs(configs, args.output or args.layout)
+    except Exception as e:
+        print(f"Could not tile the layout: {e}", file=sys.stderr)
+        return 2
+
+    for config in configs:
+        print(f"{config.position[0]:>7},{config.position[1]:<7} {config.size[0]:>6}x{config.size[1]:<6} "
+              f"{config.shortcut_path}")
+    if args.timings:
+        print(f"solve {solve_ms:.1f} ms  total {(time.perf_counter() - started) * 1000:.1f} ms")
+    return 0
+
+def cmd_profile(args: argparse.Namespace, started: float) -> int:
+    """Runs a profile library command and returns the process exit code."""
+    from .utils.config_manager import ConfigManager
+    from .utils.profile_store import ProfileStore
+
+    store = ProfileStore()
+    try:
+        if args.profile_command == "import":
+            failed = 0
+            for layout in args.layouts:
+                try:
+                    print(f"imported  {store.import_layout(layout, tags=args.tag, variant=args.variant)}")
+                except Exception as e:
+                    print(f"Could not import {layout}: {e}", file=sys.stderr)
+                    failed += 1
+            return 1 if failed else 0
+        if args.profile_command == "list":
+            for summary in store.search(args.query, args.tag, limit=-1):
+                variant = f" [{summary.variant}]" if summary.variant else ""
+                tags = f"  #{' #'.join(summary.tags)}" if summary.tags else ""
+                print(f"{summary.app_count:>4} apps  {summary.name}{variant}{tags}")
+            return 0
+        try:
+            ConfigManager.save_configs(store.load(args.name, args.variant), args.output)
+        except KeyError:
+            print(f"No profile named {args.name}", file=sys.stderr)
+            return 2
+        return 0
+    finally:
+        store.close()
+
+def cmd_daemon(args: argparse.Namespace, started: float) -> int:
+    """Runs the placement daemon in the foreground, or stops a running one."""
+    from .utils.daemon import DaemonClient, PlacementDaemon
+
+    client = DaemonClient.discover()
+    if args.stop:
+        if client is None:
+            print("No placement daemon is running", file=sys.stderr)
+            return 1
+        client.request("shutdown")
+        return 0
+    if client is not None:
+        print("A placement daemon is already running", file=sys.stderr)
+        return 1
+
+    daemon = PlacementDaemon()
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        daemon.shutdown()
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the command-line interface."""
+    started = time.perf_counter()
+    args = build_parser().parse_args(argv)
+    from .utils.monitors import enable_dpi_awareness
+    enable_dpi_awareness()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    return args.handler(args, started)
\ No newline at end of file
@@ -0,0 +1,281 @@
+import customtkinter as ctk
+from dataclasses import dataclass, replace
+from typing import Callable, List, Optional, Tuple
+import logging
+from ..utils.config_manager import UNITS_PIXELS, AppConfig
+
+logger = logging.getLogger(__name__)
+
+# Height of one app row in pixels, including its padding
+ROW_HEIGHT = 46
+EMPTY_APP_TEXT = "Click to choose an app!"
+
+def parse_position_size(value: str, kind: type = int) -> Tuple[int, int]:
+    """Parses position or size string into a tuple of integers (or of kind)."""
+    try:
+        x, y = map(kind, value.split("*"))
+        return (x, y)
+    except ValueError:
+        raise ValueError(f"Invalid format: {value}. Expected format: number*number")
+
+def format_position_size(value: Tuple[float, float]) -> str:
+    """Formats a position or size for an entry field."""
+    return "*".join(f"{item:g}" if isinstance(item, float) else str(item) for item in value)
+
+@dataclass
+class AppEntry:
+    """One app row as edited in the GUI.
+
+    Position and size are kept as typed; config is the loaded configuration,
+    so fields the list does not edit (priority, match rules, ...) survive
+    an import/export round trip.
+    """
+    shortcut_path: Optional[str] = None
+    position: str = ""
+    size: str = ""
+    config: Optional[AppConfig] = None
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> 'AppEntry':
+        """Create an entry from a configuration."""
+        return cls(
+            shortcut_path=config.shortcut_path,
+            position=format_position_size(config.position),
+            size=format_position_size(config.size),
+            config=config
+        )
+
+    def to_config(self) -> AppConfig:
+        """Convert the entry to a configuration; raises ValueError if it is incomplete."""
+        if not self.shortcut_path:
+            raise ValueError("No app chosen")
+        # Monitor-relative coordinates may be fractional
+        kind = int if self.config is None or self.config.units == UNITS_PIXELS else float
+        position = parse_position_size(self.position, kind)
+        size = parse_position_size(self.size, kind)
+        if self.config is not None:
+            return replace(self.config, shortcut_path=self.shortcut_path, position=position, size=size)
+        return AppConfig(self.shortcut_path, position, size)
+
+class AppListModel:
+    """The list of app rows, independent of the widgets that display it."""
+
+    def __init__(self):
+        self.entries: List[AppEntry] = []
+        self._listeners: List[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Registers a callback invoked after every change."""
+        self._listeners.append(listener)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> AppEntry:
+        return self.entries[index]
+
+    def append(self, entry: AppEntry) -> None:
+        """Adds an entry at the end of the list."""
+        self.entries.append(entry)
+        self._changed()
+
+    def remove(self, index: int) -> None:
+        """Removes the entry at index."""
+        del self.entries[index]
+        self._changed()
+
+    def update(self, index: int, notify: bool = True, **changes) -> None:
+        """Changes fields of one entry.
+
+        Edits coming from a row's own widgets pass notify=False so the row
+        being typed into is not rebound.
+        """
+        entry = self.entries[index]
+        for name, value in changes.items():
+            setattr(entry, name, value)
+        if notify:
+            self._changed()
+
+    def replace_all(self, configs: List[AppConfig]) -> None:
+        """Replaces every entry with the given configurations."""
+        self.entries = [AppEntry.from_config(config) for config in configs]
+        self._changed()
+
+    def configs(self) -> List[AppConfig]:
+        """Returns the configurations of all complete entries."""
+        configs = []
+        for entry in self.entries:
+            if not entry.shortcut_path:
+                continue
+            try:
+                configs.append(entry.to_config())
+            except ValueError as e:
+                logger.error(f"Invalid configuration: {e}")
+        return configs
+
+    def _changed(self) -> None:
+        for listener in self._listeners:
+            listener()
+
+class AppRowView:
+    """A pooled row of widgets, rebound to whichever entry scrolls into its slot."""
+
+    def __init__(self, app_list: 'VirtualAppList'):
+        self.index: Optional[int] = None
+        self.widget_state = "normal"
+        self.frame = ctk.CTkFrame(app_list.body)
+
+        # App selection button
+        self.app_button = ctk.CTkButton(
+            self.frame,
+            text=EMPTY_APP_TEXT,
+            command=lambda: app_list.on_choose(self.index),
+            width=200
+        )
+        self.app_button.pack(side=ctk.LEFT, padx=5, pady=5)
+
+        # Position selection button
+        self.pos_button = ctk.CTkButton(
+            self.frame,
+            text="Select Position",
+            command=lambda: app_list.on_select_position(self.index),
+            width=120
+        )
+        self.pos_button.pack(side=ctk.LEFT, padx=5, pady=5)
+
+        # Position entry
+        self.pos_entry = ctk.CTkEntry(
+            self.frame,
+            width=140,
+            placeholder_text="Position (e.g., 500*300)"
+        )
+        self.pos_entry.pack(side=ctk.LEFT, padx=5, pady=5)
+        self.pos_entry.bind("<KeyRelease>", lambda _: app_list.model.update(
+            self.index, notify=False, position=self.pos_entry.get()))
+
+        # Size entry
+        self.size_entry = ctk.CTkEntry(
+            self.frame,
+            width=90,
+            placeholder_text="Size"
+        )
+        self.size_entry.pack(side=ctk.LEFT, padx=5, pady=5)
+        self.size_entry.bind("<KeyRelease>", lambda _: app_list.model.update(
+            self.index, notify=False, size=self.size_entry.get()))
+
+        # Remove button for this row
+        self.remove_button = ctk.CTkButton(
+            self.frame,
+            text="×",
+            width=30,
+            command=lambda: app_list.on_remove(self.index)
+        )
+        self.remove_button.pack(side=ctk.LEFT, padx=5, pady=5)
+
+    def bind(self, index: int, entry: AppEntry) -> None:
+        """Shows an entry in this row."""
+        self.index = index
+        self.app_button.configure(text=entry.shortcut_path or EMPTY_APP_TEXT)
+        self._set_text(self.pos_entry, entry.position)
+        self._set_text(self.size_entry, entry.size)
+
+    def set_state(self, state: str) -> None:
+        """Enables or disables the row's widgets."""
+        self.widget_state = state
+        for widget in (self.app_button, self.pos_button, self.pos_entry, self.size_entry, self.remove_button):
+            widget.configure(state=state)
+
+    def _set_text(self, entry: ctk.CTkEntry, text: str) -> None:
+        if entry.get() == text:
+            return
+        # Disabled entries ignore edits, so rows rebound while disabled are unlocked briefly
+        entry.configure(state="normal")
+        entry.delete(0, 'end')
+        if text:
+            entry.insert(0, text)
+        entry.configure(state=self.widget_state)
+
+class VirtualAppList(ctk.CTkFrame):
+    """A scrollable view of an AppListModel that only builds widgets for visible rows.
+
+    The row pool grows with the view's height, not with the number of
+    entries, so a layout with hundreds of apps costs as many widgets as fit
+    on screen. Scrolling rebinds the pooled rows to other entries.
+    """
+
+    def __init__(self, master, model: AppListModel, on_choose: Callable[[int], None],
+                 on_select_position: Callable[[int], None], on_remove: Callable[[int], None], **kwargs):
+        super().__init__(master, **kwargs)
+        self.model = model
+        self.on_choose = on_choose
+        self.on_select_position = on_select_position
+        self.on_remove = on_remove
+        self.rows: List[AppRowView] = []
+        self.first = 0
+        self.widget_state = "normal"
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side=ctk.RIGHT, fill="y", padx=(0, 5), pady=5)
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side=ctk.LEFT, fill="both", expand=True, padx=5, pady=5)
+
+        self.body.bind("<Configure>", self._on_resize)
+        self.bind("<Enter>", lambda _: self.bind_all("<MouseWheel>", self._on_mousewheel))
+        self.bind("<Leave>", lambda _: self.unbind_all("<MouseWheel>"))
+        model.add_listener(self.refresh)
+
+    def refresh(self) -> None:
+        """Rebinds the pooled rows to the entries in view."""
+        total = len(self.model)
+        count = len(self.rows)
+        self.first = max(0, min(self.first, total - count))
+        for slot, row in enumerate(self.rows):
+            index = self.first + slot
+            if index < total:
+                row.bind(index, self.model[index])
+                row.frame.place(x=0, y=slot * ROW_HEIGHT, relwidth=1.0, height=ROW_HEIGHT - 6)
+            else:
+                row.index = None
+                row.frame.place_forget()
+        if total > count:
+            self.scrollbar.set(self.first / total, (self.first + count) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, index: int) -> None:
+        """Scrolls the least distance that brings an entry into view."""
+        if index < self.first:
+            self.first = index
+        elif index >= self.first + len(self.rows):
+            self.first = index - len(self.rows) + 1
+        self.refresh()
+
+    def set_state(self, state: str) -> None:
+        """Enables or disables every row."""
+        self.widget_state = state
+        for row in self.rows:
+            row.set_state(state)
+
+    def _on_resize(self, event) -> None:
+        count = max(1, event.height // ROW_HEIGHT)
+        while len(self.rows) < count:
+            row = AppRowView(self)
+            row.set_state(self.widget_state)
+            self.rows.append(row)
+        for row in self.rows[count:]:
+            row.frame.destroy()
+        del self.rows[count:]
+        self.refresh()
+
+    def _on_scrollbar(self, command: str, value, unit: Optional[str] = None) -> None:
+        total = len(self.model)
+        if command == "moveto":
+            self.first = int(round(float(value) * total))
+        elif command == "scroll":
+            step = len(self.rows) if unit == "pages" else 1
+            self.first += int(value) * step
+        self.refresh()
+
+    def _on_mousewheel(self, event) -> None:
+        self.first -= 1 if event.delta > 0 else -1
+        self.refresh()
\ No newline at end of file
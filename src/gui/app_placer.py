@@ -1,16 +1,27 @@
 import customtkinter as ctk
-from typing import List, Tuple, Union
+from typing import List, Tuple
 import logging
-from time import sleep
+import queue
 import json
-from ..utils.window_manager import WindowManager
+import os
+from dataclasses import replace
+from .app_list import AppEntry, AppListModel, VirtualAppList, format_position_size, parse_position_size
+from .profile_browser import ProfileBrowser
+from ..utils.daemon import DaemonClient, RemotePlacementEngine
+from ..utils.desktop_capture import capture_desktop
+from ..utils.placement_engine import PlacementEngine
+from ..utils.profile_store import ProfileStore
 from ..utils.config_manager import AppConfig, ConfigManager
+from ..utils.geometry import is_relative, resolve_geometry, to_relative
+from ..utils.monitors import current_topology
 from ..utils.screen_manager import PositionSelector, ScreenManager
+from ..utils.tiling import solve_tiling
+from ..utils.window_snapshot import WindowSnapshot
 
 logger = logging.getLogger(__name__)
 
-# Define a type for customtkinter widgets
-CTkWidgetType = Union[ctk.CTkButton, ctk.CTkEntry, ctk.CTkFrame]
+# Progress updates from the placement engine are applied at most this often (~30 fps)
+PROGRESS_FRAME_MS = 33
 
 class AppPlacerGUI:
     """Main GUI application for the Auto-Placer."""
@@ -19,8 +30,12 @@ class AppPlacerGUI:
         self.root = ctk.CTk()
         self.root.title("AUTO-PLACER")
         self.root.iconbitmap("src/assets/aap.ico")
-        self.apps: List[List[CTkWidgetType]] = []
-        self.current_row = 0
+        self.model = AppListModel()
+        self.local_engine = PlacementEngine()
+        self.engine = self.local_engine
+        self.progress_window = None
+        self.layout_path = None
+        self.profile_store = None
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -33,7 +48,7 @@ class AppPlacerGUI:
         buttons_frame = ctk.CTkFrame(self.root)
         buttons_frame.pack(pady=10, padx=20, fill="x")
 
-        # Left side buttons (Add, Import, Export)
+        # Left side buttons (Add, Import, Export, Capture, Profiles, Auto-tile)
         left_buttons = ctk.CTkFrame(buttons_frame)
         left_buttons.pack(side=ctk.LEFT, padx=10, pady=5)
 
@@ -46,83 +61,51 @@ class AppPlacerGUI:
         self.export_button = ctk.CTkButton(left_buttons, text="EXPORT", command=self.export_config)
         self.export_button.pack(side=ctk.LEFT, padx=5)
 
+        self.capture_button = ctk.CTkButton(left_buttons, text="CAPTURE", command=self.capture_desktop)
+        self.capture_button.pack(side=ctk.LEFT, padx=5)
+
+        self.profiles_button = ctk.CTkButton(left_buttons, text="PROFILES", command=self.open_profiles)
+        self.profiles_button.pack(side=ctk.LEFT, padx=5)
+
+        self.tile_button = ctk.CTkButton(left_buttons, text="AUTO-TILE", command=self.auto_tile)
+        self.tile_button.pack(side=ctk.LEFT, padx=5)
+
         # Right side button (Open)
         self.open_button = ctk.CTkButton(buttons_frame, text="OPEN ALL", command=self.open_apps)
         self.open_button.pack(side=ctk.RIGHT, padx=10, pady=5)
 
-        # Windows frame with scrollbar
-        self.windows_frame = ctk.CTkScrollableFrame(self.root, width=600, height=400)
-        self.windows_frame.pack(pady=10, padx=20, fill="both", expand=True)
+        # Reuse already open, already placed windows instead of launching duplicates
+        self.reuse_switch = ctk.CTkSwitch(buttons_frame, text="Reuse open windows")
+        self.reuse_switch.select()
+        self.reuse_switch.pack(side=ctk.RIGHT, padx=10, pady=5)
+
+        # App list; only the rows in view have widgets
+        self.app_list = VirtualAppList(
+            self.root,
+            self.model,
+            on_choose=self.choose_shortcut,
+            on_select_position=self.select_position,
+            on_remove=self.remove_app,
+            width=600,
+            height=400
+        )
+        self.app_list.pack(pady=10, padx=20, fill="both", expand=True)
 
         # Add initial app row
         self.add_app()
 
     def add_app(self) -> None:
         """Adds a new app configuration row."""
-        if self.current_row >= 8:
-            return
-
-        # Create a frame for this app's widgets
-        app_frame = ctk.CTkFrame(self.windows_frame)
-        app_frame.pack(pady=5, padx=5, fill="x")
+        self.model.append(AppEntry())
+        self.app_list.scroll_to(len(self.model) - 1)
 
-        # App selection button
-        app_button = ctk.CTkButton(
-            app_frame,
-            text="Click to choose an app!",
-            command=lambda: self.choose_shortcut(app_button),
-            width=200
-        )
-        app_button.pack(side=ctk.LEFT, padx=5, pady=5)
-
-        # Position selection button
-        pos_button = ctk.CTkButton(
-            app_frame,
-            text="Select Position",
-            command=lambda: self.select_position(pos_entry, size_entry),
-            width=120
-        )
-        pos_button.pack(side=ctk.LEFT, padx=5, pady=5)
-
-        # Position entry
-        pos_entry = ctk.CTkEntry(
-            app_frame,
-            width=140,
-            placeholder_text="Position (e.g., 500*300)"
-        )
-        pos_entry.pack(side=ctk.LEFT, padx=5, pady=5)
-
-        # Size entry
-        size_entry = ctk.CTkEntry(
-            app_frame,
-            width=90,
-            placeholder_text="Size"
-        )
-        size_entry.pack(side=ctk.LEFT, padx=5, pady=5)
-
-        # Remove button for this specific app
-        remove_button = ctk.CTkButton(
-            app_frame,
-            text="×",
-            width=30,
-            command=lambda: self.remove_specific_app(app_frame, app_widgets)
-        )
-        remove_button.pack(side=ctk.LEFT, padx=5, pady=5)
-
-        app_widgets = [app_button, pos_button, pos_entry, size_entry]
-        self.apps.append(app_widgets)
-        self.current_row += 1
-
-    def remove_specific_app(self, app_frame: ctk.CTkFrame, app_widgets: List[CTkWidgetType]) -> None:
+    def remove_app(self, index: int) -> None:
         """Removes a specific app configuration."""
-        if self.current_row <= 1:
+        if len(self.model) <= 1:
             return
+        self.model.remove(index)
 
-        app_frame.destroy()
-        self.apps.remove(app_widgets)
-        self.current_row -= 1
-
-    def choose_shortcut(self, button: ctk.CTkButton) -> None:
+    def choose_shortcut(self, index: int) -> None:
         """Opens a file dialog to choose an application shortcut."""
         file_path = ctk.filedialog.askopenfilename(
             title="Choose a shortcut file",
@@ -132,14 +115,22 @@ class AppPlacerGUI:
             )
         )
         if file_path:
-            button.configure(text=file_path)
+            self.model.update(index, shortcut_path=file_path)
 
-    def select_position(self, position_entry: ctk.CTkEntry, size_entry: ctk.CTkEntry) -> None:
+    def select_position(self, index: int) -> None:
         """Opens a visual position and size selector."""
+        entry = self.model[index]
+        relative = entry.config is not None and is_relative(entry.config)
         # Get current values if they exist
         try:
-            current_pos = self.parse_position_size(position_entry.get())
-            current_size = self.parse_position_size(size_entry.get())
+            if relative:
+                # The selector works in desktop pixels
+                config = replace(entry.config, position=parse_position_size(entry.position, float),
+                                 size=parse_position_size(entry.size, float))
+                current_pos, current_size = resolve_geometry([config], current_topology())[0]
+            else:
+                current_pos = self.parse_position_size(entry.position)
+                current_size = self.parse_position_size(entry.size)
         except ValueError:
             # Default to center of screen if no valid values
             screen_size = ScreenManager.get_screen_size()
@@ -152,111 +143,119 @@ class AppPlacerGUI:
 
         # Get the selected position and size
         position, size = selector.get_position_and_size()
-        
-        # Update the entry fields
-        position_entry.delete(0, 'end')
-        position_entry.insert(0, f"{position[0]}*{position[1]}")
-        
-        size_entry.delete(0, 'end')
-        size_entry.insert(0, f"{size[0]}*{size[1]}")
+
+        # Update the row, keeping relative coordinates relative to the monitor the window landed on
+        if relative:
+            config = to_relative(replace(entry.config, position=position, size=size), current_topology(),
+                                 entry.config.units)
+            self.model.update(index, position=format_position_size(config.position),
+                              size=format_position_size(config.size), config=config)
+        else:
+            self.model.update(index, position=format_position_size(position), size=format_position_size(size))
 
     def parse_position_size(self, value: str) -> Tuple[int, int]:
         """Parses position or size string into a tuple of integers."""
-        try:
-            x, y = map(int, value.split("*"))
-            return (x, y)
-        except ValueError:
-            raise ValueError(f"Invalid format: {value}. Expected format: number*number")
+        return parse_position_size(value)
 
     def get_app_configs(self) -> List[AppConfig]:
         """Gets the current configuration for all apps."""
-        configs = []
-        for app_widgets in self.apps:
-            shortcut_path = app_widgets[0].cget("text")
-            if shortcut_path == "Click to choose an app!":
-                continue
-
-            try:
-                position = self.parse_position_size(app_widgets[2].get())
-                size = self.parse_position_size(app_widgets[3].get())
-                configs.append(AppConfig(shortcut_path, position, size))
-            except ValueError as e:
-                logger.error(f"Invalid configuration: {e}")
-                continue
-
-        return configs
+        return self.model.configs()
 
     def toggle_widgets(self, state: str) -> None:
         """Enables or disables all widgets."""
-        for app_widgets in self.apps:
-            for widget in app_widgets:
-                widget.configure(state=state)
-        
+        self.app_list.set_state(state)
+
         self.add_button.configure(state=state)
         self.import_button.configure(state=state)
         self.export_button.configure(state=state)
+        self.capture_button.configure(state=state)
+        self.profiles_button.configure(state=state)
+        self.tile_button.configure(state=state)
         self.open_button.configure(state=state)
+        self.reuse_switch.configure(state=state)
 
     def open_apps(self) -> None:
         """Opens and positions all configured applications."""
+        if self.engine.is_running():
+            return
+
         self.toggle_widgets("disabled")
-        
+
         try:
             configs = self.get_app_configs()
             total_windows = len(configs)
-            
+
             # Create progress window
-            progress_window = ctk.CTkToplevel(self.root)
-            progress_window.title("Processing Windows")
-            progress_window.geometry("300x150")
-            progress_window.attributes('-topmost', True)
-            
+            self.progress_window = ctk.CTkToplevel(self.root)
+            self.progress_window.title("Processing Windows")
+            self.progress_window.geometry("300x190")
+            self.progress_window.attributes('-topmost', True)
+            self.progress_window.protocol("WM_DELETE_WINDOW", self.cancel_open)
+
             # Add progress label
-            progress_label = ctk.CTkLabel(
-                progress_window,
+            self.progress_label = ctk.CTkLabel(
+                self.progress_window,
                 text=f"Opening windows...\n0/{total_windows}",
                 font=("", 14)
             )
-            progress_label.pack(pady=20)
-            
+            self.progress_label.pack(pady=20)
+
             # Add progress bar
-            progress_bar = ctk.CTkProgressBar(progress_window)
-            progress_bar.pack(pady=10, padx=20, fill="x")
-            progress_bar.set(0)
-            
-            # Open all apps first
-            for i, config in enumerate(configs, 1):
-                WindowManager.open_app(config.shortcut_path)
-                progress_label.configure(text=f"Opening windows...\n{i}/{total_windows}")
-                progress_bar.set(i / total_windows)
-                progress_window.update()
-            
-            # Wait for apps to open
-            progress_label.configure(text="Waiting for windows to open...")
-            progress_window.update()
-            sleep(2)
-            
-            # Position all windows
-            for i, config in enumerate(configs, 1):
-                WindowManager.move_and_resize_window(
-                    config.shortcut_path,
-                    config.position,
-                    config.size
-                )
-                progress_label.configure(text=f"Positioning windows...\n{i}/{total_windows}")
-                progress_bar.set(i / total_windows)
-                progress_window.update()
-            
-            # Show completion message
-            progress_label.configure(text="All windows processed!")
-            progress_window.update()
-            sleep(1)
-            progress_window.destroy()
-            
+            self.progress_bar = ctk.CTkProgressBar(self.progress_window)
+            self.progress_bar.pack(pady=10, padx=20, fill="x")
+            self.progress_bar.set(0)
+
+            # Add cancel button
+            self.cancel_button = ctk.CTkButton(self.progress_window, text="CANCEL", command=self.cancel_open)
+            self.cancel_button.pack(pady=5)
+
+            # Hand the run to the resident daemon if one is running, otherwise run it here
+            client = DaemonClient.discover()
+            self.engine = RemotePlacementEngine(client) if client else self.local_engine
+
+            # Launch and place on the engine thread; the UI only polls for progress
+            self.engine.start(configs, incremental=bool(self.reuse_switch.get()), layout_path=self.layout_path)
+            self.root.after(PROGRESS_FRAME_MS, self.poll_progress)
+
         except Exception as e:
             logger.error(f"Error during app placement: {e}")
-        finally:
-            self.toggle_widgets("normal")
+            self.close_progress()
+
+    def cancel_open(self) -> None:
+        """Cancels the running placement."""
+        self.engine.cancel()
+        self.cancel_button.configure(state="disabled")
+        self.progress_label.configure(text="Cancelling...")
+
+    def poll_progress(self) -> None:
+        """Applies queued engine updates at most once per frame."""
+        latest = None
+        while True:
+            try:
+                latest = self.engine.updates.get_nowait()
+            except queue.Empty:
+                break
+
+        if latest is not None:
+            text = f"{latest.message}\n{latest.completed}/{latest.total}"
+            if latest.eta and not latest.finished:
+                text += f" (~{latest.eta:.0f}s left)"
+            self.progress_label.configure(text=text)
+            if latest.total:
+                self.progress_bar.set(latest.completed / latest.total)
+            if latest.finished:
+                self.cancel_button.configure(state="disabled")
+                self.root.after(1000, self.close_progress)
+                return
+
+        self.root.after(PROGRESS_FRAME_MS, self.poll_progress)
+
+    def close_progress(self) -> None:
+        """Closes the progress window and re-enables the UI."""
+        if self.progress_window is not None:
+            self.progress_window.destroy()
+            self.progress_window = None
+        self.toggle_widgets("normal")
 
     def import_config(self) -> None:
         """Imports configuration from a JSON file."""
@@ -269,73 +268,71 @@ class AppPlacerGUI:
 
         try:
             configs = ConfigManager.load_configs(file_path)
-            
-            # Clear existing apps
-            for app_widgets in self.apps[:]:
-                app_frame = app_widgets[0].master
-                self.remove_specific_app(app_frame, app_widgets)
-            
-            # Add new apps
-            for config in configs:
-                if self.current_row >= 8:
-                    break
-                    
-                # Create a frame for this app's widgets
-                app_frame = ctk.CTkFrame(self.windows_frame)
-                app_frame.pack(pady=5, padx=5, fill="x")
-
-                # App selection button
-                app_button = ctk.CTkButton(
-                    app_frame,
-                    text=config.shortcut_path,
-                    command=lambda: self.choose_shortcut(app_button),
-                    width=200
-                )
-                app_button.pack(side=ctk.LEFT, padx=5, pady=5)
-
-                # Position selection button
-                pos_button = ctk.CTkButton(
-                    app_frame,
-                    text="Select Position",
-                    command=lambda: self.select_position(pos_entry, size_entry),
-                    width=120
-                )
-                pos_button.pack(side=ctk.LEFT, padx=5, pady=5)
-
-                # Position entry
-                pos_entry = ctk.CTkEntry(
-                    app_frame,
-                    width=140,
-                    placeholder_text="Position (e.g., 500*300)"
-                )
-                pos_entry.pack(side=ctk.LEFT, padx=5, pady=5)
-                pos_entry.insert(0, f"{config.position[0]}*{config.position[1]}")
-
-                # Size entry
-                size_entry = ctk.CTkEntry(
-                    app_frame,
-                    width=90,
-                    placeholder_text="Size"
-                )
-                size_entry.pack(side=ctk.LEFT, padx=5, pady=5)
-                size_entry.insert(0, f"{config.size[0]}*{config.size[1]}")
-
-                # Remove button for this specific app
-                remove_button = ctk.CTkButton(
-                    app_frame,
-                    text="×",
-                    width=30,
-                    command=lambda: self.remove_specific_app(app_frame, app_widgets)
-                )
-                remove_button.pack(side=ctk.LEFT, padx=5, pady=5)
-
-                app_widgets = [app_button, pos_button, pos_entry, size_entry]
-                self.apps.append(app_widgets)
-                self.current_row += 1
-
+            self.layout_path = file_path
+            self.show_configs(configs)
         except Exception as e:
             logger.error(f"Failed to import configuration: {e}")
 
+    def show_configs(self, configs: List[AppConfig]) -> None:
+        """Replaces the app rows with the given configurations."""
+        self.model.replace_all(configs)
+        if not configs:
+            self.model.append(AppEntry())
+        self.app_list.scroll_to(0)
+
+    def capture_desktop(self) -> None:
+        """Fills the app rows from the windows currently on the desktop."""
+        try:
+            client = DaemonClient.discover()
+            if client is not None:
+                response = client.request("capture", exclude_pids=[os.getpid()])
+                if not response.get("ok"):
+                    raise RuntimeError(response.get("error"))
+                configs = [AppConfig.from_dict(item) for item in response["configs"]]
+            else:
+                snapshot = WindowSnapshot()
+                snapshot.refresh()
+                configs = capture_desktop(snapshot)
+            self.show_configs(configs)
+            self.layout_path = None
+        except Exception as e:
+            logger.error(f"Failed to capture desktop: {e}")
+
+    def auto_tile(self) -> None:
+        """Arranges every app with a shortcut side by side, without overlaps."""
+        indexes = [index for index, entry in enumerate(self.model.entries) if entry.shortcut_path]
+        if not indexes:
+            return
+        configs = []
+        for index in indexes:
+            entry = self.model[index]
+            # The solver ignores the current geometry, so rows without a stored config get a placeholder
+            config = entry.config or AppConfig(entry.shortcut_path, (0, 0), (1, 1))
+            configs.append(replace(config, shortcut_path=entry.shortcut_path))
+        try:
+            tiled = solve_tiling(configs, current_topology())
+        except Exception as e:
+            logger.error(f"Failed to tile apps: {e}")
+            return
+        for index, config in zip(indexes, tiled):
+            self.model.update(index, notify=False, position=format_position_size(config.position),
+                              size=format_position_size(config.size), config=config)
+        self.app_list.refresh()
+
+    def open_profiles(self) -> None:
+        """Opens the profile library."""
+        try:
+            if self.profile_store is None:
+                self.profile_store = ProfileStore()
+            ProfileBrowser(self.root, self.profile_store, self.load_profile, self.get_app_configs)
+        except Exception as e:
+            logger.error(f"Failed to open profile library: {e}")
+
+    def load_profile(self, name: str, configs: List[AppConfig]) -> None:
+        """Shows a profile loaded from the library."""
+        self.show_configs(configs)
+        self.layout_path = None
+
     def export_config(self) -> None:
         """Exports current configuration to a JSON file."""
         file_path = ctk.filedialog.asksaveasfilename(
@@ -349,6 +346,7 @@ class AppPlacerGUI:
         try:
             configs = self.get_app_configs()
             ConfigManager.save_configs(configs, file_path)
+            self.layout_path = file_path
         except Exception as e:
             logger.error(f"Failed to export configuration: {e}")
 
@@ -0,0 +1,137 @@
+import customtkinter as ctk
+import tkinter as tk
+from datetime import datetime
+from typing import Callable, List, Optional
+import logging
+from ..utils.config_manager import AppConfig
+from ..utils.monitors import current_topology
+from ..utils.profile_store import DEFAULT_VARIANT, ProfileStore, ProfileSummary
+
+logger = logging.getLogger(__name__)
+
+# Searches run this long after the last keystroke
+SEARCH_DELAY_MS = 150
+# Most profiles listed per search
+MAX_RESULTS = 500
+
+class ProfileBrowser(ctk.CTkToplevel):
+    """A window for searching, loading and saving layout profiles."""
+
+    def __init__(self, parent, store: ProfileStore, on_load: Callable[[str, List[AppConfig]], None],
+                 get_configs: Callable[[], List[AppConfig]]):
+        super().__init__(parent)
+        self.title("Profiles")
+        self.geometry("520x480")
+        self.store = store
+        self.on_load = on_load
+        self.get_configs = get_configs
+        self.results: List[ProfileSummary] = []
+        self._search_job = None
+
+        # Search by name and tags
+        search_frame = ctk.CTkFrame(self)
+        search_frame.pack(pady=10, padx=10, fill="x")
+        self.query_entry = ctk.CTkEntry(search_frame, placeholder_text="Search profiles")
+        self.query_entry.pack(side=ctk.LEFT, padx=5, pady=5, fill="x", expand=True)
+        self.query_entry.bind("<KeyRelease>", lambda _: self.schedule_search())
+        self.tags_entry = ctk.CTkEntry(search_frame, width=150, placeholder_text="Tags (comma separated)")
+        self.tags_entry.pack(side=ctk.LEFT, padx=5, pady=5)
+        self.tags_entry.bind("<KeyRelease>", lambda _: self.schedule_search())
+
+        # Results; a native listbox stays fast with thousands of lines
+        self.listbox = tk.Listbox(self, activestyle="none", font=("", 11))
+        self.listbox.pack(padx=10, fill="both", expand=True)
+        self.listbox.bind("<Double-Button-1>", lambda _: self.load_selected())
+        self.status_label = ctk.CTkLabel(self, text="")
+        self.status_label.pack(padx=10, anchor="w")
+
+        buttons_frame = ctk.CTkFrame(self)
+        buttons_frame.pack(pady=5, padx=10, fill="x")
+        load_button = ctk.CTkButton(buttons_frame, text="LOAD", width=80, command=self.load_selected)
+        load_button.pack(side=ctk.LEFT, padx=5, pady=5)
+        delete_button = ctk.CTkButton(buttons_frame, text="DELETE", width=80, command=self.delete_selected)
+        delete_button.pack(side=ctk.LEFT, padx=5, pady=5)
+
+        # Save the current app list as a profile
+        save_frame = ctk.CTkFrame(self)
+        save_frame.pack(pady=(0, 10), padx=10, fill="x")
+        self.name_entry = ctk.CTkEntry(save_frame, placeholder_text="Profile name")
+        self.name_entry.pack(side=ctk.LEFT, padx=5, pady=5, fill="x", expand=True)
+        self.save_tags_entry = ctk.CTkEntry(save_frame, width=150, placeholder_text="Tags")
+        self.save_tags_entry.pack(side=ctk.LEFT, padx=5, pady=5)
+        self.variant_switch = ctk.CTkCheckBox(save_frame, text="These monitors only", width=40)
+        self.variant_switch.pack(side=ctk.LEFT, padx=5, pady=5)
+        save_button = ctk.CTkButton(save_frame, text="SAVE", width=80, command=self.save_current)
+        save_button.pack(side=ctk.LEFT, padx=5, pady=5)
+
+        self.search()
+
+    @staticmethod
+    def parse_tags(value: str) -> List[str]:
+        """Splits a comma-separated tag list."""
+        return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+    def schedule_search(self) -> None:
+        """Runs a search once typing pauses."""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DELAY_MS, self.search)
+
+    def search(self) -> None:
+        """Lists the profiles matching the search fields."""
+        self._search_job = None
+        try:
+            self.results = self.store.search(self.query_entry.get(), self.parse_tags(self.tags_entry.get()),
+                                             limit=MAX_RESULTS)
+        except Exception as e:
+            logger.error(f"Failed to search profiles: {e}")
+            self.results = []
+
+        self.listbox.delete(0, "end")
+        for summary in self.results:
+            variant = f" [{summary.variant}]" if summary.variant else ""
+            tags = f"  #{' #'.join(summary.tags)}" if summary.tags else ""
+            modified = datetime.fromtimestamp(summary.modified).strftime("%Y-%m-%d")
+            self.listbox.insert("end", f"{summary.name}{variant}  ({summary.app_count} apps, {modified}){tags}")
+        more = " or more" if len(self.results) == MAX_RESULTS else ""
+        self.status_label.configure(text=f"{len(self.results)}{more} profiles")
+
+    def selected(self) -> Optional[ProfileSummary]:
+        """Returns the selected profile, or None."""
+        selection = self.listbox.curselection()
+        return self.results[selection[0]] if selection else None
+
+    def load_selected(self) -> None:
+        """Loads the selected profile into the app list."""
+        summary = self.selected()
+        if summary is None:
+            return
+        try:
+            configs = self.store.load(summary.name, summary.variant)
+            self.on_load(summary.name, configs)
+        except Exception as e:
+            logger.error(f"Failed to load profile {summary.name}: {e}")
+
+    def delete_selected(self) -> None:
+        """Deletes the selected profile variant."""
+        summary = self.selected()
+        if summary is None:
+            return
+        try:
+            self.store.delete(summary.name, summary.variant)
+        except Exception as e:
+            logger.error(f"Failed to delete profile {summary.name}: {e}")
+        self.search()
+
+    def save_current(self) -> None:
+        """Saves the current app list under the entered name."""
+        name = self.name_entry.get().strip()
+        if not name:
+            return
+        try:
+            # Monitor-set variants are keyed by the topology fingerprint
+            variant = current_topology().fingerprint if self.variant_switch.get() else DEFAULT_VARIANT
+            self.store.save(name, self.get_configs(), self.parse_tags(self.save_tags_entry.get()), variant)
+        except Exception as e:
+            logger.error(f"Failed to save profile {name}: {e}")
+        self.search()
\ No newline at end of file
@@ -0,0 +1,313 @@
+import ctypes
+import logging
+import os
+import subprocess
+from abc import ABC, abstractmethod
+from ctypes import wintypes
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .monitors import Monitor, enumerate_monitors
+from .window_events import WindowEventSource, WinEventHookSource
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[int, int, int, int]
+
+# pywinauto and pywin32 are imported on first use to keep headless startup fast
+SWP_NOZORDER = 0x0004
+SWP_NOACTIVATE = 0x0010
+SWP_ASYNCWINDOWPOS = 0x4000
+SW_SHOWNORMAL = 1
+SW_RESTORE = 9
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+@dataclass
+class WindowPlacement:
+    """Target position and size for one window in a layout."""
+    hwnd: int
+    position: Tuple[int, int]
+    size: Tuple[int, int]
+
+@dataclass
+class PlacementOutcome:
+    """Result of placing one window from a batch."""
+    hwnd: int
+    success: bool
+    batched: bool
+    error: Optional[str] = None
+
+class PlatformBackend(ABC):
+    """The desktop operations the placement code needs from the operating system.
+
+    Win32Backend drives the real Windows desktop; SimulatedDesktop is an
+    in-memory desktop for benchmarks and tests on any platform. Everything
+    else reaches the OS through current_backend().
+    """
+
+    @abstractmethod
+    def list_windows(self) -> List[int]:
+        """Returns the handles of all top-level windows, in z-order."""
+
+    @abstractmethod
+    def is_window(self, hwnd: int) -> bool:
+        """Returns True if the handle is a live window."""
+
+    @abstractmethod
+    def window_state(self, hwnd: int) -> Tuple[str, Rect, bool]:
+        """Returns a window's title, rect and visibility."""
+
+    @abstractmethod
+    def window_owner(self, hwnd: int) -> Tuple[int, str]:
+        """Returns a window's process id and class name, which never change."""
+
+    @abstractmethod
+    def process_image_path(self, pid: int) -> str:
+        """Returns the full executable path of a process, or '' if it is not accessible."""
+
+    @abstractmethod
+    def process_parents(self) -> Dict[int, int]:
+        """Returns a mapping of every running process id to its parent process id."""
+
+    @abstractmethod
+    def create_process(self, executable: str, arguments: str = "", working_dir: Optional[str] = None,
+                       show_command: Optional[int] = None) -> int:
+        """Starts an executable and returns its process id."""
+
+    @abstractmethod
+    def shell_execute(self, path: str) -> Optional[int]:
+        """Opens a document or shortcut through the shell; returns a process id if there is one."""
+
+    @abstractmethod
+    def find_app_window(self, executable: str) -> Optional[int]:
+        """Returns the top window of a running executable by searching the whole desktop."""
+
+    @abstractmethod
+    def move_window(self, hwnd: int, position: Tuple[int, int], size: Tuple[int, int]) -> None:
+        """Moves and resizes one window."""
+
+    def place_windows(self, placements: List[WindowPlacement]) -> List[PlacementOutcome]:
+        """Places several windows; every window gets its own outcome."""
+        outcomes = []
+        for placement in placements:
+            try:
+                if not self.is_window(placement.hwnd):
+                    outcomes.append(PlacementOutcome(placement.hwnd, False, False, "Window no longer exists"))
+                    continue
+                self.move_window(placement.hwnd, placement.position, placement.size)
+                outcomes.append(PlacementOutcome(placement.hwnd, True, False))
+            except Exception as e:
+                logger.error(f"Failed to move/resize window {placement.hwnd}: {e}")
+                outcomes.append(PlacementOutcome(placement.hwnd, False, False, str(e)))
+        return outcomes
+
+    @abstractmethod
+    def monitors(self) -> List[Monitor]:
+        """Lists the connected monitors."""
+
+    def create_event_source(self) -> Optional[WindowEventSource]:
+        """Returns a new window event source, or None if the platform has none."""
+        return None
+
+class _ProcessEntry32(ctypes.Structure):
+    _fields_ = [
+        ('dwSize', wintypes.DWORD),
+        ('cntUsage', wintypes.DWORD),
+        ('th32ProcessID', wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', wintypes.DWORD),
+        ('cntThreads', wintypes.DWORD),
+        ('th32ParentProcessID', wintypes.DWORD),
+        ('pcPriClassBase', wintypes.LONG),
+        ('dwFlags', wintypes.DWORD),
+        ('szExeFile', wintypes.WCHAR * 260),
+    ]
+
+class Win32Backend(PlatformBackend):
+    """The real Windows desktop, through pywin32, pywinauto and ctypes."""
+
+    def list_windows(self) -> List[int]:
+        import win32gui
+
+        handles: List[int] = []
+        win32gui.EnumWindows(lambda hwnd, _: handles.append(hwnd) or True, None)
+        return handles
+
+    def is_window(self, hwnd: int) -> bool:
+        import win32gui
+        return bool(win32gui.IsWindow(hwnd))
+
+    def window_state(self, hwnd: int) -> Tuple[str, Rect, bool]:
+        import win32gui
+        return (win32gui.GetWindowText(hwnd), win32gui.GetWindowRect(hwnd),
+                bool(win32gui.IsWindowVisible(hwnd)))
+
+    def window_owner(self, hwnd: int) -> Tuple[int, str]:
+        import win32gui
+        import win32process
+
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        return pid, win32gui.GetClassName(hwnd)
+
+    def process_image_path(self, pid: int) -> str:
+        kernel32 = ctypes.windll.kernel32
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return ''
+        try:
+            size = wintypes.DWORD(1024)
+            buffer = ctypes.create_unicode_buffer(size.value)
+            if kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+                return buffer.value
+            return ''
+        finally:
+            kernel32.CloseHandle(handle)
+
+    def process_parents(self) -> Dict[int, int]:
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if snapshot == INVALID_HANDLE_VALUE:
+            raise ctypes.WinError()
+
+        parents: Dict[int, int] = {}
+        try:
+            entry = _ProcessEntry32()
+            entry.dwSize = ctypes.sizeof(_ProcessEntry32)
+            more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while more:
+                parents[entry.th32ProcessID] = entry.th32ParentProcessID
+                more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(snapshot)
+        return parents
+
+    def create_process(self, executable: str, arguments: str = "", working_dir: Optional[str] = None,
+                       show_command: Optional[int] = None) -> int:
+        startupinfo = None
+        if show_command is not None and hasattr(subprocess, 'STARTUPINFO'):
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = show_command
+        # Shortcut arguments are already a Windows command line; pass them through verbatim
+        command = f"{subprocess.list2cmdline([executable])} {arguments}" if arguments else [executable]
+        cwd = working_dir if working_dir and os.path.isdir(working_dir) else None
+        return subprocess.Popen(command, cwd=cwd, startupinfo=startupinfo).pid
+
+    def shell_execute(self, path: str) -> Optional[int]:
+        from win32com.shell import shell, shellcon
+        import win32process
+
+        info = shell.ShellExecuteEx(fMask=shellcon.SEE_MASK_NOCLOSEPROCESS, lpFile=path, nShow=SW_SHOWNORMAL)
+        process = info.get('hProcess')
+        if not process:
+            return None
+        try:
+            return win32process.GetProcessId(process)
+        finally:
+            process.Close()
+
+    def find_app_window(self, executable: str) -> Optional[int]:
+        from pywinauto import Application
+
+        try:
+            app = Application(backend='win32').connect(path=executable)
+            return app.top_window().handle
+        except Exception:
+            # The process or its window does not exist (yet)
+            return None
+
+    def move_window(self, hwnd: int, position: Tuple[int, int], size: Tuple[int, int]) -> None:
+        from pywinauto.controls.hwndwrapper import HwndWrapper
+        HwndWrapper(hwnd).move_window(x=position[0], y=position[1], width=size[0], height=size[1])
+
+    def place_windows(self, placements: List[WindowPlacement]) -> List[PlacementOutcome]:
+        """Places a whole layout as one deferred window-position transaction.
+
+        Windows that cannot join the transaction (minimized, maximized, hung,
+        or rejected by DeferWindowPos) are moved one at a time instead. Every
+        window gets its own outcome; a failure never aborts the others.
+        """
+        import win32gui
+
+        user32 = ctypes.windll.user32
+        user32.BeginDeferWindowPos.restype = wintypes.HANDLE
+        user32.DeferWindowPos.restype = wintypes.HANDLE
+        user32.DeferWindowPos.argtypes = [
+            wintypes.HANDLE, wintypes.HWND, wintypes.HWND,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT
+        ]
+        user32.EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+
+        outcomes: List[PlacementOutcome] = []
+        batch: List[WindowPlacement] = []
+        fallback: List[WindowPlacement] = []
+        for placement in placements:
+            hwnd = placement.hwnd
+            if not win32gui.IsWindow(hwnd):
+                outcomes.append(PlacementOutcome(hwnd, False, False, "Window no longer exists"))
+            elif win32gui.IsIconic(hwnd) or win32gui.IsZoomed(hwnd) or user32.IsHungAppWindow(hwnd):
+                fallback.append(placement)
+            else:
+                batch.append(placement)
+
+        if batch:
+            flags = SWP_NOZORDER | SWP_NOACTIVATE
+            hdwp = user32.BeginDeferWindowPos(len(batch))
+            for placement in batch:
+                if not hdwp:
+                    break
+                hdwp = user32.DeferWindowPos(
+                    hdwp, placement.hwnd, None,
+                    placement.position[0], placement.position[1],
+                    placement.size[0], placement.size[1], flags
+                )
+            # A failed DeferWindowPos frees the whole transaction
+            if hdwp and user32.EndDeferWindowPos(hdwp):
+                outcomes.extend(PlacementOutcome(placement.hwnd, True, True) for placement in batch)
+            else:
+                logger.warning(f"Deferred placement of {len(batch)} windows failed; moving them one by one")
+                fallback.extend(batch)
+
+        for placement in fallback:
+            try:
+                if user32.IsHungAppWindow(placement.hwnd):
+                    # Do not block on a window that is not pumping messages
+                    win32gui.SetWindowPos(
+                        placement.hwnd, 0, placement.position[0], placement.position[1],
+                        placement.size[0], placement.size[1],
+                        SWP_NOZORDER | SWP_NOACTIVATE | SWP_ASYNCWINDOWPOS
+                    )
+                else:
+                    if win32gui.IsIconic(placement.hwnd) or win32gui.IsZoomed(placement.hwnd):
+                        win32gui.ShowWindow(placement.hwnd, SW_RESTORE)
+                    self.move_window(placement.hwnd, placement.position, placement.size)
+                outcomes.append(PlacementOutcome(placement.hwnd, True, False))
+            except Exception as e:
+                logger.error(f"Failed to move/resize window {placement.hwnd}: {e}")
+                outcomes.append(PlacementOutcome(placement.hwnd, False, False, str(e)))
+
+        return outcomes
+
+    def monitors(self) -> List[Monitor]:
+        return enumerate_monitors()
+
+    def create_event_source(self) -> Optional[WindowEventSource]:
+        return WinEventHookSource()
+
+_current_backend: Optional[PlatformBackend] = None
+
+def current_backend() -> PlatformBackend:
+    """Returns the process-wide platform backend (Win32Backend unless another was set)."""
+    global _current_backend
+    if _current_backend is None:
+        _current_backend = Win32Backend()
+    return _current_backend
+
+def set_backend(backend: Optional[PlatformBackend]) -> None:
+    """Replaces the process-wide platform backend; None restores the default."""
+    global _current_backend
+    _current_backend = backend
\ No newline at end of file
@@ -1,32 +1,192 @@
 import json
+import re
 from dataclasses import dataclass, asdict
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _optional(data: dict, key: str, kind: type, default: Any = None) -> Any:
+    """Returns an optional field, raising ValueError if it has the wrong type."""
+    value = data.get(key, default)
+    if value is not None and (not isinstance(value, kind) or isinstance(value, bool) and kind is not bool):
+        raise ValueError(f"Invalid {key}: {value!r}")
+    return value
+
+def _int_pair(data: dict, key: str, kinds: tuple = (int,)) -> Tuple[int, int]:
+    """Returns a required [x, y] field as a tuple of integers (or of the given kinds)."""
+    value = data.get(key)
+    if (not isinstance(value, (list, tuple)) or len(value) != 2 or
+            not all(isinstance(item, kinds) and not isinstance(item, bool) for item in value)):
+        expected = "integers" if kinds == (int,) else "numbers"
+        raise ValueError(f"Invalid {key}: {value!r} (expected two {expected})")
+    return tuple(value)
+
+@dataclass
+class TileConstraints:
+    """Constraints for automatic tiling of an app's window."""
+    min_size: Optional[Tuple[int, int]] = None
+    max_size: Optional[Tuple[int, int]] = None
+    monitor: Optional[str] = None
+    aspect: Optional[float] = None
+    area: float = 1.0
+
+    def to_dict(self) -> dict:
+        """Convert the constraints to a dictionary, omitting unset fields."""
+        data = {key: value for key, value in asdict(self).items() if value is not None}
+        for key in ('min_size', 'max_size'):
+            if key in data:
+                data[key] = list(data[key])
+        if self.area == 1.0:
+            del data['area']
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TileConstraints':
+        """Create constraints from a dictionary; raises ValueError if they are malformed."""
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid tile constraints: {data!r}")
+        aspect = _optional(data, 'aspect', (int, float))
+        area = _optional(data, 'area', (int, float), 1.0)
+        if aspect is not None and aspect <= 0:
+            raise ValueError(f"Invalid aspect: {aspect!r}")
+        if area <= 0:
+            raise ValueError(f"Invalid area: {area!r}")
+        monitor = _optional(data, 'monitor', (str, int))
+        return cls(
+            min_size=_int_pair(data, 'min_size') if 'min_size' in data else None,
+            max_size=_int_pair(data, 'max_size') if 'max_size' in data else None,
+            monitor=str(monitor) if monitor is not None else None,
+            aspect=float(aspect) if aspect is not None else None,
+            area=float(area)
+        )
+
+# Coordinate units of a config's position and size:
+# absolute desktop pixels, DPI-independent pixels relative to a monitor's
+# work area, or percentages of a monitor's work area
+UNITS_PIXELS = 'px'
+UNITS_MONITOR = 'monitor'
+UNITS_PERCENT = 'percent'
+UNITS = (UNITS_PIXELS, UNITS_MONITOR, UNITS_PERCENT)
+
+@dataclass
+class MatchRule:
+    """Selects which window of an app a config applies to.
+
+    instance is a zero-based index among all visible windows satisfying the
+    other fields, in the order the window snapshot first saw them, so windows
+    that were open before a launch come before the windows it creates. Reused
+    and launched windows are counted the same way.
+    """
+    title: Optional[str] = None
+    class_name: Optional[str] = None
+    exe: Optional[str] = None
+    instance: Optional[int] = None
+    launched_child: bool = False
+
+    def to_dict(self) -> dict:
+        """Convert the rule to a dictionary, omitting unset fields."""
+        return {key: value for key, value in asdict(self).items() if value is not None and value is not False}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MatchRule':
+        """Create a rule from a dictionary; raises ValueError if it is malformed."""
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid match rule: {data!r}")
+        title = _optional(data, 'title', str)
+        if title is not None:
+            try:
+                re.compile(title)
+            except re.error as e:
+                raise ValueError(f"Invalid title pattern {title!r}: {e}")
+        instance = _optional(data, 'instance', int)
+        if instance is not None and instance < 0:
+            raise ValueError(f"Invalid instance: {instance!r}")
+        return cls(
+            title=title,
+            class_name=_optional(data, 'class_name', str),
+            exe=_optional(data, 'exe', str),
+            instance=instance,
+            launched_child=_optional(data, 'launched_child', bool, False)
+        )
+
 @dataclass
 class AppConfig:
-    """Configuration for an application window."""
+    """Configuration for an application window.
+
+    match picks one of several windows of the app; see MatchRule for how its
+    instance index counts them.
+    """
     shortcut_path: str
     position: Tuple[int, int]
     size: Tuple[int, int]
+    priority: int = 0
+    weight: float = 1.0
+    match: Optional[MatchRule] = None
+    monitor: Optional[str] = None
+    units: str = UNITS_PIXELS
+    tile: Optional[TileConstraints] = None
+    retries: Optional[int] = None
 
     def to_dict(self) -> dict:
         """Convert the config to a dictionary."""
-        return {
+        data = {
             'shortcut_path': self.shortcut_path,
             'position': list(self.position),
             'size': list(self.size)
         }
+        # Scheduling hints are only written when set, keeping plain layouts unchanged
+        if self.priority != 0:
+            data['priority'] = self.priority
+        if self.weight != 1.0:
+            data['weight'] = self.weight
+        if self.match is not None:
+            data['match'] = self.match.to_dict()
+        if self.monitor is not None:
+            data['monitor'] = self.monitor
+        if self.units != UNITS_PIXELS:
+            data['units'] = self.units
+        if self.tile is not None:
+            data['tile'] = self.tile.to_dict()
+        if self.retries is not None:
+            data['retries'] = self.retries
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> 'AppConfig':
-        """Create a config from a dictionary."""
+        """Create a config from a dictionary; raises ValueError if it is malformed."""
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid app config: {data!r}")
+        shortcut_path = data.get('shortcut_path')
+        if not isinstance(shortcut_path, str) or not shortcut_path:
+            raise ValueError(f"Invalid shortcut_path: {shortcut_path!r}")
+        units = _optional(data, 'units', str, UNITS_PIXELS)
+        if units not in UNITS:
+            raise ValueError(f"Invalid units: {units!r} (expected one of {', '.join(UNITS)})")
+        # Relative coordinates may be fractional
+        kinds = (int,) if units == UNITS_PIXELS else (int, float)
+        size = _int_pair(data, 'size', kinds)
+        if size[0] <= 0 or size[1] <= 0:
+            raise ValueError(f"Invalid size: {list(size)} (must be positive)")
+        weight = data.get('weight', 1.0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight <= 0:
+            raise ValueError(f"Invalid weight: {weight!r}")
+        retries = _optional(data, 'retries', int)
+        if retries is not None and retries < 0:
+            raise ValueError(f"Invalid retries: {retries} (must not be negative)")
+        # Monitors are selected by index, device name or "primary"
+        monitor = _optional(data, 'monitor', (str, int))
         return cls(
-            shortcut_path=data['shortcut_path'],
-            position=tuple(data['position']),
-            size=tuple(data['size'])
+            shortcut_path=shortcut_path,
+            position=_int_pair(data, 'position', kinds),
+            size=size,
+            priority=_optional(data, 'priority', int, 0),
+            weight=float(weight),
+            match=MatchRule.from_dict(data['match']) if data.get('match') else None,
+            monitor=str(monitor) if monitor is not None else None,
+            units=units,
+            tile=TileConstraints.from_dict(data['tile']) if data.get('tile') else None,
+            retries=retries
         )
 
 class ConfigManager:
@@ -50,7 +210,15 @@ class ConfigManager:
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
-            return [AppConfig.from_dict(item) for item in data]
+            if not isinstance(data, list):
+                raise ValueError("A layout must be a list of app configs")
+            configs = []
+            for index, item in enumerate(data):
+                try:
+                    configs.append(AppConfig.from_dict(item))
+                except ValueError as e:
+                    raise ValueError(f"Entry {index + 1}: {e}")
+            return configs
         except Exception as e:
             logger.error(f"Failed to load configurations: {e}")
             raise 
\ No newline at end of file
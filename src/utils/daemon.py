@@ -0,0 +1,328 @@
+import getpass
+import json
+import logging
+import os
+import queue
+import secrets
+import sys
+import threading
+from contextlib import contextmanager
+from multiprocessing.connection import Client, Listener
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .config_manager import AppConfig, ConfigManager
+from .desktop_capture import CaptureFilter, capture_desktop, shortcut_index
+from .launch_pipeline import PlacementResult
+from .launch_scheduler import LaunchScheduler, default_load_probe
+from .layout_diff import capture_positions
+from .paths import app_data_dir, runtime_dir
+from .placement_engine import PlacementEngine, ProgressUpdate, summarize_results
+from .tracing import PlacementTrace
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE_NAME = "daemon.json"
+
+def default_address() -> Tuple[str, str]:
+    """Returns the per-user (address, family) the daemon listens on."""
+    if sys.platform == "win32":
+        return rf"\\.\pipe\auto-placer-{getpass.getuser()}", "AF_PIPE"
+    return os.path.join(runtime_dir(), "daemon.sock"), "AF_UNIX"
+
+def default_state_path() -> str:
+    """Returns the file through which clients discover a running daemon."""
+    return os.path.join(app_data_dir(), STATE_FILE_NAME)
+
+class LayoutCache:
+    """Parsed layout files, re-read only when their modification time changes."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, List[AppConfig]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, filepath: str) -> List[AppConfig]:
+        """Returns the configs of a layout file, parsing it only if it changed."""
+        filepath = os.path.abspath(filepath)
+        mtime = os.stat(filepath).st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(filepath)
+            if entry is not None and entry[0] == mtime:
+                return list(entry[1])
+        configs = ConfigManager.load_configs(filepath)
+        with self._lock:
+            self._entries[filepath] = (mtime, configs)
+        return list(configs)
+
+class PlacementDaemon:
+    """A resident placement service that keeps its caches warm between runs.
+
+    The engine's window snapshot, the parsed layouts, the resolved shortcuts
+    and the window event hook survive across requests, so an apply only pays
+    for an incremental refresh. Requests are dictionaries sent over an
+    authenticated local connection (a Unix socket, or a named pipe on Windows).
+    """
+
+    def __init__(self, engine: Optional[PlacementEngine] = None, address: Optional[str] = None,
+                 family: Optional[str] = None, state_path: Optional[str] = None):
+        if address is None:
+            address, family = default_address()
+        self.engine = engine or PlacementEngine()
+        self.address = address
+        self.family = family
+        self.state_path = state_path or default_state_path()
+        self.layouts = LayoutCache()
+        self._authkey = secrets.token_bytes(32)
+        self._listener: Optional[Listener] = None
+        self._run_lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def serve_forever(self) -> None:
+        """Accepts and serves client connections until shutdown is requested."""
+        if self.family == "AF_UNIX" and os.path.exists(self.address):
+            os.unlink(self.address)
+        self._listener = Listener(self.address, self.family, authkey=self._authkey)
+        if self.family == "AF_UNIX":
+            os.chmod(self.address, 0o600)
+
+        # Without window events (or if they fail to start) the daemon polls for windows
+        source = self.engine.pipeline.event_source
+        if source is not None and not self.engine.pipeline.start_events():
+            source = None
+        self.engine.pipeline.tracker.snapshot.refresh()
+        # Clients find the daemon only once it is ready; an earlier run would start and stop its events itself
+        self._write_state()
+        logger.info(f"Placement daemon listening on {self.address}")
+
+        try:
+            while not self._stopping.is_set():
+                try:
+                    conn = self._listener.accept()
+                except Exception as e:
+                    if not self._stopping.is_set():
+                        logger.error(f"Rejected daemon connection: {e}")
+                    continue
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            if source is not None:
+                source.stop()
+            self._listener.close()
+            self._remove_state()
+            logger.info("Placement daemon stopped")
+
+    def shutdown(self) -> None:
+        """Stops serve_forever after the current accept returns."""
+        if self._stopping.is_set():
+            return
+        self._stopping.set()
+        # Wake the blocking accept with a throwaway connection
+        try:
+            Client(self.address, self.family, authkey=self._authkey).close()
+        except Exception:
+            pass
+
+    def handle(self, request: dict) -> dict:
+        """Executes one request and returns its response."""
+        command = request.get("command")
+        try:
+            if command == "ping":
+                return {"ok": True, "pid": os.getpid()}
+            if command == "apply":
+                return self._apply(request)
+            if command == "capture":
+                return self._capture(request)
+            if command == "cancel":
+                self.engine.cancel()
+                return {"ok": True}
+            if command == "shutdown":
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return {"ok": True}
+            return {"ok": False, "error": f"Unknown command: {command}"}
+        except Exception as e:
+            logger.error(f"Daemon command {command} failed: {e}")
+            return {"ok": False, "error": str(e)}
+
+    def _configs_from(self, request: dict) -> List[AppConfig]:
+        if "layout" in request:
+            return self.layouts.load(request["layout"])
+        return [AppConfig.from_dict(item) for item in request.get("configs", [])]
+
+    def _apply(self, request: dict) -> dict:
+        configs = self._configs_from(request)
+        layout_path = request.get("layout") or request.get("layout_path")
+        trace = PlacementTrace() if request.get("trace") else None
+        with self._run_lock, self._run_options(request.get("options") or {}):
+            try:
+                results = self.engine.run(configs, incremental=request.get("incremental", True),
+                                          layout_path=layout_path, trace=trace)
+            finally:
+                self._drain_updates()
+        response = {"ok": True, "results": [result.to_dict() for result in results]}
+        if trace is not None:
+            response["trace"] = trace.to_dict()
+        return response
+
+    @contextmanager
+    def _run_options(self, options: dict) -> Iterator[None]:
+        """Applies a request's run options (as given to 'apply' on the command line) for one run.
+
+        Options the request leaves out keep the daemon's settings, which are
+        restored afterwards. Called with the run lock held.
+        """
+        pipeline = self.engine.pipeline
+        saved = (pipeline.max_workers, pipeline.window_timeout, pipeline.scheduler,
+                 pipeline.stabilizer.watch_period if pipeline.stabilizer is not None else None)
+        try:
+            if "workers" in options:
+                pipeline.max_workers = options["workers"]
+            if "timeout" in options:
+                pipeline.window_timeout = options["timeout"]
+            if "max_starting" in options or "adaptive" in options:
+                capacity = options.get("max_starting", pipeline.scheduler.capacity if pipeline.scheduler else 4.0)
+                pipeline.scheduler = LaunchScheduler(capacity,
+                                                     probe=default_load_probe() if options.get("adaptive") else None)
+            if "watch" in options and pipeline.stabilizer is not None:
+                # A zero watch period places windows without watching them
+                pipeline.stabilizer.watch_period = options["watch"]
+            yield
+        finally:
+            pipeline.max_workers, pipeline.window_timeout, pipeline.scheduler, watch_period = saved
+            if pipeline.stabilizer is not None and watch_period is not None:
+                pipeline.stabilizer.watch_period = watch_period
+
+    def _drain_updates(self) -> None:
+        """Discards the engine's progress updates; clients only get the final results."""
+        while True:
+            try:
+                self.engine.updates.get_nowait()
+            except queue.Empty:
+                return
+
+    def _capture(self, request: dict) -> dict:
+        # Without a layout the whole desktop is captured into a new one
+        whole_desktop = "layout" not in request and "configs" not in request
+        configs = [] if whole_desktop else self._configs_from(request)
+        capture_filter = CaptureFilter.from_dict(request.get("filter") or {})
+        shortcuts = shortcut_index() if whole_desktop and request.get("shortcuts") else None
+        with self._run_lock:
+            snapshot = self.engine.pipeline.tracker.snapshot
+            snapshot.refresh()
+            if whole_desktop:
+                exclude_pids = {os.getpid(), *request.get("exclude_pids", ())}
+                captured = capture_desktop(snapshot, capture_filter, shortcuts, exclude_pids)
+            else:
+                captured = capture_positions(configs, snapshot)
+        if request.get("output"):
+            ConfigManager.save_configs(captured, request["output"])
+        return {"ok": True, "configs": [config.to_dict() for config in captured]}
+
+    def _serve_connection(self, conn) -> None:
+        with conn:
+            try:
+                while True:
+                    request = conn.recv()
+                    conn.send(self.handle(request))
+            except EOFError:
+                pass
+            except Exception as e:
+                logger.error(f"Daemon connection failed: {e}")
+
+    def _write_state(self) -> None:
+        state = {"address": self.address, "family": self.family,
+                 "authkey": self._authkey.hex(), "pid": os.getpid()}
+        fd = os.open(self.state_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f)
+
+    def _remove_state(self) -> None:
+        try:
+            os.remove(self.state_path)
+        except OSError:
+            pass
+
+class DaemonClient:
+    """Sends requests to a running PlacementDaemon."""
+
+    def __init__(self, address: str, family: str, authkey: bytes):
+        self.address = address
+        self.family = family
+        self.authkey = authkey
+
+    @classmethod
+    def discover(cls, state_path: Optional[str] = None) -> Optional['DaemonClient']:
+        """Returns a client for the running daemon, or None if none answers."""
+        try:
+            with open(state_path or default_state_path(), "r") as f:
+                state = json.load(f)
+            client = cls(state["address"], state["family"], bytes.fromhex(state["authkey"]))
+            return client if client.request("ping").get("ok") else None
+        except Exception:
+            return None
+
+    def request(self, command: str, **params) -> dict:
+        """Sends one command and waits for its response."""
+        with Client(self.address, self.family, authkey=self.authkey) as conn:
+            conn.send(dict(params, command=command))
+            return conn.recv()
+
+class RemotePlacementEngine:
+    """Runs placements through the daemon behind the PlacementEngine interface."""
+
+    def __init__(self, client: DaemonClient):
+        self.client = client
+        self.updates: "queue.Queue[ProgressUpdate]" = queue.Queue()
+        self.results: List[PlacementResult] = []
+        self._cancelled = False
+        self._thread: Optional[threading.Thread] = None
+
+    def run(self, configs: List[AppConfig], incremental: bool = False,
+            layout_path: Optional[str] = None, trace: Optional[PlacementTrace] = None) -> List[PlacementResult]:
+        """Runs a placement through the daemon and waits for it; the daemon's trace is merged into trace."""
+        self._cancelled = False
+        total = len(configs)
+        self.results = []
+        self.updates.put(ProgressUpdate(0, total, "Applying layout..."))
+        try:
+            response = self.client.request("apply", configs=[config.to_dict() for config in configs],
+                                           incremental=incremental, layout_path=layout_path,
+                                           trace=trace is not None)
+            if not response.get("ok"):
+                raise RuntimeError(response.get("error"))
+            if trace is not None and "trace" in response:
+                trace.merge(PlacementTrace.from_dict(response["trace"]))
+            for item in response["results"]:
+                result = PlacementResult.from_dict(item)
+                self.results.append(result)
+                self.updates.put(ProgressUpdate(len(self.results), total, "Positioning windows...", result))
+        except Exception as e:
+            logger.error(f"Error during app placement: {e}")
+
+        message = summarize_results(self.results, total, self._cancelled)
+        self.updates.put(ProgressUpdate(len(self.results), total, message, finished=True))
+        return self.results
+
+    def start(self, configs: List[AppConfig], incremental: bool = False,
+              layout_path: Optional[str] = None, trace: Optional[PlacementTrace] = None) -> None:
+        """Starts a placement through the daemon on a background thread."""
+        if self.is_running():
+            raise RuntimeError("A placement run is already in progress")
+        self._thread = threading.Thread(target=self.run, args=(configs, incremental, layout_path, trace),
+                                        name="remote-placement", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Asks the daemon to cancel the current run."""
+        self._cancelled = True
+        try:
+            self.client.request("cancel")
+        except Exception as e:
+            logger.error(f"Failed to cancel daemon run: {e}")
+
+    def is_running(self) -> bool:
+        """Returns True while a background run is in progress."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the background run to finish; returns False on timeout."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
\ No newline at end of file
@@ -0,0 +1,121 @@
+import fnmatch
+import logging
+import ntpath
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Collection, Dict, List, Optional, Tuple
+
+from .config_manager import AppConfig
+from .shell_link import default_shortcut_cache
+from .window_snapshot import WindowInfo, WindowSnapshot, exe_key
+
+logger = logging.getLogger(__name__)
+
+# Shell windows that are never part of a layout
+SHELL_WINDOW_CLASSES = frozenset({
+    "Progman", "WorkerW", "Shell_TrayWnd", "Shell_SecondaryTrayWnd", "Windows.UI.Core.CoreWindow"
+})
+
+# Minimized windows are parked at this position
+MINIMIZED_COORDINATE = -32000
+
+@dataclass
+class CaptureFilter:
+    """Selects which windows a desktop capture includes.
+
+    Executable patterns are shell-style wildcards matched case-insensitively
+    against the executable's file name; the title is a regular expression.
+    """
+    include_exes: List[str] = field(default_factory=list)
+    exclude_exes: List[str] = field(default_factory=list)
+    title: Optional[str] = None
+    min_size: Tuple[int, int] = (100, 100)
+    include_untitled: bool = False
+
+    def __post_init__(self):
+        self._title = re.compile(self.title) if self.title else None
+
+    def accepts(self, info: WindowInfo) -> bool:
+        """Returns True if a window should be captured."""
+        if not info.visible or not info.exe or info.class_name in SHELL_WINDOW_CLASSES:
+            return False
+        if not info.title and not self.include_untitled:
+            return False
+        left, top, right, bottom = info.rect
+        if left <= MINIMIZED_COORDINATE and top <= MINIMIZED_COORDINATE:
+            return False
+        if right - left < self.min_size[0] or bottom - top < self.min_size[1]:
+            return False
+
+        name = ntpath.basename(info.exe).lower()
+        if self.include_exes and not any(fnmatch.fnmatch(name, p.lower()) for p in self.include_exes):
+            return False
+        if any(fnmatch.fnmatch(name, p.lower()) for p in self.exclude_exes):
+            return False
+        return self._title is None or self._title.search(info.title) is not None
+
+    def to_dict(self) -> dict:
+        """Convert the filter to a dictionary."""
+        data = asdict(self)
+        data['min_size'] = list(self.min_size)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CaptureFilter':
+        """Create a filter from a dictionary."""
+        data = dict(data)
+        if 'min_size' in data:
+            data['min_size'] = tuple(data['min_size'])
+        return cls(**data)
+
+def start_menu_dirs() -> List[str]:
+    """Returns the per-user and all-users Start Menu program folders."""
+    dirs = []
+    for variable in ("APPDATA", "PROGRAMDATA"):
+        root = os.environ.get(variable)
+        if root:
+            dirs.append(os.path.join(root, "Microsoft", "Windows", "Start Menu", "Programs"))
+    return [path for path in dirs if os.path.isdir(path)]
+
+def shortcut_index(dirs: Optional[List[str]] = None) -> Dict[str, str]:
+    """Maps executable paths to a shortcut that launches them.
+
+    Shortcuts are parsed through the shared shortcut cache, so only new or
+    changed .lnk files are read from disk.
+    """
+    cache = default_shortcut_cache()
+    index: Dict[str, str] = {}
+    for directory in start_menu_dirs() if dirs is None else dirs:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if not name.lower().endswith(".lnk"):
+                    continue
+                path = os.path.join(root, name)
+                link = cache.resolve(path)
+                # Shortcuts with arguments launch something more specific than the exe
+                if link is not None and link.target_path and not link.arguments:
+                    index.setdefault(exe_key(os.path.expandvars(link.target_path)), path)
+    return index
+
+def capture_desktop(snapshot: WindowSnapshot, capture_filter: Optional[CaptureFilter] = None,
+                    shortcuts: Optional[Dict[str, str]] = None,
+                    exclude_pids: Optional[Collection[int]] = None) -> List[AppConfig]:
+    """Builds a layout from the windows currently on the desktop.
+
+    Each accepted window becomes one config with its current position and
+    size. Its executable is launched through a known shortcut when shortcuts
+    (from shortcut_index) map it to one. Windows of exclude_pids (by default
+    the capturing process) are skipped.
+    """
+    capture_filter = capture_filter or CaptureFilter()
+    exclude_pids = {os.getpid()} if exclude_pids is None else set(exclude_pids)
+    configs: List[AppConfig] = []
+    for info in snapshot.visible_windows():
+        if info.pid in exclude_pids or not capture_filter.accepts(info):
+            continue
+        left, top, right, bottom = info.rect
+        path = shortcuts.get(exe_key(info.exe), info.exe) if shortcuts else info.exe
+        configs.append(AppConfig(path, (left, top), (right - left, bottom - top)))
+    logger.info(f"Captured {len(configs)} windows from the desktop")
+    return configs
\ No newline at end of file
@@ -0,0 +1,97 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .config_manager import UNITS_MONITOR, UNITS_PERCENT, UNITS_PIXELS, AppConfig
+from .monitors import MonitorTopology, current_topology
+
+logger = logging.getLogger(__name__)
+
+Geometry = Tuple[Tuple[int, int], Tuple[int, int]]
+
+def is_relative(config: AppConfig) -> bool:
+    """Returns True if a config's coordinates depend on the monitor topology."""
+    return config.units != UNITS_PIXELS
+
+def resolve_geometry(configs: List[AppConfig], topology: MonitorTopology) -> List[Geometry]:
+    """Converts every config's position and size to absolute desktop pixels.
+
+    Configs are grouped by (monitor, units) so each group's origin and scale
+    are looked up once and then applied to all of its members in one pass.
+    """
+    groups: Dict[Tuple[Optional[str], str], List[int]] = {}
+    for index, config in enumerate(configs):
+        groups.setdefault((config.monitor, config.units), []).append(index)
+
+    resolved: List[Optional[Geometry]] = [None] * len(configs)
+    for (selector, units), indexes in groups.items():
+        if units == UNITS_PIXELS:
+            for index in indexes:
+                resolved[index] = (tuple(configs[index].position), tuple(configs[index].size))
+            continue
+
+        monitor = topology.select(selector)
+        left, top, right, bottom = monitor.work_area
+        if units == UNITS_MONITOR:
+            scale_x = scale_y = monitor.scale
+        elif units == UNITS_PERCENT:
+            scale_x, scale_y = (right - left) / 100, (bottom - top) / 100
+        else:
+            raise ValueError(f"Unknown units: {units}")
+        for index in indexes:
+            (x, y), (width, height) = configs[index].position, configs[index].size
+            resolved[index] = ((left + round(x * scale_x), top + round(y * scale_y)),
+                               (round(width * scale_x), round(height * scale_y)))
+    return resolved
+
+def to_relative(config: AppConfig, topology: MonitorTopology, units: str = UNITS_PERCENT) -> AppConfig:
+    """Expresses an absolute config relative to the monitor that contains its center."""
+    (x, y), (width, height) = config.position, config.size
+    monitor = topology.monitor_at(x + width // 2, y + height // 2)
+    left, top, right, bottom = monitor.work_area
+    if units == UNITS_MONITOR:
+        scale_x = scale_y = monitor.scale
+    else:
+        scale_x, scale_y = (right - left) / 100, (bottom - top) / 100
+    return replace(
+        config,
+        position=(round((x - left) / scale_x, 2), round((y - top) / scale_y, 2)),
+        size=(round(width / scale_x, 2), round(height / scale_y, 2)),
+        monitor=str(topology.index_of(monitor)),
+        units=units
+    )
+
+class ResolvedLayoutCache:
+    """Resolved pixel geometry of layouts, cached per monitor topology.
+
+    Entries are keyed by the topology fingerprint and the layout's
+    coordinates, so docking or undocking only re-resolves a layout the first
+    time it is applied on that monitor set.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, List[Geometry]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, configs: List[AppConfig], topology: Optional[MonitorTopology] = None) -> List[AppConfig]:
+        """Returns the configs with absolute pixel coordinates for the given (or current) topology."""
+        if not any(is_relative(config) for config in configs):
+            return configs
+        topology = topology or current_topology()
+        key = (topology.fingerprint,
+               tuple((config.monitor, config.units, tuple(config.position), tuple(config.size)) for config in configs))
+        with self._lock:
+            geometry = self._entries.get(key)
+            if geometry is not None:
+                self._entries.move_to_end(key)
+        if geometry is None:
+            geometry = resolve_geometry(configs, topology)
+            with self._lock:
+                self._entries[key] = geometry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return [replace(config, position=position, size=size, monitor=None, units=UNITS_PIXELS)
+                for config, (position, size) in zip(configs, geometry)]
\ No newline at end of file
@@ -0,0 +1,269 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Collection, Iterator, List, Optional, Set
+
+from .config_manager import AppConfig, MatchRule
+from .launch_scheduler import LaunchScheduler
+from .process_tracker import ProcessTracker
+from .stabilizer import PlacementStabilizer
+from .startup_model import StartupHistory
+from .tracing import PlacementTrace, traced
+from .window_matcher import compile_rule
+from .window_events import WindowEventSource
+from .window_manager import WindowManager
+
+logger = logging.getLogger(__name__)
+
+def _ignores_existing(match: Optional[MatchRule]) -> bool:
+    """Returns True if a launch with this match rule must skip the windows open before it."""
+    return match is not None and not match.launched_child and match.instance is None
+
+@dataclass
+class PlacementResult:
+    """Outcome of launching and placing a single application."""
+    config: AppConfig
+    success: bool
+    elapsed: float
+    error: Optional[str] = None
+    cancelled: bool = False
+    reused: bool = False
+    first_window: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """Convert the result to a dictionary."""
+        return {
+            'config': self.config.to_dict(),
+            'success': self.success,
+            'elapsed': self.elapsed,
+            'error': self.error,
+            'cancelled': self.cancelled,
+            'reused': self.reused,
+            'first_window': self.first_window
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PlacementResult':
+        """Create a result from a dictionary."""
+        return cls(
+            config=AppConfig.from_dict(data['config']),
+            success=data['success'],
+            elapsed=data['elapsed'],
+            error=data.get('error'),
+            cancelled=data.get('cancelled', False),
+            reused=data.get('reused', False),
+            first_window=data.get('first_window')
+        )
+
+class LaunchPipeline:
+    """Launches applications concurrently and places each window as soon as it is ready.
+
+    With a StartupHistory, apps are launched slowest first, get timeouts and
+    poll intervals scaled to their past startups, and every successful launch
+    is recorded back into the history. With a LaunchScheduler, each app holds
+    a launch slot from spawn until its window appears, so heavy workspaces do
+    not start everything at once. With a PlacementStabilizer and an event
+    source, placed windows are watched and moved back if their app restores
+    its own geometry; run() returns once they have settled. With a
+    PlacementTrace in ``trace``, every phase of every app is recorded.
+    """
+
+    def __init__(self, max_workers: int = 8, window_timeout: float = 15.0, poll_interval: float = 0.1,
+                 tracker: Optional[ProcessTracker] = None, event_source: Optional[WindowEventSource] = None,
+                 history: Optional[StartupHistory] = None, scheduler: Optional[LaunchScheduler] = None,
+                 stabilizer: Optional[PlacementStabilizer] = None):
+        self.max_workers = max_workers
+        self.window_timeout = window_timeout
+        self.poll_interval = poll_interval
+        self.tracker = tracker or ProcessTracker()
+        self.history = history
+        self.scheduler = scheduler
+        self.event_source = event_source
+        self.trace: Optional[PlacementTrace] = None
+        # Drift is only noticed through window events
+        self.stabilizer = stabilizer if event_source is not None else None
+        if event_source is not None:
+            self.tracker.attach(event_source)
+            if self.stabilizer is not None:
+                self.stabilizer.attach(event_source)
+
+    def launch_and_place(self, config: AppConfig, cancel_event: Optional[threading.Event] = None,
+                         claimed: Optional[Set[int]] = None,
+                         existing: Optional[Collection[int]] = None) -> PlacementResult:
+        """Launches one application, waits for its window and places it.
+
+        claimed holds the windows other launches of the run have taken, so
+        concurrent launches of the same app never place the same window.
+        existing holds the windows that were open before the run; without it,
+        the desktop is enumerated before launching an app whose match rule
+        needs them.
+        """
+        start = time.monotonic()
+        if cancel_event is not None and cancel_event.is_set():
+            return PlacementResult(config, False, 0.0, "Cancelled", cancelled=True)
+
+        timeout, poll_interval = self.window_timeout, self.poll_interval
+        if self.history is not None:
+            timeout = self.history.timeout_for(config.shortcut_path, timeout)
+            poll_interval = self.history.poll_interval_for(config.shortcut_path, poll_interval)
+
+        rule = compile_rule(config.shortcut_path, config.match) if config.match is not None else None
+        trace = self.trace
+        pid = None
+        admitted = False
+        # Start of the phase in progress, for recording it if the launch fails
+        phase, phase_start = None, 0.0
+        first_seen: List[float] = []
+        try:
+            if self.scheduler is not None:
+                with traced(trace, config, "queued", weight=config.weight):
+                    admitted = self.scheduler.acquire(config.weight, config.priority, cancel_event)
+                if not admitted:
+                    return PlacementResult(config, False, time.monotonic() - start, "Cancelled", cancelled=True)
+            ignore: Collection[int] = ()
+            if _ignores_existing(config.match):
+                # Only a window that appears after the launch can be the launched one
+                ignore = existing if existing is not None else self.existing_windows()
+            with traced(trace, config, "resolve"):
+                command = WindowManager.resolve_launch(config.shortcut_path)
+            with traced(trace, config, "spawn", executable=command.executable) as span:
+                pid = WindowManager.open_app(config.shortcut_path, command)
+                span["pid"] = pid
+            if pid is None:
+                raise LookupError("The shell started the app without a process to track")
+            self.tracker.track(pid)
+            if trace is not None:
+                phase, phase_start = "first window", trace.now()
+            hwnd = self.tracker.wait_for_window(
+                pid,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                cancel_event=cancel_event,
+                rule=rule,
+                ignore=ignore,
+                on_first_window=(lambda: first_seen.append(trace.now())) if trace is not None else None,
+                claimed=claimed
+            )
+            if hwnd is None:
+                return PlacementResult(config, False, time.monotonic() - start, "Cancelled", cancelled=True)
+            first_window = time.monotonic() - start
+            if trace is not None:
+                matched_at = trace.now()
+                seen_at = first_seen[0] if first_seen else matched_at
+                trace.add_span(config, "first window", phase_start, seen_at)
+                trace.add_span(config, "matched", seen_at, matched_at, hwnd=hwnd)
+                phase = None
+            if admitted:
+                self.scheduler.release(config.weight)
+                admitted = False
+            with traced(trace, config, "placed"):
+                WindowManager.move_window(hwnd, config.position, config.size)
+            self.watch_placed(hwnd, config)
+            elapsed = time.monotonic() - start
+            if self.history is not None:
+                self.history.record(config.shortcut_path, first_window, elapsed)
+            return PlacementResult(config, True, elapsed, first_window=first_window)
+        except Exception as e:
+            logger.error(f"Failed to launch/place {config.shortcut_path}: {e}")
+            if phase is not None:
+                # Show how long the app was waited for before giving up
+                if first_seen:
+                    trace.add_span(config, phase, phase_start, first_seen[0])
+                    phase, phase_start = "matched", first_seen[0]
+                trace.add_span(config, phase, phase_start, trace.now(), error=str(e))
+            return PlacementResult(config, False, time.monotonic() - start, str(e))
+        finally:
+            if admitted:
+                self.scheduler.release(config.weight)
+            if pid is not None:
+                self.tracker.forget(pid)
+
+    def existing_windows(self) -> Set[int]:
+        """Enumerates the desktop and returns the handles of every window open now."""
+        self.tracker.snapshot.refresh()
+        return set(self.tracker.snapshot.windows)
+
+    def watch_placed(self, hwnd: int, config: AppConfig) -> None:
+        """Hands a window just moved to its config's rect to the stabilizer, if there is one."""
+        if self.stabilizer is not None:
+            self.stabilizer.watch(hwnd, config, self._stabilized_callback(config) if self.trace is not None else None)
+
+    def _stabilized_callback(self, config: AppConfig) -> Callable[[int], None]:
+        """Records the stabilized phase of a placed window once its watch ends."""
+        trace = self.trace
+        placed_at = trace.now()
+
+        def on_done(corrections: int) -> None:
+            trace.add_span(config, "stabilized", placed_at, trace.now(), corrections=corrections)
+            trace.count("retries", corrections)
+
+        return on_done
+
+    def start_events(self) -> bool:
+        """Starts the event source; if it cannot start, falls back to polling and returns False."""
+        try:
+            self.event_source.start()
+            return True
+        except Exception as e:
+            logger.warning(f"Window events are unavailable ({e}); polling for windows instead")
+            self.tracker.detach(self.event_source)
+            if self.stabilizer is not None:
+                self.stabilizer.detach(self.event_source)
+                self.stabilizer = None
+            self.event_source = None
+            return False
+
+    @contextmanager
+    def events(self) -> Iterator[None]:
+        """Keeps the event source running for a block of work.
+
+        A source started by the caller (e.g. a resident daemon) is left running.
+        """
+        owns_source = self.event_source is not None and not self.event_source.running
+        if owns_source:
+            owns_source = self.start_events()
+        try:
+            yield
+        finally:
+            if owns_source:
+                self.event_source.stop()
+
+    def run(self, configs: List[AppConfig],
+            on_result: Optional[Callable[[PlacementResult], None]] = None,
+            cancel_event: Optional[threading.Event] = None) -> List[PlacementResult]:
+        """Runs the pipeline for all configs, reporting each result as it completes."""
+        results: List[PlacementResult] = []
+        if not configs:
+            return results
+        if self.history is not None:
+            configs = self.history.critical_path_order(configs)
+        # Stable sort: priority first, critical path within each priority
+        configs = sorted(configs, key=lambda config: config.priority, reverse=True)
+
+        try:
+            with self.events():
+                workers = max(1, min(self.max_workers, len(configs)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="launch") as executor:
+                    claimed: Set[int] = set()
+                    # One enumeration serves every launch of the run; windows opened by
+                    # earlier launches of the run are kept apart through claimed instead
+                    existing: Collection[int] = ()
+                    if any(_ignores_existing(config.match) for config in configs):
+                        existing = self.existing_windows()
+                    futures = [executor.submit(self.launch_and_place, config, cancel_event, claimed, existing)
+                               for config in configs]
+                    for future in as_completed(futures):
+                        result = future.result()
+                        results.append(result)
+                        if on_result:
+                            on_result(result)
+                if self.stabilizer is not None:
+                    self.stabilizer.wait(cancel_event)
+        finally:
+            if self.history is not None:
+                self.history.save()
+
+        return results
\ No newline at end of file
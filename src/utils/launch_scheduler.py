@@ -0,0 +1,145 @@
+import ctypes
+import heapq
+import itertools
+import logging
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from ctypes import wintypes
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class LoadProbe(ABC):
+    """Reports system load as a fraction of capacity (0.0 idle, 1.0 saturated)."""
+
+    @abstractmethod
+    def sample(self) -> float:
+        ...
+
+class CpuLoadProbe(LoadProbe):
+    """CPU utilization since the previous sample (load average on POSIX)."""
+
+    def __init__(self):
+        self._previous: Optional[Tuple[int, int]] = None
+
+    def sample(self) -> float:
+        if sys.platform != "win32":
+            return os.getloadavg()[0] / (os.cpu_count() or 1)
+
+        idle, kernel, user = wintypes.FILETIME(), wintypes.FILETIME(), wintypes.FILETIME()
+        ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user))
+        to_int = lambda ft: (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+        # Kernel time includes idle time
+        current = (to_int(idle), to_int(kernel) + to_int(user))
+        previous, self._previous = self._previous, current
+        if previous is None or current[1] == previous[1]:
+            return 0.0
+        return 1.0 - (current[0] - previous[0]) / (current[1] - previous[1])
+
+class DiskQueueProbe(LoadProbe):
+    """Physical disk queue length relative to a saturation threshold (Windows only)."""
+
+    COUNTER = r"\PhysicalDisk(_Total)\Current Disk Queue Length"
+
+    def __init__(self, saturated_queue_length: float = 2.0):
+        import win32pdh
+
+        self.saturated_queue_length = saturated_queue_length
+        self._query = win32pdh.OpenQuery()
+        self._counter = win32pdh.AddEnglishCounter(self._query, self.COUNTER)
+
+    def sample(self) -> float:
+        import win32pdh
+
+        win32pdh.CollectQueryData(self._query)
+        _, value = win32pdh.GetFormattedCounterValue(self._counter, win32pdh.PDH_FMT_DOUBLE)
+        return value / self.saturated_queue_length
+
+class MaxLoadProbe(LoadProbe):
+    """The highest load reported by several probes."""
+
+    def __init__(self, probes: List[LoadProbe]):
+        self.probes = probes
+
+    def sample(self) -> float:
+        return max((probe.sample() for probe in self.probes), default=0.0)
+
+def default_load_probe() -> LoadProbe:
+    """Returns a CPU probe, combined with the disk queue probe where available."""
+    probes: List[LoadProbe] = [CpuLoadProbe()]
+    if sys.platform == "win32":
+        try:
+            probes.append(DiskQueueProbe())
+        except Exception as e:
+            logger.warning(f"Disk queue probe unavailable: {e}")
+    return MaxLoadProbe(probes)
+
+class LaunchScheduler:
+    """Admission control for app launches.
+
+    Each launch holds ``weight`` units of a shared capacity from spawn until
+    its window is ready. Waiting launches are admitted strictly by priority
+    (then arrival), so a heavy app at the head of the queue is not starved by
+    lighter ones behind it. With a load probe, new launches are also held back
+    while the machine is saturated. A launch is always admitted when nothing
+    else is starting, so oversized apps and external load cannot stall a run.
+    """
+
+    def __init__(self, capacity: float = 4.0, probe: Optional[LoadProbe] = None,
+                 saturation: float = 0.85, probe_interval: float = 0.25):
+        self.capacity = capacity
+        self.probe = probe
+        self.saturation = saturation
+        self.probe_interval = probe_interval
+        self.in_flight = 0.0
+        self._waiting: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def acquire(self, weight: float = 1.0, priority: int = 0,
+                cancel_event: Optional[threading.Event] = None) -> bool:
+        """Blocks until a launch may start; returns False if cancelled first."""
+        ticket = (-priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if cancel_event is not None and cancel_event.is_set():
+                        return False
+                    if self._waiting[0] == ticket and self._admissible(weight):
+                        self.in_flight += weight
+                        return True
+                    self._condition.wait(self.probe_interval if self.probe is not None else None)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+
+    def release(self, weight: float = 1.0) -> None:
+        """Returns a launch's capacity once its window is ready."""
+        with self._condition:
+            self.in_flight = max(0.0, self.in_flight - weight)
+            self._condition.notify_all()
+
+    def wake(self) -> None:
+        """Wakes waiting launches so they notice cancellation."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def _admissible(self, weight: float) -> bool:
+        if self.in_flight <= 0:
+            return True
+        if self.in_flight + weight > self.capacity:
+            return False
+        if self.probe is not None:
+            try:
+                load = self.probe.sample()
+            except Exception as e:
+                logger.warning(f"Load probe failed: {e}")
+                return True
+            if load > self.saturation:
+                logger.debug(f"Holding launch back: system load {load:.2f}")
+                return False
+        return True
\ No newline at end of file
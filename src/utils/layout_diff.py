@@ -0,0 +1,79 @@
+import logging
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from .config_manager import AppConfig
+from .geometry import is_relative, to_relative
+from .monitors import MonitorTopology, current_topology
+from .window_matcher import WindowMatcher
+from .window_snapshot import WindowInfo, WindowSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE = 2
+
+class PlanAction(Enum):
+    """What an incremental apply has to do for one config."""
+    LAUNCH = 'launch'
+    MOVE = 'move'
+    KEEP = 'keep'
+
+@dataclass
+class PlanEntry:
+    """A config paired with the action and existing window chosen for it."""
+    config: AppConfig
+    action: PlanAction
+    window: Optional[WindowInfo] = None
+
+def rect_matches(rect: Tuple[int, int, int, int], position: Tuple[int, int], size: Tuple[int, int],
+                 tolerance: int = DEFAULT_TOLERANCE) -> bool:
+    """Returns True if a window rect is within tolerance of a target position and size."""
+    left, top, right, bottom = rect
+    return (abs(left - position[0]) <= tolerance and
+            abs(top - position[1]) <= tolerance and
+            abs((right - left) - size[0]) <= tolerance and
+            abs((bottom - top) - size[1]) <= tolerance)
+
+def plan_layout(configs: List[AppConfig], snapshot: WindowSnapshot,
+                tolerance: int = DEFAULT_TOLERANCE) -> List[PlanEntry]:
+    """Compares a target layout with the live desktop.
+
+    Each config claims a distinct visible window chosen by its match rule
+    (by default, the first window of its executable or shortcut target), so a
+    layout listing the same app twice maps onto two distinct windows.
+    Configs without a window are launched; placed windows are kept as they are.
+    """
+    plan: List[PlanEntry] = []
+    windows = WindowMatcher(configs).match(snapshot.visible_windows())
+    for config, window in zip(configs, windows):
+        if window is None:
+            plan.append(PlanEntry(config, PlanAction.LAUNCH))
+            continue
+
+        if rect_matches(window.rect, config.position, config.size, tolerance):
+            plan.append(PlanEntry(config, PlanAction.KEEP, window))
+        else:
+            plan.append(PlanEntry(config, PlanAction.MOVE, window))
+    return plan
+
+def capture_positions(configs: List[AppConfig], snapshot: WindowSnapshot,
+                      topology: Optional[MonitorTopology] = None) -> List[AppConfig]:
+    """Returns the configs with positions and sizes taken from their live windows.
+
+    Relative configs stay in their units, re-expressed against the monitor
+    their window is on now. Configs whose app has no open window are
+    returned unchanged.
+    """
+    captured: List[AppConfig] = []
+    for entry in plan_layout(configs, snapshot, tolerance=0):
+        if entry.window is None:
+            captured.append(entry.config)
+            continue
+        left, top, right, bottom = entry.window.rect
+        config = replace(entry.config, position=(left, top), size=(right - left, bottom - top))
+        if is_relative(config):
+            topology = topology or current_topology()
+            config = to_relative(config, topology, config.units)
+        captured.append(config)
+    return captured
\ No newline at end of file
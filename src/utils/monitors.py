@@ -0,0 +1,160 @@
+import ctypes
+import hashlib
+import logging
+import sys
+from ctypes import wintypes
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[int, int, int, int]
+
+MONITORINFOF_PRIMARY = 0x00000001
+MDT_EFFECTIVE_DPI = 0
+DEFAULT_DPI = 96
+DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+VREFRESH = 116
+DEFAULT_REFRESH_RATE = 60
+
+class _MonitorInfoEx(ctypes.Structure):
+    _fields_ = [
+        ('cbSize', wintypes.DWORD),
+        ('rcMonitor', wintypes.RECT),
+        ('rcWork', wintypes.RECT),
+        ('dwFlags', wintypes.DWORD),
+        ('szDevice', wintypes.WCHAR * 32),
+    ]
+
+@dataclass(frozen=True)
+class Monitor:
+    """One display: its desktop rectangle, work area (without taskbars) and DPI."""
+    device: str
+    rect: Rect
+    work_area: Rect
+    dpi: int = DEFAULT_DPI
+    primary: bool = False
+
+    @property
+    def scale(self) -> float:
+        """The display scale factor (1.0 at 96 DPI)."""
+        return self.dpi / DEFAULT_DPI
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """The monitor's width and height in pixels."""
+        left, top, right, bottom = self.rect
+        return (right - left, bottom - top)
+
+class MonitorTopology:
+    """The set of connected monitors, in a stable left-to-right, top-to-bottom order.
+
+    The fingerprint identifies the arrangement (geometry and DPI of every
+    monitor), so anything derived from it can be cached per monitor set.
+    """
+
+    def __init__(self, monitors: List[Monitor]):
+        if not monitors:
+            raise ValueError("A monitor topology needs at least one monitor")
+        self.monitors = sorted(monitors, key=lambda monitor: (monitor.rect[0], monitor.rect[1]))
+        self.primary = next((monitor for monitor in self.monitors if monitor.primary), self.monitors[0])
+        description = ";".join(f"{m.rect}{m.work_area}{m.dpi}{int(m.primary)}" for m in self.monitors)
+        self.fingerprint = hashlib.sha1(description.encode()).hexdigest()[:16]
+
+    def select(self, selector: Optional[str]) -> Monitor:
+        """Returns a monitor by index, device name or "primary".
+
+        Unknown selectors fall back to the primary monitor, so a layout made
+        on a larger setup still opens on a smaller one.
+        """
+        if selector is None or selector == "primary":
+            return self.primary
+        if selector.isdigit():
+            index = int(selector)
+            if index < len(self.monitors):
+                return self.monitors[index]
+        else:
+            for monitor in self.monitors:
+                if monitor.device.lower() == selector.lower():
+                    return monitor
+        logger.warning(f"Monitor {selector!r} is not connected; using the primary monitor")
+        return self.primary
+
+    def monitor_at(self, x: int, y: int) -> Monitor:
+        """Returns the monitor containing a point, or the primary monitor."""
+        for monitor in self.monitors:
+            left, top, right, bottom = monitor.rect
+            if left <= x < right and top <= y < bottom:
+                return monitor
+        return self.primary
+
+    def index_of(self, monitor: Monitor) -> int:
+        """Returns a monitor's position in the topology."""
+        return self.monitors.index(monitor)
+
+def _rect(rect: wintypes.RECT) -> Rect:
+    return (rect.left, rect.top, rect.right, rect.bottom)
+
+def _monitor_dpi(hmonitor) -> int:
+    try:
+        dpi_x, dpi_y = wintypes.UINT(), wintypes.UINT()
+        if ctypes.windll.shcore.GetDpiForMonitor(hmonitor, MDT_EFFECTIVE_DPI,
+                                                 ctypes.byref(dpi_x), ctypes.byref(dpi_y)) == 0:
+            return dpi_x.value
+    except (AttributeError, OSError):
+        # Before Windows 8.1 every monitor uses the system DPI
+        pass
+    return DEFAULT_DPI
+
+def enumerate_monitors() -> List[Monitor]:
+    """Lists the connected monitors in one EnumDisplayMonitors pass."""
+    user32 = ctypes.windll.user32
+    monitors: List[Monitor] = []
+    callback_type = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC,
+                                       ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+
+    def callback(hmonitor, hdc, rect, data):
+        info = _MonitorInfoEx()
+        info.cbSize = ctypes.sizeof(info)
+        if user32.GetMonitorInfoW(hmonitor, ctypes.byref(info)):
+            monitors.append(Monitor(info.szDevice, _rect(info.rcMonitor), _rect(info.rcWork),
+                                    _monitor_dpi(hmonitor), bool(info.dwFlags & MONITORINFOF_PRIMARY)))
+        return True
+
+    if not user32.EnumDisplayMonitors(None, None, callback_type(callback), 0):
+        raise ctypes.WinError()
+    return monitors
+
+def current_topology() -> MonitorTopology:
+    """Returns the topology of the monitors connected right now."""
+    from .backend import current_backend
+    return MonitorTopology(current_backend().monitors())
+
+def display_refresh_rate() -> int:
+    """Returns the primary display's refresh rate in Hz, or 60 if it is unknown."""
+    if sys.platform != "win32":
+        return DEFAULT_REFRESH_RATE
+    user32 = ctypes.windll.user32
+    hdc = user32.GetDC(None)
+    try:
+        rate = ctypes.windll.gdi32.GetDeviceCaps(hdc, VREFRESH)
+    finally:
+        user32.ReleaseDC(None, hdc)
+    # 0 and 1 mean the hardware default refresh rate
+    return rate if rate > 1 else DEFAULT_REFRESH_RATE
+
+def enable_dpi_awareness() -> None:
+    """Makes the process per-monitor DPI aware, so every coordinate is in physical pixels."""
+    if sys.platform != "win32":
+        return
+    try:
+        context = ctypes.c_void_p(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2)
+        if ctypes.windll.user32.SetProcessDpiAwarenessContext(context):
+            return
+    except AttributeError:
+        pass
+    try:
+        ctypes.windll.shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE)
+    except (AttributeError, OSError):
+        ctypes.windll.user32.SetProcessDPIAware()
\ No newline at end of file
@@ -0,0 +1,27 @@
+import os
+import sys
+import tempfile
+
+APP_DIR_NAME = "AutoPlacer"
+
+def app_data_dir() -> str:
+    """Returns (and creates) the per-user directory for caches and state files."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+        path = os.path.join(base, APP_DIR_NAME)
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        path = os.path.join(base, APP_DIR_NAME.lower())
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def runtime_dir() -> str:
+    """Returns (and creates) a private per-user directory for sockets."""
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base:
+        path = os.path.join(base, APP_DIR_NAME.lower())
+    else:
+        user = getattr(os, "getuid", lambda: os.environ.get("USERNAME", "user"))()
+        path = os.path.join(tempfile.gettempdir(), f"{APP_DIR_NAME.lower()}-{user}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
\ No newline at end of file
@@ -0,0 +1,198 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .backend import current_backend
+from .config_manager import AppConfig
+from .geometry import ResolvedLayoutCache
+from .launch_pipeline import LaunchPipeline, PlacementResult
+from .launch_scheduler import LaunchScheduler
+from .layout_diff import DEFAULT_TOLERANCE, PlanAction, plan_layout
+from .stabilizer import PlacementStabilizer
+from .startup_model import StartupHistory
+from .tracing import PlacementTrace, traced
+from .window_manager import WindowManager, WindowPlacement
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ProgressUpdate:
+    """A progress notification posted by the placement engine."""
+    completed: int
+    total: int
+    message: str
+    result: Optional[PlacementResult] = None
+    finished: bool = False
+    eta: Optional[float] = None
+
+def summarize_results(results: List[PlacementResult], total: int, cancelled: bool) -> str:
+    """Builds the final progress message for a run."""
+    failed = [result for result in results if not result.success and not result.cancelled]
+    if cancelled:
+        return "Placement cancelled"
+    if failed:
+        message = f"{len(failed)}/{total} windows could not be placed"
+        logger.error(message)
+        return message
+    return "All windows processed!"
+
+class PlacementEngine:
+    """Runs launch and placement work off the UI thread.
+
+    Progress is posted to the ``updates`` queue so any consumer (the GUI, a CLI
+    or a benchmark) can observe a run without sharing its thread.
+    """
+
+    def __init__(self, pipeline: Optional[LaunchPipeline] = None, tolerance: int = DEFAULT_TOLERANCE):
+        self.pipeline = pipeline or LaunchPipeline(event_source=current_backend().create_event_source(),
+                                                    scheduler=LaunchScheduler(),
+                                                    stabilizer=PlacementStabilizer())
+        self.tolerance = tolerance
+        self.updates: "queue.Queue[ProgressUpdate]" = queue.Queue()
+        self.results: List[PlacementResult] = []
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._histories: Dict[Optional[str], StartupHistory] = {}
+        self.layouts = ResolvedLayoutCache()
+
+    def run(self, configs: List[AppConfig], incremental: bool = False,
+            layout_path: Optional[str] = None, trace: Optional[PlacementTrace] = None) -> List[PlacementResult]:
+        """Runs a placement synchronously on the calling thread.
+
+        In incremental mode, apps that already have a window are reused
+        instead of launched again, and only windows outside the tolerance
+        are moved. Startup times are learned in the history stored next to
+        layout_path (or in a per-user default history). A trace records the
+        phases of every app and the run's window enumerations and retries.
+        """
+        self._cancel_event.clear()
+        return self._run(configs, incremental, layout_path, trace)
+
+    def history_for(self, layout_path: Optional[str]) -> StartupHistory:
+        """Returns the startup history of a layout, loading it once per engine."""
+        if layout_path not in self._histories:
+            self._histories[layout_path] = StartupHistory.for_layout(layout_path)
+        return self._histories[layout_path]
+
+    def set_history(self, history: StartupHistory, layout_path: Optional[str] = None) -> None:
+        """Uses history for a layout (or for runs without one) instead of loading it."""
+        self._histories[layout_path] = history
+
+    def _run(self, configs: List[AppConfig], incremental: bool = False,
+             layout_path: Optional[str] = None, trace: Optional[PlacementTrace] = None) -> List[PlacementResult]:
+        self.results = []
+        total = len(configs)
+        try:
+            # Monitor-relative coordinates become desktop pixels for the current monitors
+            with traced(trace, None, "resolve layout"):
+                configs = self.layouts.resolve(configs)
+        except Exception as e:
+            logger.error(f"Failed to resolve layout coordinates: {e}")
+            self.updates.put(ProgressUpdate(0, total, "Could not read the monitor layout", finished=True))
+            return self.results
+        history = self.history_for(layout_path)
+        self.pipeline.history = history
+
+        # Apps run in parallel, so the remaining time is the slowest unfinished app
+        started = time.monotonic()
+        expected = {id(config): history.expected_duration(config.shortcut_path) for config in configs}
+
+        def eta() -> float:
+            elapsed = time.monotonic() - started
+            return max([duration - elapsed for duration in expected.values()] + [0.0])
+
+        self.updates.put(ProgressUpdate(0, total, "Opening windows...", eta=eta()))
+
+        def on_result(result: PlacementResult) -> None:
+            self.results.append(result)
+            expected.pop(id(result.config), None)
+            self.updates.put(ProgressUpdate(len(self.results), total, "Positioning windows...", result, eta=eta()))
+
+        snapshot = self.pipeline.tracker.snapshot
+        enumerations = snapshot.enumeration_count
+        self.pipeline.trace = trace
+        try:
+            # Reused windows are watched by the stabilizer too, so events run from the first move
+            with self.pipeline.events():
+                if incremental:
+                    with traced(trace, None, "reapply", apps=total):
+                        to_launch = self._apply_existing(configs, on_result)
+                else:
+                    to_launch = configs
+                with traced(trace, None, "launch", apps=len(to_launch)):
+                    self.pipeline.run(to_launch, on_result=on_result, cancel_event=self._cancel_event)
+                if self.pipeline.stabilizer is not None:
+                    # The pipeline waits for its own launches; this also covers runs that launched nothing
+                    self.pipeline.stabilizer.wait(self._cancel_event)
+        except Exception as e:
+            logger.error(f"Error during app placement: {e}")
+        finally:
+            self.pipeline.trace = None
+            if trace is not None:
+                trace.count("enumerations", snapshot.enumeration_count - enumerations)
+
+        message = summarize_results(self.results, total, self._cancel_event.is_set())
+        self.updates.put(ProgressUpdate(len(self.results), total, message, finished=True))
+        return self.results
+
+    def _apply_existing(self, configs: List[AppConfig], on_result) -> List[AppConfig]:
+        """Moves already-open windows into place and returns the configs still to launch."""
+        start = time.monotonic()
+        snapshot = self.pipeline.tracker.snapshot
+        snapshot.refresh()
+        plan = plan_layout(configs, snapshot, self.tolerance)
+
+        moves = [entry for entry in plan if entry.action == PlanAction.MOVE]
+        outcomes = {}
+        if moves:
+            placements = [WindowPlacement(entry.window.hwnd, entry.config.position, entry.config.size) for entry in moves]
+            outcomes = {outcome.hwnd: outcome for outcome in WindowManager.place_windows(placements)}
+
+        to_launch = []
+        for entry in plan:
+            if entry.action == PlanAction.LAUNCH:
+                to_launch.append(entry.config)
+            elif entry.action == PlanAction.KEEP:
+                on_result(PlacementResult(entry.config, True, 0.0, reused=True))
+            else:
+                outcome = outcomes[entry.window.hwnd]
+                if outcome.success:
+                    # An app that is still starting may restore its own geometry over the move
+                    self.pipeline.watch_placed(entry.window.hwnd, entry.config)
+                on_result(PlacementResult(entry.config, outcome.success, time.monotonic() - start,
+                                          outcome.error, reused=True))
+
+        logger.info(f"Incremental apply: {len(plan) - len(to_launch)} reused, {len(to_launch)} to launch")
+        return to_launch
+
+    def start(self, configs: List[AppConfig], incremental: bool = False,
+              layout_path: Optional[str] = None, trace: Optional[PlacementTrace] = None) -> None:
+        """Starts a placement run on a background thread."""
+        if self.is_running():
+            raise RuntimeError("A placement run is already in progress")
+        self._cancel_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(configs, incremental, layout_path, trace),
+                                        name="placement-engine", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Requests cancellation of the current run."""
+        self._cancel_event.set()
+        self.pipeline.tracker.wake()
+        if self.pipeline.scheduler is not None:
+            self.pipeline.scheduler.wake()
+        if self.pipeline.stabilizer is not None:
+            self.pipeline.stabilizer.stop()
+
+    def is_running(self) -> bool:
+        """Returns True while a background run is in progress."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the background run to finish; returns False on timeout."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
\ No newline at end of file
@@ -0,0 +1,186 @@
+import logging
+import threading
+import time
+from typing import Callable, Collection, Dict, List, Optional, Set
+
+from .backend import current_backend
+from .window_events import WindowEvent, WindowEventSource, WindowEventType
+from .window_matcher import CompiledRule
+from .window_snapshot import WindowSnapshot
+
+logger = logging.getLogger(__name__)
+
+def snapshot_processes() -> Dict[int, int]:
+    """Returns a mapping of every running process id to its parent process id."""
+    return current_backend().process_parents()
+
+class ProcessTracker:
+    """Tracks launched processes and their child process trees by PID.
+
+    All waiting launches share one process snapshot and one incremental
+    WindowSnapshot refresh, so finding a launch's window is a dictionary
+    lookup instead of a system-wide search per application.
+
+    When attached to a WindowEventSource, waits block until a window event
+    arrives instead of polling, and only the windows named by events are
+    re-read.
+    """
+
+    def __init__(self, snapshot: Optional[WindowSnapshot] = None, min_refresh_interval: float = 0.05):
+        self.snapshot = snapshot or WindowSnapshot()
+        self.min_refresh_interval = min_refresh_interval
+        self.event_driven = False
+        self._roots: Set[int] = set()
+        self._parents: Dict[int, int] = {}
+        self._children: Dict[int, List[int]] = {}
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._generation = 0
+
+    def attach(self, source: WindowEventSource) -> None:
+        """Reacts to window events from source instead of polling."""
+        source.add_listener(self._on_event)
+        self.event_driven = True
+
+    def detach(self, source: WindowEventSource) -> None:
+        """Stops reacting to window events from source."""
+        source.remove_listener(self._on_event)
+        self.event_driven = False
+
+    def track(self, pid: int) -> None:
+        """Starts tracking a launched process and its descendants."""
+        with self._lock:
+            self._roots.add(pid)
+
+    def forget(self, pid: int) -> None:
+        """Stops tracking a launched process."""
+        with self._lock:
+            self._roots.discard(pid)
+
+    def refresh(self, force: bool = False) -> None:
+        """Rebuilds the process tree and window index, at most once per interval.
+
+        Nothing is enumerated while no launches are being tracked unless forced.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and (not self._roots or now - self._last_refresh < self.min_refresh_interval):
+                return
+            self._refresh_processes()
+            self.snapshot.refresh()
+            self._last_refresh = time.monotonic()
+        self.wake()
+
+    def wake(self) -> None:
+        """Wakes all waiters so they re-check their windows and cancellation."""
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+
+    def owned_pids(self, pid: int) -> List[int]:
+        """Returns the launched process followed by all of its descendants."""
+        with self._lock:
+            owned = [pid]
+            seen = {pid}
+            for current in owned:
+                for child in self._children.get(current, ()):
+                    # PIDs can be recycled; never walk into a cycle
+                    if child not in seen:
+                        seen.add(child)
+                        owned.append(child)
+            return owned
+
+    def find_window(self, pid: int, rule: Optional[CompiledRule] = None,
+                    ignore: Collection[int] = (), claimed: Optional[Set[int]] = None) -> Optional[int]:
+        """Returns the first visible window owned by a launched process tree.
+
+        With a rule, the first window satisfying it is returned instead. Unless
+        the rule requires a launched window, windows of other processes are
+        considered too (single-instance apps hand launches over to a running
+        process); pass the handles that existed before the launch as ignore.
+        With an instance index, the window at that index among all visible
+        windows satisfying the rule is returned, whether or not it existed
+        before the launch, counted as WindowMatcher counts them (see
+        MatchRule). With claimed, a set shared by concurrent launches, windows
+        already in it are skipped and the returned window is added to it.
+        """
+        owned = self.owned_pids(pid)
+        matches: List[int] = []
+        if rule is not None and rule.instance is not None:
+            # The index is taken over the full enumeration; ignore and claimed cannot shift it
+            matches = [info.hwnd for info in self.snapshot.visible_windows() if rule.matches(info, owned)]
+            matches = matches[rule.instance:rule.instance + 1]
+        else:
+            candidates = [info for owned_pid in owned for info in self.snapshot.by_pid(owned_pid)]
+            if rule is not None and not rule.launched_child:
+                candidates.extend(self.snapshot.visible_windows())
+            for info in candidates:
+                if not info.visible or info.hwnd in ignore or info.hwnd in matches:
+                    continue
+                if rule is None or rule.matches(info, owned):
+                    matches.append(info.hwnd)
+        with self._lock:
+            for hwnd in matches:
+                if claimed is None:
+                    return hwnd
+                if hwnd not in claimed:
+                    claimed.add(hwnd)
+                    return hwnd
+        return None
+
+    def wait_for_window(self, pid: int, timeout: float = 15.0, poll_interval: float = 0.1,
+                        cancel_event: Optional[threading.Event] = None,
+                        rule: Optional[CompiledRule] = None, ignore: Collection[int] = (),
+                        on_first_window: Optional[Callable[[], None]] = None,
+                        claimed: Optional[Set[int]] = None) -> Optional[int]:
+        """Waits for a window owned by a launched process tree (see find_window).
+
+        on_first_window is called once, as soon as the tree shows any window,
+        which may be well before a window satisfies the rule (a splash screen,
+        say). Returns None if the wait is cancelled through cancel_event.
+        """
+        deadline = time.monotonic() + timeout
+        self.refresh()
+        while True:
+            with self._condition:
+                generation = self._generation
+            hwnd = self.find_window(pid, rule, ignore, claimed)
+            if on_first_window is not None and (hwnd or (rule is not None and self.find_window(pid, None, ignore))):
+                on_first_window()
+                on_first_window = None
+            if hwnd:
+                return hwnd
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No window for process {pid} after {timeout:.1f}s")
+
+            with self._condition:
+                if self._generation == generation:
+                    self._condition.wait(remaining if self.event_driven else min(poll_interval, remaining))
+            if not self.event_driven:
+                self.refresh()
+
+    def _refresh_processes(self) -> None:
+        parents = snapshot_processes()
+        children: Dict[int, List[int]] = {}
+        for pid, parent in parents.items():
+            if pid != parent:
+                children.setdefault(parent, []).append(pid)
+        self._parents = parents
+        self._children = children
+
+    def _on_event(self, event: WindowEvent) -> None:
+        # Moves and resizes never make a window appear
+        if event.type == WindowEventType.LOCATION_CHANGE:
+            return
+        with self._lock:
+            if not self._roots:
+                return
+            info = self.snapshot.update(event.hwnd)
+            if info is not None and info.pid not in self._parents:
+                # A process started since the last snapshot; learn its parent
+                self._refresh_processes()
+        self.wake()
@@ -0,0 +1,207 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from .config_manager import AppConfig, ConfigManager
+from .paths import app_data_dir
+
+logger = logging.getLogger(__name__)
+
+DATABASE_FILE_NAME = "profiles.db"
+
+# The variant used when a profile is not specific to a monitor set
+DEFAULT_VARIANT = ""
+
+# MIGRATIONS[n] upgrades a database from schema version n to n + 1
+MIGRATIONS: List[str] = [
+    """
+        CREATE TABLE profiles (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            variant TEXT NOT NULL DEFAULT '',
+            app_count INTEGER NOT NULL,
+            created REAL NOT NULL,
+            modified REAL NOT NULL,
+            UNIQUE (name, variant)
+        );
+        CREATE INDEX profiles_by_name ON profiles(name COLLATE NOCASE, variant);
+        CREATE TABLE profile_tags (
+            profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (profile_id, tag)
+        );
+        CREATE INDEX profile_tags_by_tag ON profile_tags(tag);
+        CREATE TABLE profile_apps (
+            profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+            ordinal INTEGER NOT NULL,
+            config TEXT NOT NULL,
+            PRIMARY KEY (profile_id, ordinal)
+        );
+    """,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+@dataclass
+class ProfileSummary:
+    """A saved layout as listed in the library, without its apps."""
+    id: int
+    name: str
+    variant: str
+    tags: List[str]
+    app_count: int
+    modified: float
+
+class ProfileStore:
+    """A library of named layouts stored in a local SQLite database.
+
+    Each profile can have tags and one variant per monitor set; tags belong
+    to the profile, so every variant carries the same ones. Listing and
+    searching only read the profile index; a profile's apps are read when it
+    is loaded. The schema is versioned through ``PRAGMA user_version`` and
+    upgraded in place on open.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(app_data_dir(), DATABASE_FILE_NAME)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._migrate()
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
+
+    def save(self, name: str, configs: List[AppConfig], tags: Iterable[str] = (),
+             variant: str = DEFAULT_VARIANT) -> int:
+        """Creates or replaces a profile variant; returns its id.
+
+        tags are added to the profile's tags, which a new variant inherits;
+        set_tags replaces them.
+        """
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute("SELECT id FROM profiles WHERE name = ? AND variant = ?",
+                                   (name, variant)).fetchone()
+            if row is None:
+                profile_id = self._db.execute(
+                    "INSERT INTO profiles (name, variant, app_count, created, modified) VALUES (?, ?, ?, ?, ?)",
+                    (name, variant, len(configs), now, now)
+                ).lastrowid
+            else:
+                profile_id = row[0]
+                self._db.execute("UPDATE profiles SET app_count = ?, modified = ? WHERE id = ?",
+                                 (len(configs), now, profile_id))
+                self._db.execute("DELETE FROM profile_apps WHERE profile_id = ?", (profile_id,))
+            self._db.executemany(
+                "INSERT INTO profile_apps (profile_id, ordinal, config) VALUES (?, ?, ?)",
+                [(profile_id, ordinal, json.dumps(config.to_dict())) for ordinal, config in enumerate(configs)]
+            )
+            # Keep the tags of all variants in step
+            ids = [row[0] for row in self._db.execute("SELECT id FROM profiles WHERE name = ?", (name,))]
+            tags = set(tags).union(row[0] for row in self._db.execute(
+                "SELECT tag FROM profile_tags JOIN profiles ON profiles.id = profile_id WHERE name = ?", (name,)))
+            self._db.executemany("INSERT OR IGNORE INTO profile_tags (profile_id, tag) VALUES (?, ?)",
+                                 [(other_id, tag) for other_id in ids for tag in tags])
+        logger.info(f"Profile {name!r} saved")
+        return profile_id
+
+    def load(self, name: str, variant: Optional[str] = None) -> List[AppConfig]:
+        """Returns a profile's configs.
+
+        A missing variant falls back to the default one. Raises KeyError if
+        the profile does not exist.
+        """
+        with self._lock:
+            profile_id = self._find(name, variant)
+            rows = self._db.execute("SELECT config FROM profile_apps WHERE profile_id = ? ORDER BY ordinal",
+                                    (profile_id,)).fetchall()
+        return [AppConfig.from_dict(json.loads(row[0])) for row in rows]
+
+    def delete(self, name: str, variant: Optional[str] = None) -> None:
+        """Deletes one variant of a profile, or all of them if variant is None."""
+        with self._lock, self._db:
+            if variant is None:
+                self._db.execute("DELETE FROM profiles WHERE name = ?", (name,))
+            else:
+                self._db.execute("DELETE FROM profiles WHERE name = ? AND variant = ?", (name, variant))
+
+    def set_tags(self, name: str, tags: Iterable[str]) -> None:
+        """Replaces the tags of every variant of a profile."""
+        with self._lock, self._db:
+            ids = [row[0] for row in self._db.execute("SELECT id FROM profiles WHERE name = ?", (name,))]
+            if not ids:
+                raise KeyError(name)
+            for profile_id in ids:
+                self._db.execute("DELETE FROM profile_tags WHERE profile_id = ?", (profile_id,))
+                self._db.executemany("INSERT OR IGNORE INTO profile_tags (profile_id, tag) VALUES (?, ?)",
+                                     [(profile_id, tag) for tag in tags])
+
+    def search(self, query: str = "", tags: Iterable[str] = (), limit: int = 200,
+               offset: int = 0) -> List[ProfileSummary]:
+        """Lists profiles whose name contains query and that carry all tags.
+
+        Results are ordered by name and paged with limit and offset.
+        """
+        tags = list(tags)
+        sql = "SELECT id, name, variant, app_count, modified FROM profiles WHERE name LIKE ? ESCAPE '\\'"
+        pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        params: list = [pattern]
+        for tag in tags:
+            sql += " AND id IN (SELECT profile_id FROM profile_tags WHERE tag = ?)"
+            params.append(tag)
+        sql += " ORDER BY name COLLATE NOCASE, variant LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+            tags_by_id = {row[0]: [] for row in rows}
+            if rows:
+                marks = ",".join("?" * len(rows))
+                for profile_id, tag in self._db.execute(
+                        f"SELECT profile_id, tag FROM profile_tags WHERE profile_id IN ({marks}) ORDER BY tag",
+                        list(tags_by_id)):
+                    tags_by_id[profile_id].append(tag)
+        return [ProfileSummary(row[0], row[1], row[2], tags_by_id[row[0]], row[3], row[4]) for row in rows]
+
+    def all_tags(self) -> List[str]:
+        """Returns every tag in use."""
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT DISTINCT tag FROM profile_tags ORDER BY tag")]
+
+    def variants(self, name: str) -> List[str]:
+        """Returns the variants saved for a profile."""
+        with self._lock:
+            return [row[0] for row in self._db.execute(
+                "SELECT variant FROM profiles WHERE name = ? ORDER BY variant", (name,))]
+
+    def import_layout(self, filepath: str, name: Optional[str] = None, tags: Iterable[str] = (),
+                      variant: str = DEFAULT_VARIANT) -> str:
+        """Imports a JSON layout file as a profile; returns the profile name."""
+        configs = ConfigManager.load_configs(filepath)
+        name = name or os.path.splitext(os.path.basename(filepath))[0]
+        self.save(name, configs, tags, variant)
+        return name
+
+    def _find(self, name: str, variant: Optional[str]) -> int:
+        for candidate in ([variant] if variant not in (None, DEFAULT_VARIANT) else []) + [DEFAULT_VARIANT]:
+            row = self._db.execute("SELECT id FROM profiles WHERE name = ? AND variant = ?",
+                                   (name, candidate)).fetchone()
+            if row is not None:
+                return row[0]
+        raise KeyError(name)
+
+    def _migrate(self) -> None:
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(f"Profile database {self.path} has a newer schema (version {version})")
+        for target in range(version, SCHEMA_VERSION):
+            # One transaction per step, so an interrupted upgrade leaves a consistent schema version
+            self._db.executescript(f"BEGIN; {MIGRATIONS[target]} PRAGMA user_version = {target + 1}; COMMIT;")
+            logger.info(f"Profile database migrated to schema version {target + 1}")
\ No newline at end of file
@@ -0,0 +1,156 @@
+import itertools
+import logging
+import ntpath
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from .backend import Rect
+from .session_recording import RecordedEvent, SessionRecording
+from .simulated_desktop import SimulatedApp, SimulatedDesktop, SimulatedWindow
+from .window_events import WindowEventType
+
+logger = logging.getLogger(__name__)
+
+class ReplayDesktop(SimulatedDesktop):
+    """A simulated desktop that replays a recorded placement run.
+
+    The windows present when the recording started are there from the
+    beginning. When the placement code launches a target the recorded run
+    launched, it gets the recorded process id, and every window event that
+    followed the recorded launch is replayed at the same offset from the new
+    launch (divided by ``speed``). Windows a single-instance app opened in an
+    already running process are credited to the latest launch of the same
+    executable. Events no launch accounts for are replayed at their offset
+    from begin(). Launches missing from the recording fall back to
+    ``default_app``'s simulated behavior. Moves made by the placement code
+    are applied as on a real desktop and kept in ``moves``.
+    """
+
+    def __init__(self, recording: SessionRecording, speed: float = 1.0, move_cost: float = 0.0,
+                 default_app: Optional[SimulatedApp] = None):
+        super().__init__(monitors=recording.monitors or None, speed=speed, move_cost=move_cost,
+                         default_app=default_app)
+        self.recording = recording
+        self.moves: List[Tuple[float, int, Rect]] = []
+        self._began = time.monotonic()
+        # Fallback launches get ids the recording does not use
+        self._pids = itertools.count(max(list(recording.processes) + [996]) + 4, 4)
+        self._hwnds = itertools.count(max(list(recording.windows) + [0x1000e]) + 2, 2)
+        for hwnd, state in recording.initial.items():
+            pid, class_name = recording.windows[hwnd]
+            self._add_process(pid)
+            self.windows[hwnd] = SimulatedWindow(hwnd, pid, class_name, state.title, state.rect, state.visible)
+
+        self._pending: Dict[str, Deque[int]] = {}
+        for index, launch in enumerate(recording.launches):
+            self._pending.setdefault(self._key(launch.target), deque()).append(index)
+        self._scripts: List[List[RecordedEvent]] = [[] for _ in recording.launches]
+        self._ambient: List[RecordedEvent] = []
+        self._attribute_events()
+
+    def begin(self) -> None:
+        """Starts replaying the events no launch accounts for; call it as the run starts."""
+        self._began = time.monotonic()
+        for event in self._ambient:
+            self._schedule(event.time, lambda event=event: self._apply(event))
+
+    def create_process(self, executable: str, arguments: str = "", working_dir: Optional[str] = None,
+                       show_command: Optional[int] = None) -> int:
+        index = self._next_launch(executable)
+        if index is None:
+            return super().create_process(executable, arguments, working_dir, show_command)
+        return self._replay_launch(index)
+
+    def shell_execute(self, path: str) -> Optional[int]:
+        index = self._next_launch(path)
+        if index is None:
+            return super().shell_execute(path)
+        return self._replay_launch(index)
+
+    def move_window(self, hwnd: int, position: Tuple[int, int], size: Tuple[int, int]) -> None:
+        with self._lock:
+            self.moves.append((time.monotonic() - self._began, hwnd,
+                               (position[0], position[1], position[0] + size[0], position[1] + size[1])))
+        super().move_window(hwnd, position, size)
+
+    def _attribute_events(self) -> None:
+        """Splits the recorded events into one script per launch and the ambient rest."""
+        recording = self.recording
+        by_pid = {launch.pid: index for index, launch in enumerate(recording.launches) if launch.pid is not None}
+        owners: Dict[int, Optional[int]] = {}
+        for event in recording.events:
+            if event.hwnd not in owners:
+                owners[event.hwnd] = self._launch_of(event, by_pid)
+            index = owners[event.hwnd]
+            if index is None:
+                self._ambient.append(event)
+            else:
+                self._scripts[index].append(event)
+
+    def _launch_of(self, event: RecordedEvent, by_pid: Dict[int, int]) -> Optional[int]:
+        """Returns the launch that made a window appear, or None if it was not launched."""
+        recording = self.recording
+        if event.hwnd in recording.initial or event.hwnd not in recording.windows:
+            return None
+        pid = recording.windows[event.hwnd][0]
+        seen = set()
+        while pid and pid not in seen:
+            seen.add(pid)
+            index = by_pid.get(pid)
+            if index is not None and recording.launches[index].time <= event.time:
+                return index
+            pid = recording.processes.get(pid, (0, ''))[0]
+
+        # A single-instance app hands the launch over to its running process
+        exe = recording.processes.get(recording.windows[event.hwnd][0], (0, ''))[1]
+        name = self._key(ntpath.basename(exe)) if exe else None
+        candidates = [index for index, launch in enumerate(recording.launches)
+                      if launch.time <= event.time and self._key(ntpath.basename(launch.target)) == name]
+        return candidates[-1] if candidates else None
+
+    def _next_launch(self, target: str) -> Optional[int]:
+        with self._lock:
+            pending = self._pending.get(self._key(target))
+            if pending:
+                return pending.popleft()
+        logger.warning(f"{target} was not launched in the recorded run; simulating it")
+        return None
+
+    def _replay_launch(self, index: int) -> Optional[int]:
+        launch = self.recording.launches[index]
+        with self._lock:
+            self.counters.launches += 1
+            if launch.pid is not None:
+                self._add_process(launch.pid)
+        for event in self._scripts[index]:
+            self._schedule(max(0.0, event.time - launch.time), lambda event=event: self._apply(event))
+        return launch.pid
+
+    def _add_process(self, pid: int) -> None:
+        """Starts a recorded process and its recorded ancestors; called with the lock held."""
+        while pid and pid not in self.processes:
+            parent, exe = self.recording.processes.get(pid, (0, ''))
+            self.processes[pid] = (parent, exe)
+            pid = parent
+
+    def _apply(self, event: RecordedEvent) -> None:
+        with self._lock:
+            if event.type == WindowEventType.DESTROY:
+                if self.windows.pop(event.hwnd, None) is None:
+                    return
+            else:
+                pid, class_name = self.recording.windows[event.hwnd]
+                state = event.state
+                window = self.windows.get(event.hwnd)
+                if window is None:
+                    self._add_process(pid)
+                    self.windows[event.hwnd] = SimulatedWindow(event.hwnd, pid, class_name, state.title,
+                                                               state.rect, state.visible)
+                else:
+                    window.title = state.title
+                    window.visible = state.visible
+                    # Only the app's own moves change the rect; other events would undo a placement
+                    if event.type == WindowEventType.LOCATION_CHANGE:
+                        window.rect = state.rect
+        self._emit(event.type, event.hwnd)
\ No newline at end of file
@@ -1,12 +1,16 @@
 import tkinter as tk
 from typing import Tuple, Optional
 import logging
-from pywinauto import Desktop
-import win32gui
-import win32con
+from .monitors import current_topology, display_refresh_rate
+from .snapping import EdgeIndex, build_edge_index
+from .window_snapshot import WindowSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Event.state bit set while Shift is held
+SHIFT_MASK = 0x0001
+MIN_SELECTOR_SIZE = 50
+
 class ScreenManager:
     """Manages screen-related operations and window position/size selection."""
     
@@ -14,28 +18,32 @@ class ScreenManager:
     def get_screen_size() -> Tuple[int, int]:
         """Get the primary screen size."""
         try:
-            desktop = Desktop(backend="win32")
-            window = desktop.window()
-            return (window.rectangle().width, window.rectangle().height)
+            return current_topology().primary.size
         except Exception as e:
             logger.error(f"Failed to get screen size: {e}")
             # Fallback to a default size
             return (1920, 1080)
 
     @staticmethod
-    def get_window_rect(window_title: str) -> Optional[Tuple[int, int, int, int]]:
+    def get_window_rect(window_title: str, snapshot: Optional[WindowSnapshot] = None) -> Optional[Tuple[int, int, int, int]]:
         """Get the rectangle of a window by its title."""
         try:
-            hwnd = win32gui.FindWindow(None, window_title)
-            if hwnd:
-                return win32gui.GetWindowRect(hwnd)
-            return None
+            if snapshot is None:
+                snapshot = WindowSnapshot()
+                snapshot.refresh()
+            windows = snapshot.by_title(window_title)
+            return windows[0].rect if windows else None
         except Exception as e:
             logger.error(f"Failed to get window rectangle: {e}")
             return None
 
 class PositionSelector(tk.Toplevel):
-    """A window for selecting window position and size visually."""
+    """A window for selecting window position and size visually.
+
+    Mouse motion is coalesced: events only record the pointer, and the
+    window is moved at most once per display frame. While dragging, edges
+    snap to monitor edges, work-area grid lines and other windows' edges.
+    """
     
     def __init__(self, parent, initial_position: Tuple[int, int] = (0, 0), initial_size: Tuple[int, int] = (800, 600)):
         super().__init__(parent)
@@ -57,18 +65,30 @@ class PositionSelector(tk.Toplevel):
         # Store current position and size
         self.current_position = initial_position
         self.current_size = initial_size
+        self.result = None
+
+        # Pending drag state, applied once per frame
+        self.frame_interval = max(1, 1000 // display_refresh_rate())
+        self._drag = None
+        self._pointer = (0, 0)
+        self._snap = True
+        self._frame_job = None
+        self.edges = self._build_edges()
         
         # Bind mouse events
         self.bind('<Button-1>', self.start_move)
         self.bind('<B1-Motion>', self.on_move)
         self.bind('<Button-3>', self.start_resize)
         self.bind('<B3-Motion>', self.on_resize)
+        self.bind('<ButtonRelease-1>', self.end_drag)
+        self.bind('<ButtonRelease-3>', self.end_drag)
         self.bind('<Escape>', self.on_confirm)
         
         # Add instructions label
         self.instructions = tk.Label(
             self,
-            text="Left click and drag to move\nRight click and drag to resize\nPress ESC to confirm",
+            text="Left click and drag to move\nRight click and drag to resize\n"
+                 "Hold Shift to place freely\nPress ESC to confirm",
             bg='blue',
             fg='white',
             font=('Arial', 12)
@@ -85,39 +105,89 @@ class PositionSelector(tk.Toplevel):
         # Update initial position after centering
         self.current_position = (x, y)
 
+    @staticmethod
+    def _build_edges() -> EdgeIndex:
+        """Indexes the snap edges once, when the selector opens."""
+        try:
+            snapshot = WindowSnapshot()
+            snapshot.refresh()
+            windows = snapshot.visible_windows()
+        except Exception as e:
+            logger.error(f"Failed to list windows for snapping: {e}")
+            windows = []
+        try:
+            topology = current_topology()
+        except Exception as e:
+            logger.error(f"Failed to read monitors for snapping: {e}")
+            topology = None
+        return build_edge_index(topology, windows)
+
+    def _begin_drag(self, kind: str, event) -> None:
+        self._drag = (kind, event.x_root, event.y_root, self.current_position, self.current_size)
+        self._pointer = (event.x_root, event.y_root)
+
+    def _queue_frame(self, event) -> None:
+        """Records the pointer and schedules one update for the next frame."""
+        if self._drag is None:
+            return
+        self._pointer = (event.x_root, event.y_root)
+        self._snap = not event.state & SHIFT_MASK
+        if self._frame_job is None:
+            self._frame_job = self.after(self.frame_interval, self._apply_frame)
+
+    def _apply_frame(self) -> None:
+        """Applies the latest pointer position with a single geometry call."""
+        self._frame_job = None
+        if self._drag is None:
+            return
+        kind, start_x, start_y, (x, y), (width, height) = self._drag
+        delta_x = self._pointer[0] - start_x
+        delta_y = self._pointer[1] - start_y
+        if kind == "move":
+            x, y = x + delta_x, y + delta_y
+            if self._snap:
+                x = self.edges.snap_span(x, width)
+                y = self.edges.snap_span(y, height, vertical=True)
+            self.geometry(f"+{x}+{y}")
+            self.current_position = (x, y)
+        else:
+            width = max(MIN_SELECTOR_SIZE, width + delta_x)
+            height = max(MIN_SELECTOR_SIZE, height + delta_y)
+            if self._snap:
+                width = self.edges.snap_end(x, width)
+                height = self.edges.snap_end(y, height, vertical=True)
+            self.geometry(f"{width}x{height}")
+            self.current_size = (width, height)
+
     def start_move(self, event):
         """Start moving the window."""
-        self.x = event.x
-        self.y = event.y
+        self._begin_drag("move", event)
 
     def on_move(self, event):
         """Move the window."""
-        deltax = event.x - self.x
-        deltay = event.y - self.y
-        x = self.winfo_x() + deltax
-        y = self.winfo_y() + deltay
-        self.geometry(f"+{x}+{y}")
-        self.current_position = (x, y)
+        self._queue_frame(event)
 
     def start_resize(self, event):
         """Start resizing the window."""
-        self.start_x = event.x
-        self.start_y = event.y
-        self.start_width = self.winfo_width()
-        self.start_height = self.winfo_height()
+        self._begin_drag("resize", event)
 
     def on_resize(self, event):
         """Resize the window."""
-        width = self.start_width + (event.x - self.start_x)
-        height = self.start_height + (event.y - self.start_y)
-        self.geometry(f"{width}x{height}")
-        self.current_size = (width, height)
+        self._queue_frame(event)
+
+    def end_drag(self, event=None):
+        """Applies any pending motion and ends the drag."""
+        if self._frame_job is not None:
+            self.after_cancel(self._frame_job)
+            self._apply_frame()
+        self._drag = None
 
     def on_confirm(self, event=None):
         """Handle confirmation of position and size."""
+        self.end_drag()
         self.result = (self.current_position, self.current_size)
         self.destroy()
 
     def get_position_and_size(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """Get the current position and size of the window."""
-        return self.result if self.result else (self.current_position, self.current_size) 
\ No newline at end of file
+        return self.result if self.result else (self.current_position, self.current_size)
\ No newline at end of file
@@ -0,0 +1,370 @@
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from .backend import PlacementOutcome, PlatformBackend, Rect, WindowPlacement
+from .config_manager import AppConfig
+from .launch_pipeline import PlacementResult
+from .monitors import Monitor
+from .window_events import WindowEvent, WindowEventSource, WindowEventType
+
+logger = logging.getLogger(__name__)
+
+RECORDING_VERSION = 1
+
+@dataclass
+class RecordedWindow:
+    """A window's state after an event: title, rect and visibility."""
+    title: str
+    rect: Rect
+    visible: bool
+
+@dataclass
+class RecordedEvent:
+    """A window event, seconds after the recording started; destroy events carry no state."""
+    time: float
+    type: WindowEventType
+    hwnd: int
+    state: Optional[RecordedWindow] = None
+
+@dataclass
+class RecordedLaunch:
+    """A launch made by the placement code: the executable or shell path, and the pid it returned."""
+    time: float
+    target: str
+    shell: bool
+    pid: Optional[int]
+
+@dataclass
+class RecordedResult:
+    """How the recorded run placed one app, and which window it placed."""
+    shortcut_path: str
+    position: Tuple[int, int]
+    size: Tuple[int, int]
+    success: bool
+    elapsed: float
+    first_window: Optional[float]
+    hwnd: Optional[int]
+
+    @property
+    def key(self) -> Tuple[str, Tuple[int, int], Tuple[int, int]]:
+        return (self.shortcut_path, tuple(self.position), tuple(self.size))
+
+@dataclass
+class SessionRecording:
+    """The window events and timings of one real placement run.
+
+    Everything the placement code read from the desktop is kept: the windows
+    present when the run started, the processes that owned windows, every
+    launch and the window events that followed it, and the run's results.
+    Window moves made by the placement code itself are kept apart from the
+    events, so a replay only reproduces what the apps did.
+    """
+    layout: List[AppConfig] = field(default_factory=list)
+    incremental: bool = True
+    # Seconds placed windows were watched for drift
+    watch: float = 0.0
+    monitors: List[Monitor] = field(default_factory=list)
+    processes: Dict[int, Tuple[int, str]] = field(default_factory=dict)
+    windows: Dict[int, Tuple[int, str]] = field(default_factory=dict)
+    initial: Dict[int, RecordedWindow] = field(default_factory=dict)
+    launches: List[RecordedLaunch] = field(default_factory=list)
+    events: List[RecordedEvent] = field(default_factory=list)
+    moves: List[Tuple[float, int, Rect]] = field(default_factory=list)
+    results: List[RecordedResult] = field(default_factory=list)
+    duration: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert the recording to a compact dictionary of lists."""
+        def state(window: RecordedWindow) -> list:
+            return [window.title, list(window.rect), window.visible]
+
+        return {
+            'version': RECORDING_VERSION,
+            'layout': [config.to_dict() for config in self.layout],
+            'incremental': self.incremental,
+            'watch': self.watch,
+            'monitors': [[m.device, list(m.rect), list(m.work_area), m.dpi, m.primary] for m in self.monitors],
+            'processes': [[pid, parent, exe] for pid, (parent, exe) in self.processes.items()],
+            'windows': [[hwnd, pid, class_name] for hwnd, (pid, class_name) in self.windows.items()],
+            'initial': [[hwnd] + state(window) for hwnd, window in self.initial.items()],
+            'launches': [[round(launch.time, 4), launch.target, launch.shell, launch.pid] for launch in self.launches],
+            'events': [[round(e.time, 4), e.type.value, e.hwnd] + (state(e.state) if e.state else [])
+                       for e in self.events],
+            'moves': [[round(t, 4), hwnd, list(rect)] for t, hwnd, rect in self.moves],
+            'results': [[r.shortcut_path, list(r.position), list(r.size), r.success, round(r.elapsed, 4),
+                         None if r.first_window is None else round(r.first_window, 4), r.hwnd]
+                        for r in self.results],
+            'duration': round(self.duration, 4)
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SessionRecording':
+        """Create a recording from a dictionary; raises ValueError if it is malformed."""
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid session recording: {data!r}")
+        if data.get('version') != RECORDING_VERSION:
+            raise ValueError(f"Unsupported session recording version: {data.get('version')!r}")
+
+        def state(items: list) -> RecordedWindow:
+            return RecordedWindow(items[0], tuple(items[1]), items[2])
+
+        try:
+            return cls(
+                layout=[AppConfig.from_dict(item) for item in data['layout']],
+                incremental=data['incremental'],
+                watch=data['watch'],
+                monitors=[Monitor(device, tuple(rect), tuple(work), dpi, primary)
+                          for device, rect, work, dpi, primary in data['monitors']],
+                processes={pid: (parent, exe) for pid, parent, exe in data['processes']},
+                windows={hwnd: (pid, class_name) for hwnd, pid, class_name in data['windows']},
+                initial={item[0]: state(item[1:]) for item in data['initial']},
+                launches=[RecordedLaunch(*item) for item in data['launches']],
+                events=[RecordedEvent(item[0], WindowEventType(item[1]), item[2],
+                                      state(item[3:]) if len(item) > 3 else None)
+                        for item in data['events']],
+                moves=[(t, hwnd, tuple(rect)) for t, hwnd, rect in data['moves']],
+                results=[RecordedResult(path, tuple(position), tuple(size), success, elapsed, first_window, hwnd)
+                         for path, position, size, success, elapsed, first_window, hwnd in data['results']],
+                duration=data['duration']
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Malformed session recording: {e}")
+
+    def save(self, path: str) -> None:
+        """Writes the recording as JSON, gzip-compressed if path ends in .gz."""
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'wt', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> 'SessionRecording':
+        """Reads a recording written by save()."""
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+def placed_windows(results: List[PlacementResult],
+                   moves: List[Tuple[float, int, Rect]]) -> Dict[Tuple[str, Tuple[int, int], Tuple[int, int]], int]:
+    """Returns the window each successful result placed, keyed like RecordedResult.key.
+
+    A result's window is the first window moved to its rect that no other
+    result has claimed.
+    """
+    claimed = set()
+    placed = {}
+    for result in results:
+        if not result.success:
+            continue
+        config = result.config
+        rect = (config.position[0], config.position[1],
+                config.position[0] + config.size[0], config.position[1] + config.size[1])
+        for _, hwnd, moved_to in moves:
+            if hwnd not in claimed and tuple(moved_to) == rect:
+                claimed.add(hwnd)
+                placed[(config.shortcut_path, tuple(config.position), tuple(config.size))] = hwnd
+                break
+    return placed
+
+class SessionRecorder(PlatformBackend):
+    """Records a real placement run by standing in front of the platform backend.
+
+    Install it with set_backend() before the engine creates its event
+    source, call begin() before the run and finish() after it. Every call is
+    passed through to the wrapped backend; launches, moves and the events of
+    every event source created through the recorder are recorded on the way.
+    Event listeners only queue the event; the recorder's own thread reads the
+    window it names, and each process once, so recording does not slow down
+    the event source's thread.
+    """
+
+    def __init__(self, backend: PlatformBackend):
+        self.backend = backend
+        self.recording = SessionRecording()
+        self._origin = time.monotonic()
+        self._last: Dict[int, RecordedWindow] = {}
+        self._targets: Dict[int, Rect] = {}
+        self._parents: Dict[int, int] = {}
+        self._resolved: Set[int] = set()
+        self._pending: "queue.Queue[Optional[WindowEvent]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def begin(self, configs: List[AppConfig], incremental: bool, watch: float = 0.0) -> None:
+        """Starts the recording with the layout, how it is applied and the windows already on the desktop."""
+        with self._lock:
+            self.recording = SessionRecording(list(configs), incremental, watch, self.backend.monitors())
+            self._origin = time.monotonic()
+            self._last.clear()
+            self._targets.clear()
+            self._resolved.clear()
+        self._parents = self.backend.process_parents()
+        for hwnd in self.backend.list_windows():
+            try:
+                state = self._read(hwnd)
+            except Exception as e:
+                logger.debug(f"Not recording window {hwnd}: {e}")
+                continue
+            with self._lock:
+                self.recording.initial[hwnd] = self._last[hwnd] = state
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+            self._thread.start()
+
+    def finish(self, results: List[PlacementResult]) -> SessionRecording:
+        """Records the events still queued, then ends the recording with the run's results and returns it."""
+        if self._thread is not None:
+            self._pending.put(None)
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            recording = self.recording
+            recording.duration = time.monotonic() - self._origin
+            placed = placed_windows(results, recording.moves)
+        for result in results:
+            config = result.config
+            key = (config.shortcut_path, tuple(config.position), tuple(config.size))
+            recording.results.append(RecordedResult(config.shortcut_path, tuple(config.position), tuple(config.size),
+                                                    result.success, result.elapsed, result.first_window,
+                                                    placed.get(key)))
+        logger.info(f"Recorded {len(recording.launches)} launches and {len(recording.events)} window events "
+                    f"in {recording.duration:.1f}s")
+        return recording
+
+    def list_windows(self) -> List[int]:
+        return self.backend.list_windows()
+
+    def is_window(self, hwnd: int) -> bool:
+        return self.backend.is_window(hwnd)
+
+    def window_state(self, hwnd: int) -> Tuple[str, Rect, bool]:
+        return self.backend.window_state(hwnd)
+
+    def window_owner(self, hwnd: int) -> Tuple[int, str]:
+        return self.backend.window_owner(hwnd)
+
+    def process_image_path(self, pid: int) -> str:
+        return self.backend.process_image_path(pid)
+
+    def process_parents(self) -> Dict[int, int]:
+        return self.backend.process_parents()
+
+    def create_process(self, executable: str, arguments: str = "", working_dir: Optional[str] = None,
+                       show_command: Optional[int] = None) -> int:
+        launched = self._now()
+        pid = self.backend.create_process(executable, arguments, working_dir, show_command)
+        self._record_launch(launched, executable, False, pid)
+        return pid
+
+    def shell_execute(self, path: str) -> Optional[int]:
+        launched = self._now()
+        pid = self.backend.shell_execute(path)
+        self._record_launch(launched, path, True, pid)
+        return pid
+
+    def find_app_window(self, executable: str) -> Optional[int]:
+        return self.backend.find_app_window(executable)
+
+    def move_window(self, hwnd: int, position: Tuple[int, int], size: Tuple[int, int]) -> None:
+        self._record_moves([WindowPlacement(hwnd, position, size)])
+        self.backend.move_window(hwnd, position, size)
+
+    def place_windows(self, placements: List[WindowPlacement]) -> List[PlacementOutcome]:
+        self._record_moves(placements)
+        return self.backend.place_windows(placements)
+
+    def monitors(self) -> List[Monitor]:
+        return self.backend.monitors()
+
+    def create_event_source(self) -> Optional[WindowEventSource]:
+        source = self.backend.create_event_source()
+        if source is not None:
+            # Added first, so each event is recorded before the placement code reacts to it
+            source.add_listener(self._on_event)
+            # Replays need every move the apps made, watched or not
+            source.request_location_changes()
+        return source
+
+    def _now(self) -> float:
+        return time.monotonic() - self._origin
+
+    def _record_launch(self, launched: float, target: str, shell: bool, pid: Optional[int]) -> None:
+        with self._lock:
+            self.recording.launches.append(RecordedLaunch(launched, target, shell, pid))
+            if pid is not None and pid not in self.recording.processes:
+                self.recording.processes[pid] = (0, target if not shell else '')
+
+    def _record_moves(self, placements: List[WindowPlacement]) -> None:
+        now = self._now()
+        with self._lock:
+            for placement in placements:
+                rect = (placement.position[0], placement.position[1],
+                        placement.position[0] + placement.size[0], placement.position[1] + placement.size[1])
+                # Set before moving: the resulting event may arrive before the move returns
+                self._targets[placement.hwnd] = rect
+                self.recording.moves.append((now, placement.hwnd, rect))
+
+    def _read(self, hwnd: int) -> RecordedWindow:
+        """Reads a window, learning its owner the first time it is seen and its process once per pid."""
+        title, rect, visible = self.backend.window_state(hwnd)
+        if hwnd not in self.recording.windows:
+            pid, class_name = self.backend.window_owner(hwnd)
+            if pid not in self._resolved:
+                if pid not in self._parents:
+                    # Started since the parents were read
+                    self._parents = self.backend.process_parents()
+                exe = self.backend.process_image_path(pid)
+                with self._lock:
+                    process = self.recording.processes.get(pid)
+                    self.recording.processes[pid] = (self._parents.get(pid, 0),
+                                                     exe or (process[1] if process else ''))
+                self._resolved.add(pid)
+            with self._lock:
+                self.recording.windows[hwnd] = (pid, class_name)
+        return RecordedWindow(title, tuple(rect), visible)
+
+    def _on_event(self, event: WindowEvent) -> None:
+        # Runs on the event source's thread ahead of the placement code; only queue the event
+        self._pending.put(event)
+
+    def _run(self) -> None:
+        while True:
+            event = self._pending.get()
+            if event is None:
+                return
+            try:
+                self._record(event)
+            except Exception as e:
+                logger.error(f"Failed to record {event}: {e}")
+
+    def _record(self, event: WindowEvent) -> None:
+        """Reads the window an event names and records the event; runs on the recorder's thread."""
+        at = event.timestamp - self._origin
+        if at < 0:
+            # Queued before the recording began
+            return
+        if event.type == WindowEventType.DESTROY:
+            with self._lock:
+                if event.hwnd in self.recording.windows:
+                    self.recording.events.append(RecordedEvent(at, event.type, event.hwnd))
+                self._last.pop(event.hwnd, None)
+            return
+        try:
+            state = self._read(event.hwnd)
+        except Exception as e:
+            # The window is already gone again
+            logger.debug(f"Not recording event for window {event.hwnd}: {e}")
+            return
+        with self._lock:
+            if event.type == WindowEventType.LOCATION_CHANGE:
+                if state == self._last.get(event.hwnd) or state.rect == self._targets.get(event.hwnd):
+                    # Nothing changed, or the placement code moved it
+                    self._last[event.hwnd] = state
+                    return
+            self._last[event.hwnd] = state
+            self.recording.events.append(RecordedEvent(at, event.type, event.hwnd, state))
\ No newline at end of file
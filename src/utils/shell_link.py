@@ -0,0 +1,239 @@
+import json
+import logging
+import ntpath
+import os
+import struct
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+
+from .paths import app_data_dir
+
+logger = logging.getLogger(__name__)
+
+# [MS-SHLLINK] Shell Link (.LNK) Binary File Format
+HEADER_SIZE = 0x4C
+LINK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+
+HAS_LINK_TARGET_ID_LIST = 0x00000001
+HAS_LINK_INFO = 0x00000002
+HAS_NAME = 0x00000004
+HAS_RELATIVE_PATH = 0x00000008
+HAS_WORKING_DIR = 0x00000010
+HAS_ARGUMENTS = 0x00000020
+HAS_ICON_LOCATION = 0x00000040
+IS_UNICODE = 0x00000080
+
+VOLUME_ID_AND_LOCAL_BASE_PATH = 0x00000001
+COMMON_NETWORK_RELATIVE_LINK_AND_PATH_SUFFIX = 0x00000002
+
+ENVIRONMENT_VARIABLE_DATA_BLOCK = 0xA0000001
+
+SW_SHOWNORMAL = 1
+
+CACHE_FILE_NAME = "shortcuts.json"
+
+@dataclass
+class ShellLink:
+    """The launch information stored in a .lnk shortcut."""
+    target_path: Optional[str]
+    arguments: str = ""
+    working_dir: Optional[str] = None
+    show_command: int = SW_SHOWNORMAL
+    relative_path: Optional[str] = None
+    description: Optional[str] = None
+    icon_location: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert the link to a dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ShellLink':
+        """Create a link from a dictionary."""
+        return cls(**data)
+
+def _read_c_string(data: bytes, offset: int, unicode: bool) -> str:
+    if unicode:
+        end = offset
+        while end + 1 < len(data) and data[end:end + 2] != b"\0\0":
+            end += 2
+        return data[offset:end].decode("utf-16-le", errors="replace")
+    end = data.find(b"\0", offset)
+    return data[offset:end if end >= 0 else len(data)].decode("cp1252", errors="replace")
+
+def _parse_link_info(data: bytes, start: int) -> Tuple[Optional[str], int]:
+    """Returns the target path described by a LinkInfo structure and its size."""
+    size, header_size, flags, _, local_base, network_link, suffix = struct.unpack_from("<7I", data, start)
+    local_base_unicode = suffix_unicode = 0
+    if header_size >= 0x24:
+        local_base_unicode, suffix_unicode = struct.unpack_from("<2I", data, start + 28)
+
+    if suffix_unicode:
+        common_suffix = _read_c_string(data, start + suffix_unicode, True)
+    else:
+        common_suffix = _read_c_string(data, start + suffix, False) if suffix else ""
+
+    if flags & VOLUME_ID_AND_LOCAL_BASE_PATH:
+        if local_base_unicode:
+            base = _read_c_string(data, start + local_base_unicode, True)
+        else:
+            base = _read_c_string(data, start + local_base, False)
+        return base + common_suffix, size
+
+    if flags & COMMON_NETWORK_RELATIVE_LINK_AND_PATH_SUFFIX:
+        link_start = start + network_link
+        net_name_offset = struct.unpack_from("<I", data, link_start + 8)[0]
+        if net_name_offset > 0x14:
+            net_name_unicode = struct.unpack_from("<I", data, link_start + 20)[0]
+            net_name = _read_c_string(data, link_start + net_name_unicode, True)
+        else:
+            net_name = _read_c_string(data, link_start + net_name_offset, False)
+        return ntpath.join(net_name, common_suffix) if common_suffix else net_name, size
+
+    return None, size
+
+def parse_shell_link(data: bytes, link_path: Optional[str] = None) -> ShellLink:
+    """Parses the binary contents of a .lnk file.
+
+    link_path is only used to resolve a relative target path. Raises
+    ValueError if the data is not a shell link.
+    """
+    try:
+        header_size = struct.unpack_from("<I", data, 0)[0]
+        if header_size != HEADER_SIZE or data[4:20] != LINK_CLSID:
+            raise ValueError("Not a shell link file")
+        flags = struct.unpack_from("<I", data, 20)[0]
+        show_command = struct.unpack_from("<I", data, 60)[0]
+        offset = HEADER_SIZE
+
+        if flags & HAS_LINK_TARGET_ID_LIST:
+            offset += 2 + struct.unpack_from("<H", data, offset)[0]
+
+        target_path = None
+        if flags & HAS_LINK_INFO:
+            target_path, link_info_size = _parse_link_info(data, offset)
+            offset += link_info_size
+
+        unicode = bool(flags & IS_UNICODE)
+        strings: Dict[int, str] = {}
+        for flag in (HAS_NAME, HAS_RELATIVE_PATH, HAS_WORKING_DIR, HAS_ARGUMENTS, HAS_ICON_LOCATION):
+            if flags & flag:
+                count = struct.unpack_from("<H", data, offset)[0]
+                offset += 2
+                length = count * 2 if unicode else count
+                raw = data[offset:offset + length]
+                strings[flag] = raw.decode("utf-16-le" if unicode else "cp1252", errors="replace")
+                offset += length
+
+        environment_target = None
+        while offset + 8 <= len(data):
+            block_size, signature = struct.unpack_from("<2I", data, offset)
+            if block_size < 8:
+                break
+            if signature == ENVIRONMENT_VARIABLE_DATA_BLOCK:
+                unicode_target = data[offset + 268:offset + 788].decode("utf-16-le", errors="replace")
+                ansi_target = data[offset + 8:offset + 268].decode("cp1252", errors="replace")
+                environment_target = (unicode_target.split("\0", 1)[0] or ansi_target.split("\0", 1)[0]) or None
+            offset += block_size
+    except struct.error as e:
+        raise ValueError(f"Truncated shell link: {e}")
+
+    relative_path = strings.get(HAS_RELATIVE_PATH)
+    if not target_path and environment_target:
+        target_path = environment_target
+    if not target_path and relative_path and link_path:
+        target_path = ntpath.normpath(ntpath.join(ntpath.dirname(link_path), relative_path))
+
+    return ShellLink(
+        target_path=target_path,
+        arguments=strings.get(HAS_ARGUMENTS, ""),
+        working_dir=strings.get(HAS_WORKING_DIR),
+        show_command=show_command or SW_SHOWNORMAL,
+        relative_path=relative_path,
+        description=strings.get(HAS_NAME),
+        icon_location=strings.get(HAS_ICON_LOCATION)
+    )
+
+def read_shell_link(path: str) -> ShellLink:
+    """Reads and parses a .lnk file."""
+    with open(path, "rb") as f:
+        return parse_shell_link(f.read(), path)
+
+def is_shortcut(path: str) -> bool:
+    """Returns True if a path names a .lnk shortcut."""
+    return path.lower().endswith(".lnk")
+
+class ShortcutCache:
+    """Parsed shortcuts persisted on disk, keyed by path and modification time."""
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self.cache_path = cache_path
+        self._entries: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    def resolve(self, path: str) -> Optional[ShellLink]:
+        """Returns the parsed shortcut, or None if it cannot be read."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError as e:
+            logger.error(f"Failed to read shortcut {path}: {e}")
+            return None
+
+        key = os.path.abspath(path)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is not None and entry["mtime"] == mtime:
+                return ShellLink.from_dict(entry["link"])
+
+        try:
+            link = read_shell_link(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to parse shortcut {path}: {e}")
+            return None
+
+        with self._lock:
+            self._entries[key] = {"mtime": mtime, "link": link.to_dict()}
+            self._save()
+        return link
+
+    def executable_for(self, shortcut_path: str) -> str:
+        """Returns the path a config's windows are matched by: a shortcut's target, else itself."""
+        if is_shortcut(shortcut_path):
+            link = self.resolve(shortcut_path)
+            if link is not None and link.target_path:
+                return os.path.expandvars(link.target_path)
+        return shortcut_path
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_path is None:
+                self.cache_path = os.path.join(app_data_dir(), CACHE_FILE_NAME)
+            try:
+                with open(self.cache_path, "r") as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"Ignoring unreadable shortcut cache {self.cache_path}: {e}")
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            logger.error(f"Failed to save shortcut cache: {e}")
+
+_default_cache: Optional[ShortcutCache] = None
+
+def default_shortcut_cache() -> ShortcutCache:
+    """Returns the process-wide shortcut cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ShortcutCache()
+    return _default_cache
\ No newline at end of file
@@ -0,0 +1,323 @@
+import heapq
+import itertools
+import logging
+import math
+import ntpath
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .backend import PlatformBackend, Rect
+from .monitors import Monitor
+from .window_events import WindowEvent, WindowEventSource, WindowEventType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_RECT = (100, 100, 900, 700)
+DEFAULT_MONITORS = [Monitor("\\\\.\\DISPLAY1", (0, 0, 1920, 1080), (0, 0, 1920, 1040), 96, True)]
+
+@dataclass(frozen=True)
+class Latency:
+    """A log-normal latency distribution, in seconds.
+
+    ``spread`` is the standard deviation of the logarithm; 0 makes every
+    sample equal to the median.
+    """
+    median: float
+    spread: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draws one latency."""
+        if self.spread <= 0:
+            return self.median
+        return self.median * math.exp(rng.gauss(0.0, self.spread))
+
+@dataclass
+class SimulatedApp:
+    """How a simulated executable behaves when launched."""
+    executable: str
+    startup: Latency = Latency(1.0, 0.3)
+    class_name: str = "SimulatedWindow"
+    title: Optional[str] = None
+    # A launcher process starts a child that owns the window, like many updaters do
+    launcher: bool = False
+    # Some apps move their window back to a saved rect shortly after it appears
+    restore_rect: Optional[Rect] = None
+    restore_delay: Latency = Latency(0.3)
+
+@dataclass
+class SimulatedWindow:
+    """A window on the simulated desktop."""
+    hwnd: int
+    pid: int
+    class_name: str
+    title: str
+    rect: Rect
+    visible: bool = False
+
+@dataclass
+class DesktopCounters:
+    """How often the placement code called into the simulated desktop."""
+    enumerations: int = 0
+    searches: int = 0
+    window_reads: int = 0
+    process_snapshots: int = 0
+    launches: int = 0
+    moves: int = 0
+
+    def reset(self) -> None:
+        """Zeroes every counter."""
+        for name in self.__dataclass_fields__:
+            setattr(self, name, 0)
+
+class _SimulatedEventSource(WindowEventSource):
+    """Window events from a simulated desktop."""
+
+    def __init__(self, desktop: 'SimulatedDesktop'):
+        super().__init__()
+        self.desktop = desktop
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self._running = True
+
+    def stop(self) -> None:
+        self._running = False
+
+class SimulatedDesktop(PlatformBackend):
+    """An in-memory desktop of processes and windows, for benchmarks and tests.
+
+    Launched apps show their window after a startup latency drawn from their
+    SimulatedApp profile (unknown executables get ``default_app``'s
+    behavior), and moving a window costs ``move_cost`` seconds. All
+    latencies and costs are divided by ``speed``, so a run can be compressed
+    in time without changing its order of events. The desktop runs on any
+    platform; install it with set_backend().
+    """
+
+    def __init__(self, apps: Iterable[SimulatedApp] = (), monitors: Optional[List[Monitor]] = None,
+                 speed: float = 1.0, move_cost: float = 0.002, seed: Optional[int] = None,
+                 default_app: Optional[SimulatedApp] = None):
+        self.apps = {self._key(app.executable): app for app in apps}
+        self.default_app = default_app or SimulatedApp("")
+        self.speed = speed
+        self.move_cost = move_cost
+        self.counters = DesktopCounters()
+        self.processes: Dict[int, Tuple[int, str]] = {}
+        self.windows: Dict[int, SimulatedWindow] = {}
+        self._monitors = list(monitors or DEFAULT_MONITORS)
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._sources: List[_SimulatedEventSource] = []
+        self._pids = itertools.count(1000, 4)
+        self._hwnds = itertools.count(0x10010, 2)
+        self._own_pid = os.getpid()
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._timer_ids = itertools.count()
+        self._timer_condition = threading.Condition(self._lock)
+        self._timer_thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @staticmethod
+    def _key(executable: str) -> str:
+        return ntpath.normcase(ntpath.normpath(executable))
+
+    def app_for(self, executable: str) -> SimulatedApp:
+        """Returns the profile of an executable."""
+        return self.apps.get(self._key(executable)) or replace(self.default_app, executable=executable)
+
+    def add_window(self, executable: str, rect: Rect = DEFAULT_WINDOW_RECT, title: Optional[str] = None,
+                   class_name: str = "SimulatedWindow", visible: bool = True) -> int:
+        """Adds a window of a new, already running process; returns its handle."""
+        with self._lock:
+            pid = next(self._pids)
+            self.processes[pid] = (self._own_pid, executable)
+        return self._create_window(pid, executable, rect, title, class_name, visible)
+
+    def destroy_window(self, hwnd: int) -> None:
+        """Destroys a window; its process keeps running."""
+        with self._lock:
+            if self.windows.pop(hwnd, None) is None:
+                return
+        self._emit(WindowEventType.DESTROY, hwnd)
+
+    def close(self) -> None:
+        """Stops the timer thread; pending app startups are dropped."""
+        with self._timer_condition:
+            self._closed = True
+            self._timers.clear()
+            self._timer_condition.notify_all()
+        if self._timer_thread is not None:
+            self._timer_thread.join()
+            self._timer_thread = None
+
+    def __enter__(self) -> 'SimulatedDesktop':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def list_windows(self) -> List[int]:
+        with self._lock:
+            self.counters.enumerations += 1
+            # Newest windows are on top, as on a real desktop
+            return list(reversed(list(self.windows)))
+
+    def is_window(self, hwnd: int) -> bool:
+        with self._lock:
+            return hwnd in self.windows
+
+    def window_state(self, hwnd: int) -> Tuple[str, Rect, bool]:
+        with self._lock:
+            self.counters.window_reads += 1
+            window = self._window(hwnd)
+            return window.title, window.rect, window.visible
+
+    def window_owner(self, hwnd: int) -> Tuple[int, str]:
+        with self._lock:
+            window = self._window(hwnd)
+            return window.pid, window.class_name
+
+    def process_image_path(self, pid: int) -> str:
+        with self._lock:
+            process = self.processes.get(pid)
+            return process[1] if process else ''
+
+    def process_parents(self) -> Dict[int, int]:
+        with self._lock:
+            self.counters.process_snapshots += 1
+            return {pid: parent for pid, (parent, _) in self.processes.items()}
+
+    def create_process(self, executable: str, arguments: str = "", working_dir: Optional[str] = None,
+                       show_command: Optional[int] = None) -> int:
+        app = self.app_for(executable)
+        with self._lock:
+            self.counters.launches += 1
+            pid = next(self._pids)
+            self.processes[pid] = (self._own_pid, executable)
+            startup = app.startup.sample(self._rng)
+            restore_delay = app.restore_delay.sample(self._rng)
+
+        owner = pid
+        if app.launcher:
+            with self._lock:
+                owner = next(self._pids)
+            # The child appears a little after the launcher and owns the window
+            self._schedule(startup / 4, lambda: self._spawn_child(pid, owner, executable))
+
+        def show() -> None:
+            if owner not in self.processes:
+                return
+            title = app.title if app.title is not None else ntpath.splitext(ntpath.basename(executable))[0]
+            hwnd = self._create_window(owner, executable, DEFAULT_WINDOW_RECT, title, app.class_name, True)
+            if app.restore_rect is not None:
+                self._schedule(restore_delay, lambda: self._set_rect(hwnd, app.restore_rect))
+
+        self._schedule(startup, show)
+        return pid
+
+    def shell_execute(self, path: str) -> Optional[int]:
+        return self.create_process(path)
+
+    def find_app_window(self, executable: str) -> Optional[int]:
+        # Like connecting by path: every process and window is examined
+        key = self._key(executable)
+        with self._lock:
+            self.counters.searches += 1
+            self.counters.enumerations += 1
+            for hwnd in reversed(list(self.windows)):
+                window = self.windows[hwnd]
+                self.counters.window_reads += 1
+                process = self.processes.get(window.pid)
+                if window.visible and process and key in (self._key(process[1]),
+                                                          self._key(ntpath.basename(process[1]))):
+                    return hwnd
+        return None
+
+    def move_window(self, hwnd: int, position: Tuple[int, int], size: Tuple[int, int]) -> None:
+        if self.move_cost > 0:
+            time.sleep(self.move_cost / self.speed)
+        with self._lock:
+            self.counters.moves += 1
+        self._set_rect(hwnd, (position[0], position[1], position[0] + size[0], position[1] + size[1]))
+
+    def monitors(self) -> List[Monitor]:
+        return list(self._monitors)
+
+    def create_event_source(self) -> Optional[WindowEventSource]:
+        source = _SimulatedEventSource(self)
+        with self._lock:
+            self._sources.append(source)
+        return source
+
+    def _window(self, hwnd: int) -> SimulatedWindow:
+        window = self.windows.get(hwnd)
+        if window is None:
+            raise OSError(f"Invalid window handle {hwnd}")
+        return window
+
+    def _spawn_child(self, parent: int, pid: int, executable: str) -> None:
+        with self._lock:
+            if parent in self.processes:
+                self.processes[pid] = (parent, executable)
+
+    def _create_window(self, pid: int, executable: str, rect: Rect, title: Optional[str],
+                       class_name: str, visible: bool) -> int:
+        if title is None:
+            title = ntpath.splitext(ntpath.basename(executable))[0]
+        with self._lock:
+            hwnd = next(self._hwnds)
+            self.windows[hwnd] = SimulatedWindow(hwnd, pid, class_name, title, rect, False)
+        self._emit(WindowEventType.CREATE, hwnd)
+        if visible:
+            with self._lock:
+                self.windows[hwnd].visible = True
+            self._emit(WindowEventType.SHOW, hwnd)
+        return hwnd
+
+    def _set_rect(self, hwnd: int, rect: Rect) -> None:
+        with self._lock:
+            self._window(hwnd).rect = tuple(rect)
+        self._emit(WindowEventType.LOCATION_CHANGE, hwnd)
+
+    def _emit(self, event_type: WindowEventType, hwnd: int) -> None:
+        # Listeners call back into the desktop, so they run without the lock held
+        with self._lock:
+            sources = [source for source in self._sources if source.running]
+        event = WindowEvent(event_type, hwnd, time.monotonic())
+        for source in sources:
+            source.emit(event)
+
+    def _schedule(self, delay: float, callback: Callable[[], None]) -> None:
+        """Runs callback on the timer thread after delay simulated seconds."""
+        with self._timer_condition:
+            if self._closed:
+                return
+            due = time.monotonic() + delay / self.speed
+            heapq.heappush(self._timers, (due, next(self._timer_ids), callback))
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._run_timers, name="simulated-desktop",
+                                                      daemon=True)
+                self._timer_thread.start()
+            self._timer_condition.notify_all()
+
+    def _run_timers(self) -> None:
+        while True:
+            with self._timer_condition:
+                while not self._closed and (not self._timers or self._timers[0][0] > time.monotonic()):
+                    timeout = self._timers[0][0] - time.monotonic() if self._timers else None
+                    self._timer_condition.wait(timeout)
+                if self._closed:
+                    return
+                _, _, callback = heapq.heappop(self._timers)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Simulated desktop event failed: {e}")
\ No newline at end of file
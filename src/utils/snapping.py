@@ -0,0 +1,84 @@
+import bisect
+import logging
+import os
+from typing import Iterable, List, Optional, Tuple
+
+from .desktop_capture import MINIMIZED_COORDINATE
+from .monitors import MonitorTopology
+
+logger = logging.getLogger(__name__)
+
+# Edges within this many pixels pull a dragged window onto them
+SNAP_DISTANCE = 10
+# Each monitor's work area is split into halves, thirds and quarters
+GRID_DIVISIONS = (2, 3, 4)
+
+class EdgeIndex:
+    """Sorted x and y edge coordinates, for nearest-edge lookups by bisection.
+
+    The index is built once, so each lookup while dragging is O(log n) no
+    matter how many windows are open.
+    """
+
+    def __init__(self, x_edges: Iterable[int] = (), y_edges: Iterable[int] = ()):
+        self.x_edges = sorted(set(x_edges))
+        self.y_edges = sorted(set(y_edges))
+
+    def __len__(self) -> int:
+        return len(self.x_edges) + len(self.y_edges)
+
+    @staticmethod
+    def _nearest(edges: List[int], value: int, distance: int) -> Optional[int]:
+        index = bisect.bisect_left(edges, value)
+        candidates = edges[max(0, index - 1):index + 1]
+        best = min(candidates, key=lambda edge: abs(edge - value), default=None)
+        return best if best is not None and abs(best - value) <= distance else None
+
+    def snap_span(self, start: int, length: int, vertical: bool = False,
+                  distance: int = SNAP_DISTANCE) -> int:
+        """Moves a span so whichever of its ends is closest to an edge lies on it."""
+        edges = self.y_edges if vertical else self.x_edges
+        low = self._nearest(edges, start, distance)
+        high = self._nearest(edges, start + length, distance)
+        if low is None and high is None:
+            return start
+        if high is None or (low is not None and abs(low - start) <= abs(high - start - length)):
+            return low
+        return high - length
+
+    def snap_end(self, start: int, length: int, vertical: bool = False,
+                 distance: int = SNAP_DISTANCE) -> int:
+        """Changes a span's length so its far end lies on a nearby edge."""
+        edges = self.y_edges if vertical else self.x_edges
+        end = self._nearest(edges, start + length, distance)
+        return length if end is None or end <= start else end - start
+
+def build_edge_index(topology: Optional[MonitorTopology] = None, windows: Iterable = (),
+                     grid: Tuple[int, ...] = GRID_DIVISIONS) -> EdgeIndex:
+    """Collects monitor edges, work-area grid lines and the edges of other windows.
+
+    Windows of this process (such as the selector itself) and minimized
+    windows are left out.
+    """
+    x_edges: List[int] = []
+    y_edges: List[int] = []
+    if topology is not None:
+        for monitor in topology.monitors:
+            for left, top, right, bottom in (monitor.rect, monitor.work_area):
+                x_edges += (left, right)
+                y_edges += (top, bottom)
+            left, top, right, bottom = monitor.work_area
+            for divisions in grid:
+                x_edges += (left + (right - left) * step // divisions for step in range(1, divisions))
+                y_edges += (top + (bottom - top) * step // divisions for step in range(1, divisions))
+
+    own_pid = os.getpid()
+    for window in windows:
+        if window.pid == own_pid:
+            continue
+        left, top, right, bottom = window.rect
+        if right <= left or bottom <= top or left <= MINIMIZED_COORDINATE:
+            continue
+        x_edges += (left, right)
+        y_edges += (top, bottom)
+    return EdgeIndex(x_edges, y_edges)
\ No newline at end of file
@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .backend import current_backend
+from .config_manager import AppConfig
+from .layout_diff import DEFAULT_TOLERANCE, rect_matches
+from .window_events import WindowEvent, WindowEventSource, WindowEventType
+from .window_manager import WindowManager, WindowPlacement
+
+logger = logging.getLogger(__name__)
+
+# Seconds a placed window is watched for drift
+DEFAULT_WATCH_PERIOD = 3.0
+# Corrections per window unless its config sets retries
+DEFAULT_MAX_RETRIES = 2
+# A window must stop moving for this long before its rect is checked
+SETTLE_DELAY = 0.15
+
+@dataclass
+class _Watch:
+    config: AppConfig
+    retries: int
+    deadline: float
+    moved_at: Optional[float] = None
+    corrections: int = 0
+    on_done: Optional[Callable[[int], None]] = None
+
+def _window_rect(hwnd: int) -> Optional[Tuple[int, int, int, int]]:
+    backend = current_backend()
+    if not backend.is_window(hwnd):
+        return None
+    return backend.window_state(hwnd)[1]
+
+def _place(hwnd: int, config: AppConfig) -> bool:
+    return WindowManager.place_windows([WindowPlacement(hwnd, config.position, config.size)])[0].success
+
+class PlacementStabilizer:
+    """Keeps freshly placed windows in place while their apps finish starting.
+
+    Many apps restore their own saved geometry a moment after their window
+    appears. Each watched window is checked only after a LOCATION_CHANGE
+    event for it has settled, and moved back if it drifted, at most its
+    config's ``retries`` (or max_retries) times. Nothing polls: the watcher
+    thread sleeps until an event arrives or a watch expires, and exits when
+    no windows are watched. LOCATION_CHANGE events are only requested from
+    the attached sources while some window is watched.
+    """
+
+    def __init__(self, watch_period: float = DEFAULT_WATCH_PERIOD, max_retries: int = DEFAULT_MAX_RETRIES,
+                 tolerance: int = DEFAULT_TOLERANCE, settle_delay: float = SETTLE_DELAY,
+                 get_rect: Callable[[int], Optional[Tuple[int, int, int, int]]] = _window_rect,
+                 place: Callable[[int, AppConfig], bool] = _place):
+        self.watch_period = watch_period
+        self.max_retries = max_retries
+        self.tolerance = tolerance
+        self.settle_delay = settle_delay
+        self.get_rect = get_rect
+        self.place = place
+        self._watches: Dict[int, _Watch] = {}
+        self._sources: List[WindowEventSource] = []
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, source: WindowEventSource) -> None:
+        """Subscribes to a window event source."""
+        source.add_listener(self._on_event)
+        with self._condition:
+            self._sources.append(source)
+            if self._watches:
+                source.request_location_changes()
+
+    def detach(self, source: WindowEventSource) -> None:
+        """Unsubscribes from a window event source."""
+        source.remove_listener(self._on_event)
+        with self._condition:
+            if source in self._sources:
+                self._sources.remove(source)
+                if self._watches:
+                    source.release_location_changes()
+
+    def watch(self, hwnd: int, config: AppConfig, on_done: Optional[Callable[[int], None]] = None) -> None:
+        """Starts watching a window that was just moved to its config's rect.
+
+        on_done is called with the number of corrections once the watch ends;
+        it runs on the watcher thread and must not block.
+        """
+        retries = self.max_retries if config.retries is None else config.retries
+        if retries <= 0 or self.watch_period <= 0:
+            if on_done is not None:
+                on_done(0)
+            return
+        with self._condition:
+            if not self._watches:
+                for source in self._sources:
+                    source.request_location_changes()
+            self._watches[hwnd] = _Watch(config, retries, time.monotonic() + self.watch_period, on_done=on_done)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="placement-stabilizer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def wait(self, cancel_event: Optional[threading.Event] = None) -> None:
+        """Blocks until every watch has expired, or until cancelled."""
+        with self._condition:
+            while self._watches and not (cancel_event is not None and cancel_event.is_set()):
+                self._condition.wait()
+
+    def stop(self) -> None:
+        """Drops every watch."""
+        with self._condition:
+            for hwnd in list(self._watches):
+                self._end(hwnd)
+            self._condition.notify_all()
+
+    def _on_event(self, event: WindowEvent) -> None:
+        if event.type not in (WindowEventType.LOCATION_CHANGE, WindowEventType.DESTROY):
+            return
+        with self._condition:
+            watch = self._watches.get(event.hwnd)
+            if watch is None:
+                return
+            if event.type == WindowEventType.DESTROY:
+                self._end(event.hwnd)
+            else:
+                # Checked once the window has been still for settle_delay
+                watch.moved_at = event.timestamp
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        with self._condition:
+            while self._watches:
+                now = time.monotonic()
+                due = [hwnd for hwnd, watch in self._watches.items()
+                       if watch.moved_at is not None and now - watch.moved_at >= self.settle_delay]
+                for hwnd in due:
+                    self._check(hwnd, self._watches[hwnd])
+                for hwnd, watch in list(self._watches.items()):
+                    if watch.moved_at is None and now >= watch.deadline:
+                        self._end(hwnd)
+                if not self._watches:
+                    break
+
+                wakeups = [watch.moved_at + self.settle_delay if watch.moved_at is not None else watch.deadline
+                           for watch in self._watches.values()]
+                self._condition.wait(max(0.0, min(wakeups) - time.monotonic()))
+            self._thread = None
+            self._condition.notify_all()
+
+    def _check(self, hwnd: int, watch: _Watch) -> None:
+        """Moves a settled window back if it drifted; called with the lock held."""
+        watch.moved_at = None
+        try:
+            rect = self.get_rect(hwnd)
+            if rect is None:
+                self._end(hwnd)
+                return
+            if rect_matches(rect, watch.config.position, watch.config.size, self.tolerance):
+                return
+            if watch.corrections >= watch.retries:
+                logger.warning(f"{watch.config.shortcut_path} keeps moving its window; giving up after "
+                               f"{watch.corrections} corrections")
+                self._end(hwnd)
+                return
+            watch.corrections += 1
+            logger.info(f"{watch.config.shortcut_path} moved its window to {rect}; "
+                        f"restoring it (correction {watch.corrections}/{watch.retries})")
+            if not self.place(hwnd, watch.config):
+                self._end(hwnd)
+                return
+            # Keep watching for the app's next attempt
+            watch.deadline = max(watch.deadline, time.monotonic() + self.watch_period)
+        except Exception as e:
+            logger.error(f"Failed to stabilize window {hwnd}: {e}")
+            self._end(hwnd)
+
+    def _end(self, hwnd: int) -> None:
+        """Drops a watch and reports its corrections; called with the lock held."""
+        watch = self._watches.pop(hwnd, None)
+        if watch is not None and not self._watches:
+            for source in self._sources:
+                source.release_location_changes()
+        if watch is not None and watch.on_done is not None:
+            try:
+                watch.on_done(watch.corrections)
+            except Exception as e:
+                logger.error(f"Stabilizer callback for window {hwnd} failed: {e}")
\ No newline at end of file
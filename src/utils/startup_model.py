@@ -0,0 +1,122 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from .config_manager import AppConfig
+from .paths import app_data_dir
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SUFFIX = ".startup.json"
+DEFAULT_HISTORY_FILE = "startup_history.json"
+
+@dataclass
+class StartupStats:
+    """Smoothed startup timings of one app, in seconds since launch."""
+    first_window: float
+    # Until the window was placed; apps may still move it afterwards
+    placed: float
+    samples: int = 1
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StartupStats':
+        """Create stats from a dictionary, including histories that call placed stable_window."""
+        placed = data['placed'] if 'placed' in data else data['stable_window']
+        return cls(data['first_window'], placed, data.get('samples', 1))
+
+class StartupHistory:
+    """Observed per-app startup times, keyed by shortcut path.
+
+    Timings are exponentially weighted so the model follows apps that get
+    faster or slower over time. The history is stored as JSON next to the
+    layout file it belongs to.
+    """
+
+    def __init__(self, path: Optional[str] = None, smoothing: float = 0.3, default_estimate: float = 2.0):
+        self.path = path
+        self.smoothing = smoothing
+        self.default_estimate = default_estimate
+        self._stats: Dict[str, StartupStats] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def for_layout(cls, layout_path: Optional[str]) -> 'StartupHistory':
+        """Returns the history stored next to a layout file (or a per-user default)."""
+        if layout_path:
+            path = os.path.splitext(os.path.abspath(layout_path))[0] + HISTORY_SUFFIX
+        else:
+            path = os.path.join(app_data_dir(), DEFAULT_HISTORY_FILE)
+        return cls(path)
+
+    def record(self, shortcut_path: str, first_window: float, placed: float) -> None:
+        """Folds one observed launch into the model."""
+        with self._lock:
+            stats = self._stats.get(shortcut_path)
+            if stats is None:
+                self._stats[shortcut_path] = StartupStats(first_window, placed)
+                return
+            alpha = self.smoothing
+            stats.first_window += alpha * (first_window - stats.first_window)
+            stats.placed += alpha * (placed - stats.placed)
+            stats.samples += 1
+
+    def get(self, shortcut_path: str) -> Optional[StartupStats]:
+        """Returns the model for an app, or None if it was never observed."""
+        with self._lock:
+            return self._stats.get(shortcut_path)
+
+    def expected_duration(self, shortcut_path: str) -> float:
+        """Returns the expected seconds from launch to a placed window."""
+        stats = self.get(shortcut_path)
+        return stats.placed if stats else self.default_estimate
+
+    def timeout_for(self, shortcut_path: str, default: float, factor: float = 3.0,
+                    maximum: float = 120.0) -> float:
+        """Returns a window timeout scaled to the app's history.
+
+        The configured default is a floor: history only lengthens the timeout
+        of apps that have been slow, up to maximum.
+        """
+        stats = self.get(shortcut_path)
+        if stats is None:
+            return default
+        return max(default, min(maximum, factor * stats.placed))
+
+    def poll_interval_for(self, shortcut_path: str, default: float) -> float:
+        """Returns a poll interval scaled to the app's expected startup time."""
+        stats = self.get(shortcut_path)
+        if stats is None:
+            return default
+        return min(0.5, max(0.05, stats.first_window / 20))
+
+    def critical_path_order(self, configs: List[AppConfig]) -> List[AppConfig]:
+        """Orders configs slowest first, so the longest startups overlap the rest."""
+        return sorted(configs, key=lambda config: self.expected_duration(config.shortcut_path), reverse=True)
+
+    def save(self) -> None:
+        """Writes the history next to its layout."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {path: asdict(stats) for path, stats in self._stats.items()}
+        try:
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, indent=4)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save startup history: {e}")
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self._stats = {path: StartupStats.from_dict(stats) for path, stats in data.items()}
+        except Exception as e:
+            logger.error(f"Ignoring unreadable startup history {self.path}: {e}")
\ No newline at end of file
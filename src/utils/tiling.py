@@ -0,0 +1,233 @@
+import logging
+import math
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
+
+from .config_manager import UNITS_PIXELS, AppConfig
+from .monitors import Monitor, MonitorTopology
+
+logger = logging.getLogger(__name__)
+
+# (x, y, width, height); fractional until the final rounding
+Cell = Tuple[float, float, float, float]
+
+DEFAULT_ASPECT = 16 / 10
+# Penalty per unit of relative shortfall below a window's minimum size
+MIN_SIZE_PENALTY = 10.0
+# Largest number of windows per monitor searched exhaustively in "auto" mode;
+# 4 takes about 1 ms per monitor, 5 about 5 ms and 6 about 25 ms
+OPTIMAL_MAX_ITEMS = 4
+# Largest number searched even in "optimal" mode; each extra window costs about 4x the time
+OPTIMAL_HARD_LIMIT = 8
+# Memo keys round cell sizes to this many pixels in the exhaustive search
+OPTIMAL_SIZE_QUANTUM = 4
+
+TILING_MODES = ("auto", "fast", "optimal")
+
+@dataclass
+class _Item:
+    index: int
+    weight: float
+    aspect: float
+    min_size: Tuple[int, int]
+    max_size: Optional[Tuple[int, int]]
+    priority: int
+
+def _item_for(index: int, config: AppConfig, gap: int) -> _Item:
+    tile = config.tile
+    # Cells include the gap around their window
+    min_size = (tile.min_size[0] + gap, tile.min_size[1] + gap) if tile and tile.min_size else (0, 0)
+    return _Item(
+        index=index,
+        weight=tile.area if tile else 1.0,
+        aspect=tile.aspect if tile and tile.aspect else DEFAULT_ASPECT,
+        min_size=min_size,
+        max_size=tile.max_size if tile else None,
+        priority=config.priority
+    )
+
+def _leaf_cost(item: _Item, width: float, height: float) -> float:
+    """How badly a cell suits a window: aspect mismatch plus minimum-size shortfall."""
+    if width <= 0 or height <= 0:
+        return math.inf
+    cost = abs(math.log((width / height) / item.aspect))
+    min_width, min_height = item.min_size
+    if width < min_width:
+        cost += MIN_SIZE_PENALTY * (min_width - width) / min_width
+    if height < min_height:
+        cost += MIN_SIZE_PENALTY * (min_height - height) / min_height
+    return cost * item.weight
+
+def _split(cell: Cell, first: List[_Item], second: List[_Item], vertical: bool) -> Tuple[Cell, Cell]:
+    """Divides a cell between two groups in proportion to their weights.
+
+    A vertical split places the groups side by side. The split line is moved,
+    where possible, so that neither side is smaller than its largest member's
+    minimum size.
+    """
+    x, y, width, height = cell
+    total = width if vertical else height
+    axis = 0 if vertical else 1
+    first_weight = sum(item.weight for item in first)
+    length = total * first_weight / (first_weight + sum(item.weight for item in second))
+    first_min = max(item.min_size[axis] for item in first)
+    second_min = max(item.min_size[axis] for item in second)
+    if first_min + second_min <= total:
+        length = min(max(length, first_min), total - second_min)
+    if vertical:
+        return (x, y, length, height), (x + length, y, width - length, height)
+    return (x, y, width, length), (x, y + length, width, height - length)
+
+def _partition(items: List[_Item]) -> Tuple[List[_Item], List[_Item]]:
+    """Splits items into two groups of similar total weight, highest priority first."""
+    first: List[_Item] = []
+    second: List[_Item] = []
+    first_weight = second_weight = 0.0
+    for item in items:
+        if first_weight <= second_weight:
+            first.append(item)
+            first_weight += item.weight
+        else:
+            second.append(item)
+            second_weight += item.weight
+    return first, second
+
+def _solve_fast(items: List[_Item], cell: Cell) -> Tuple[float, List[Tuple[_Item, Cell]]]:
+    """Binary space partitioning with a weight-balanced split at each node.
+
+    Both split orientations are tried at every node and the cheaper subtree
+    is kept, which is O(n^2) leaf evaluations in the worst case.
+    """
+    if len(items) == 1:
+        return _leaf_cost(items[0], cell[2], cell[3]), [(items[0], cell)]
+    first, second = _partition(items)
+    best: Tuple[float, List[Tuple[_Item, Cell]]] = (math.inf, [])
+    for vertical in (cell[2] >= cell[3], cell[2] < cell[3]):
+        first_cell, second_cell = _split(cell, first, second, vertical)
+        first_cost, first_tiles = _solve_fast(first, first_cell)
+        second_cost, second_tiles = _solve_fast(second, second_cell)
+        if first_cost + second_cost < best[0]:
+            best = (first_cost + second_cost, first_tiles + second_tiles)
+    return best
+
+def _solve_optimal(items: List[_Item], cell: Cell) -> Tuple[float, List[Tuple[_Item, Cell]]]:
+    """Searches every guillotine partition of the items for the cheapest one."""
+    memo: Dict[Tuple[int, int, int], Tuple[float, Optional[Tuple[int, bool]]]] = {}
+
+    def members(mask: int) -> List[_Item]:
+        return [item for bit, item in enumerate(items) if mask >> bit & 1]
+
+    def best(mask: int, width: float, height: float) -> Tuple[float, Optional[Tuple[int, bool]]]:
+        key = (mask, round(width / OPTIMAL_SIZE_QUANTUM), round(height / OPTIMAL_SIZE_QUANTUM))
+        if key in memo:
+            return memo[key]
+        group = members(mask)
+        if len(group) == 1:
+            memo[key] = (_leaf_cost(group[0], width, height), None)
+            return memo[key]
+
+        result: Tuple[float, Optional[Tuple[int, bool]]] = (math.inf, None)
+        lowest = mask & -mask
+        # Each unordered split is visited once: the first side always holds the lowest item
+        subset = (mask - 1) & mask
+        while subset:
+            if subset & lowest:
+                first, second = members(subset), members(mask ^ subset)
+                for vertical in (True, False):
+                    first_cell, second_cell = _split((0.0, 0.0, width, height), first, second, vertical)
+                    cost = (best(subset, first_cell[2], first_cell[3])[0] +
+                            best(mask ^ subset, second_cell[2], second_cell[3])[0])
+                    if cost < result[0]:
+                        result = (cost, (subset, vertical))
+            subset = (subset - 1) & mask
+        memo[key] = result
+        return result
+
+    def build(mask: int, cell: Cell) -> List[Tuple[_Item, Cell]]:
+        _, choice = best(mask, cell[2], cell[3])
+        if choice is None:
+            return [(members(mask)[0], cell)]
+        subset, vertical = choice
+        first, second = subset, mask ^ subset
+        # The group with the highest-priority app (items are in priority order) takes the top/left side
+        if second & -second < first & -first:
+            first, second = second, first
+        first_cell, second_cell = _split(cell, members(first), members(second), vertical)
+        return build(first, first_cell) + build(second, second_cell)
+
+    full = (1 << len(items)) - 1
+    return best(full, cell[2], cell[3])[0], build(full, cell)
+
+def _assign_monitors(configs: List[AppConfig], items: List[_Item],
+                     monitors: List[Monitor], topology: MonitorTopology) -> Dict[Monitor, List[_Item]]:
+    """Distributes items over monitors in proportion to their work areas.
+
+    Apps with a preferred monitor go there; the rest are placed, highest
+    priority first, on the monitor with the least weight per pixel.
+    """
+    groups: Dict[Monitor, List[_Item]] = {monitor: [] for monitor in monitors}
+    load = {monitor: 0.0 for monitor in monitors}
+
+    def area(monitor: Monitor) -> int:
+        left, top, right, bottom = monitor.work_area
+        return max(1, (right - left) * (bottom - top))
+
+    for item in items:
+        tile = configs[item.index].tile
+        monitor = topology.select(tile.monitor) if tile and tile.monitor is not None else None
+        if monitor not in groups:
+            monitor = min(monitors, key=lambda m: ((load[m] + item.weight) / area(m), not m.primary))
+        groups[monitor].append(item)
+        load[monitor] += item.weight
+    return groups
+
+def solve_tiling(configs: List[AppConfig], topology: MonitorTopology, gap: int = 8, mode: str = "auto",
+                 monitors: Optional[List[Monitor]] = None) -> List[AppConfig]:
+    """Computes a non-overlapping tiling of the configs' windows.
+
+    Windows are spread over the monitors (all of the topology's by default),
+    and each monitor's work area is cut into one cell per window with
+    guillotine splits. Cell areas follow each app's tile ``area`` weight, and
+    splits favor each app's preferred aspect ratio and minimum size. Higher
+    priority apps are placed first, towards the top left. A window with a
+    maximum size is centered in its cell. "fast" uses a balanced binary space
+    partition, "optimal" searches all guillotine partitions (exponential, for
+    small layouts; monitors with more than OPTIMAL_HARD_LIMIT windows fall
+    back to the fast partition), and "auto" picks the search when a monitor
+    has at most OPTIMAL_MAX_ITEMS windows. Returns the configs with absolute
+    pixel positions and sizes.
+    """
+    if mode not in TILING_MODES:
+        raise ValueError(f"Unknown tiling mode: {mode}")
+    items = sorted((_item_for(index, config, gap) for index, config in enumerate(configs)),
+                   key=lambda item: (-item.priority, -item.weight, item.index))
+    groups = _assign_monitors(configs, items, monitors or topology.monitors, topology)
+
+    tiled: List[Optional[AppConfig]] = [None] * len(configs)
+    half_gap = gap / 2
+    for monitor, group in groups.items():
+        if not group:
+            continue
+        left, top, right, bottom = monitor.work_area
+        area: Cell = (left + half_gap, top + half_gap, right - left - gap, bottom - top - gap)
+        optimal = mode == "optimal" or (mode == "auto" and len(group) <= OPTIMAL_MAX_ITEMS)
+        if optimal and len(group) > OPTIMAL_HARD_LIMIT:
+            logger.warning(f"{len(group)} windows on {monitor.device} are too many to search every tiling "
+                           f"(at most {OPTIMAL_HARD_LIMIT}); using the fast partition")
+            optimal = False
+        cost, tiles = (_solve_optimal if optimal else _solve_fast)(group, area)
+        logger.debug(f"Tiled {len(group)} windows on {monitor.device} (cost {cost:.3f})")
+
+        for item, (x, y, width, height) in tiles:
+            # Round cell edges, not sizes, so neighbouring cells stay exactly gap apart
+            x0, y0 = round(x + half_gap), round(y + half_gap)
+            x1, y1 = round(x + width - half_gap), round(y + height - half_gap)
+            cell_width, cell_height = max(1, x1 - x0), max(1, y1 - y0)
+            window_width, window_height = cell_width, cell_height
+            if item.max_size:
+                window_width = min(window_width, item.max_size[0])
+                window_height = min(window_height, item.max_size[1])
+            position = (x0 + (cell_width - window_width) // 2, y0 + (cell_height - window_height) // 2)
+            tiled[item.index] = replace(configs[item.index], position=position,
+                                        size=(window_width, window_height), units=UNITS_PIXELS, monitor=None)
+    return tiled
\ No newline at end of file
@@ -0,0 +1,190 @@
+import json
+import logging
+import ntpath
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from .config_manager import AppConfig
+
+logger = logging.getLogger(__name__)
+
+# Per-app phases, in the order they happen
+PHASES = ("queued", "resolve", "spawn", "first window", "matched", "placed", "stabilized")
+# Spans of the run as a whole are recorded on this row
+LAYOUT_ROW = "layout"
+
+@dataclass
+class Span:
+    """One timed phase of a run, in seconds since the trace started."""
+    row: str
+    name: str
+    start: float
+    end: float
+    args: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+class PlacementTrace:
+    """Spans and counters of one placement run.
+
+    Every app gets its own row, labelled after its shortcut. Recording a span
+    is a clock read and a list append, so tracing can stay on for real runs.
+    The trace exports as Chrome trace_event JSON (chrome://tracing or
+    Perfetto) and as a per-app summary table.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+        self.counters: Dict[str, int] = {}
+        self.rows: List[str] = [LAYOUT_ROW]
+        self._labels: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        """Returns the seconds since the trace started."""
+        return time.perf_counter() - self.origin
+
+    def row_for(self, config: Optional[AppConfig]) -> str:
+        """Returns the row label of a config, numbering apps that share a shortcut name."""
+        if config is None:
+            return LAYOUT_ROW
+        with self._lock:
+            label = self._labels.get(id(config))
+            if label is None:
+                base = ntpath.basename(config.shortcut_path) or config.shortcut_path
+                label = base
+                suffix = 2
+                while label in self.rows:
+                    label = f"{base} #{suffix}"
+                    suffix += 1
+                self._labels[id(config)] = label
+                self.rows.append(label)
+            return label
+
+    def add_span(self, config: Optional[AppConfig], name: str, start: float, end: float, **args) -> None:
+        """Records a phase that ran from start to end (seconds since the trace started)."""
+        span = Span(self.row_for(config), name, start, end, args)
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, config: Optional[AppConfig], name: str, **args) -> Iterator[Dict[str, object]]:
+        """Times the enclosed block; the yielded dict can add arguments to the span."""
+        start = self.now()
+        try:
+            yield args
+        finally:
+            self.add_span(config, name, start, self.now(), **args)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Adds to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other: 'PlacementTrace') -> None:
+        """Adds another trace's rows, spans and counters, e.g. one recorded by the daemon."""
+        with self._lock:
+            self.rows.extend(row for row in other.rows if row not in self.rows)
+            self.spans.extend(other.spans)
+            for name, value in other.counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def phase_totals(self) -> Dict[str, Dict[str, float]]:
+        """Returns the seconds each app spent in each phase."""
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            phases = totals.setdefault(span.row, {})
+            phases[span.name] = phases.get(span.name, 0.0) + span.duration
+        return totals
+
+    def app_extents(self) -> Dict[str, float]:
+        """Returns each row's wall-clock extent, from its first span's start to its last span's end."""
+        starts: Dict[str, float] = {}
+        ends: Dict[str, float] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            starts[span.row] = min(starts.get(span.row, span.start), span.start)
+            ends[span.row] = max(ends.get(span.row, span.end), span.end)
+        return {row: ends[row] - starts[row] for row in starts}
+
+    def format_summary(self) -> str:
+        """Renders a table of per-app phase times in milliseconds, slowest app first."""
+        totals = self.phase_totals()
+        extents = self.app_extents()
+        phases = [phase for phase in PHASES if any(phase in row for row in totals.values())]
+        width = max([len(row) for row in totals] + [len("app")])
+        lines = [f"{'app':<{width}} " + " ".join(f"{phase:>12}" for phase in phases) + f" {'total':>9}"]
+        apps = sorted((row for row in totals if row != LAYOUT_ROW), key=lambda row: extents[row], reverse=True)
+        for row in apps:
+            cells = " ".join(f"{totals[row][phase] * 1000:>12.1f}" if phase in totals[row] else f"{'-':>12}"
+                             for phase in phases)
+            lines.append(f"{row:<{width}} {cells} {extents[row] * 1000:>9.1f}")
+        if LAYOUT_ROW in totals:
+            run_phases = ", ".join(f"{name} {seconds * 1000:.1f}" for name, seconds in totals[LAYOUT_ROW].items())
+            lines.append(f"run: {run_phases} ms")
+        if self.counters:
+            lines.append("counters: " + ", ".join(f"{name} {value}" for name, value in sorted(self.counters.items())))
+        if apps:
+            phase_sums = {phase: sum(totals[row].get(phase, 0.0) for row in apps) for phase in phases}
+            dominant = max(phase_sums, key=phase_sums.get)
+            lines.append(f"slowest app: {apps[0]}; most time overall in: {dominant}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Converts the trace to Chrome trace_event JSON; each row becomes a thread."""
+        with self._lock:
+            spans = list(self.spans)
+            counters = dict(self.counters)
+            rows = list(self.rows)
+        tids = {row: index for index, row in enumerate(rows)}
+        events = [{"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "auto-placer"}}]
+        events += [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": row}}
+                   for row, tid in tids.items()]
+        events += [{"name": span.name, "cat": "placement", "ph": "X", "pid": 1, "tid": tids[span.row],
+                    "ts": round(span.start * 1e6, 1), "dur": round(span.duration * 1e6, 1), "args": span.args}
+                   for span in spans]
+        end = max([span.end for span in spans] + [0.0])
+        events += [{"name": name, "ph": "C", "pid": 1, "tid": 0, "ts": round(end * 1e6, 1), "args": {name: value}}
+                   for name, value in counters.items()]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PlacementTrace':
+        """Rebuilds a trace from its Chrome trace_event JSON."""
+        trace = cls()
+        names: Dict[int, str] = {}
+        for event in data.get("traceEvents", []):
+            if event.get("ph") == "M" and event.get("name") == "thread_name":
+                names[event["tid"]] = event["args"]["name"]
+        trace.rows = [names[tid] for tid in sorted(names)] or [LAYOUT_ROW]
+        for event in data.get("traceEvents", []):
+            if event.get("ph") == "X":
+                start = event["ts"] / 1e6
+                trace.spans.append(Span(names.get(event["tid"], LAYOUT_ROW), event["name"], start,
+                                        start + event["dur"] / 1e6, dict(event.get("args") or {})))
+            elif event.get("ph") == "C":
+                for name, value in event["args"].items():
+                    trace.counters[name] = value
+        return trace
+
+    def save(self, path: str) -> None:
+        """Writes the trace as a Chrome trace_event JSON file."""
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f)
+        except Exception as e:
+            logger.error(f"Failed to save trace: {e}")
+            raise
+
+def traced(trace: Optional[PlacementTrace], config: Optional[AppConfig], name: str, **args):
+    """Returns trace.span(...), or a no-op context when the run is not traced."""
+    return trace.span(config, name, **args) if trace is not None else nullcontext(args)
\ No newline at end of file
@@ -0,0 +1,278 @@
+import ctypes
+import logging
+import threading
+import time
+from ctypes import wintypes
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class WindowEventType(Enum):
+    """Kinds of top-level window events delivered by a WindowEventSource."""
+    CREATE = 'create'
+    DESTROY = 'destroy'
+    SHOW = 'show'
+    NAME_CHANGE = 'name_change'
+    LOCATION_CHANGE = 'location_change'
+
+@dataclass(frozen=True)
+class WindowEvent:
+    """A single top-level window event."""
+    type: WindowEventType
+    hwnd: int
+    timestamp: float
+
+WindowEventListener = Callable[[WindowEvent], None]
+
+class WindowEventSource:
+    """Delivers top-level window events to registered listeners.
+
+    Listeners are called on the source's own thread and should return quickly.
+    Windows move constantly, so LOCATION_CHANGE events are only delivered
+    while some listener has asked for them with request_location_changes().
+    """
+
+    def __init__(self):
+        self._listeners: List[WindowEventListener] = []
+        self._location_requests = 0
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: WindowEventListener) -> None:
+        """Registers a callback for every event."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: WindowEventListener) -> None:
+        """Unregisters a callback."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    @property
+    def wants_location_changes(self) -> bool:
+        """True while LOCATION_CHANGE events are requested."""
+        return self._location_requests > 0
+
+    def request_location_changes(self) -> None:
+        """Starts delivering LOCATION_CHANGE events until the matching release_location_changes()."""
+        with self._lock:
+            self._location_requests += 1
+            if self._location_requests == 1:
+                self._location_changes_wanted(True)
+
+    def release_location_changes(self) -> None:
+        """Withdraws a request_location_changes()."""
+        with self._lock:
+            if self._location_requests == 0:
+                return
+            self._location_requests -= 1
+            if self._location_requests == 0:
+                self._location_changes_wanted(False)
+
+    def _location_changes_wanted(self, wanted: bool) -> None:
+        """Called with the lock held when LOCATION_CHANGE events become wanted or unwanted."""
+
+    def emit(self, event: WindowEvent) -> None:
+        """Delivers an event to all listeners."""
+        if event.type == WindowEventType.LOCATION_CHANGE and not self.wants_location_changes:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Window event listener failed on {event}: {e}")
+
+    @property
+    def running(self) -> bool:
+        """True while the source is started."""
+        return False
+
+    def start(self) -> None:
+        """Starts delivering events."""
+
+    def stop(self) -> None:
+        """Stops delivering events."""
+
+    def __enter__(self) -> 'WindowEventSource':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+class ScriptedEventSource(WindowEventSource):
+    """A window event source driven by explicit calls or a timed script."""
+
+    def play(self, script: Iterable[Tuple[float, WindowEventType, int]], speed: float = 1.0) -> threading.Thread:
+        """Emits (delay_seconds, type, hwnd) entries on a background thread.
+
+        Delays are measured from the start of playback and divided by speed.
+        """
+        entries = sorted(script, key=lambda entry: entry[0])
+
+        def run() -> None:
+            start = time.monotonic()
+            for delay, event_type, hwnd in entries:
+                remaining = start + delay / speed - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                self.emit(WindowEvent(event_type, hwnd, time.monotonic()))
+
+        thread = threading.Thread(target=run, name="scripted-window-events", daemon=True)
+        thread.start()
+        return thread
+
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+WINEVENT_FLAGS = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_ROOT = 2
+PM_NOREMOVE = 0x0000
+WM_QUIT = 0x0012
+WM_APP = 0x8000
+# Posted to the hook thread to install or remove the LOCATIONCHANGE hook
+WM_UPDATE_LOCATION_HOOK = WM_APP + 1
+
+_WIN_EVENT_TYPES = {
+    EVENT_OBJECT_CREATE: WindowEventType.CREATE,
+    EVENT_OBJECT_DESTROY: WindowEventType.DESTROY,
+    EVENT_OBJECT_SHOW: WindowEventType.SHOW,
+    EVENT_OBJECT_LOCATIONCHANGE: WindowEventType.LOCATION_CHANGE,
+    EVENT_OBJECT_NAMECHANGE: WindowEventType.NAME_CHANGE,
+}
+
+class WinEventHookSource(WindowEventSource):
+    """Window events from SetWinEventHook, pumped on a dedicated thread.
+
+    The hook thread sleeps in GetMessage, so waiting for windows costs no CPU.
+    The LOCATIONCHANGE hook is only installed while location changes are
+    requested, so moves elsewhere on the desktop do not wake the thread.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._callback = None
+
+    @property
+    def running(self) -> bool:
+        """True while the hook thread is installed."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Installs the hooks and starts the message loop.
+
+        Raises the hook thread's error if the hooks could not be set up, so
+        callers can fall back to polling.
+        """
+        if self._thread is not None:
+            return
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="winevent-hook", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+
+    def stop(self) -> None:
+        """Removes the hooks and stops the message loop."""
+        if self._thread is None:
+            return
+        ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread.join()
+        self._thread = None
+        self._thread_id = 0
+
+    def _location_changes_wanted(self, wanted: bool) -> None:
+        if self._thread_id:
+            # The hook thread reads the current request count, so stale messages are harmless
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_UPDATE_LOCATION_HOOK, 0, 0)
+
+    def _run(self) -> None:
+        hooks = []
+        location_hook = None
+        try:
+            user32 = ctypes.windll.user32
+            user32.SetWinEventHook.restype = wintypes.HANDLE
+            user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+            user32.GetAncestor.restype = wintypes.HWND
+            win_event_proc = ctypes.WINFUNCTYPE(
+                None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+            )
+            # Keep a reference so the callback is not garbage collected while hooked
+            self._callback = win_event_proc(self._handle)
+
+            msg = wintypes.MSG()
+            # Create the message queue before anyone can post to this thread
+            user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+            self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+            hooks = [
+                user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, None, self._callback, 0, 0,
+                                       WINEVENT_FLAGS),
+                user32.SetWinEventHook(EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE, None, self._callback, 0, 0,
+                                       WINEVENT_FLAGS),
+            ]
+            if not all(hooks):
+                logger.error("Failed to install window event hooks")
+            location_hook = self._update_location_hook(location_hook)
+        except Exception as e:
+            logger.error(f"Failed to set up window event hooks: {e}")
+            self._error = e
+            return
+        finally:
+            self._ready.set()
+
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_UPDATE_LOCATION_HOOK:
+                    location_hook = self._update_location_hook(location_hook)
+                    continue
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks + [location_hook]:
+                if hook:
+                    user32.UnhookWinEvent(hook)
+
+    def _update_location_hook(self, hook):
+        """Installs or removes the LOCATIONCHANGE hook to match the requests; runs on the hook thread."""
+        user32 = ctypes.windll.user32
+        if self.wants_location_changes and not hook:
+            hook = user32.SetWinEventHook(EVENT_OBJECT_LOCATIONCHANGE, EVENT_OBJECT_LOCATIONCHANGE, None,
+                                          self._callback, 0, 0, WINEVENT_FLAGS)
+            if not hook:
+                logger.error("Failed to install the window location hook")
+        elif not self.wants_location_changes and hook:
+            user32.UnhookWinEvent(hook)
+            hook = None
+        return hook
+
+    def _handle(self, hook, event, hwnd, id_object, id_child, thread_id, event_time) -> None:
+        if not hwnd or id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+        # Events queued before the location hook was removed
+        if event == EVENT_OBJECT_LOCATIONCHANGE and not self.wants_location_changes:
+            return
+        # Destroyed windows no longer have an ancestor to check
+        if event != EVENT_OBJECT_DESTROY and ctypes.windll.user32.GetAncestor(hwnd, GA_ROOT) != hwnd:
+            return
+        event_type = _WIN_EVENT_TYPES.get(event)
+        if event_type is not None:
+            self.emit(WindowEvent(event_type, hwnd, time.monotonic()))
\ No newline at end of file
@@ -1,29 +1,127 @@
-import subprocess
-from pywinauto import Application
 import logging
-from typing import Tuple
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from .backend import PlacementOutcome, WindowPlacement, current_backend
+from .config_manager import AppConfig, MatchRule
+from .shell_link import default_shortcut_cache, is_shortcut
+from .window_matcher import WindowMatcher
+from .window_snapshot import WindowSnapshot
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class LaunchCommand:
+    """What launching a layout entry runs, after shortcut resolution."""
+    executable: str
+    arguments: str = ""
+    working_dir: Optional[str] = None
+    show_command: Optional[int] = None
+
 class WindowManager:
-    """Manages window operations using pywinauto."""
-    
+    """Manages window operations through the current platform backend."""
+
+    @staticmethod
+    def resolve_launch(shortcut_path: str) -> LaunchCommand:
+        """Resolves what launching a shortcut path runs.
+
+        .lnk shortcuts whose target is set are resolved to their target,
+        arguments, working directory and show command; anything else is
+        launched as is.
+        """
+        if is_shortcut(shortcut_path):
+            link = default_shortcut_cache().resolve(shortcut_path)
+            if link is not None and link.target_path:
+                return LaunchCommand(
+                    os.path.expandvars(link.target_path),
+                    os.path.expandvars(link.arguments),
+                    os.path.expandvars(link.working_dir) if link.working_dir else None,
+                    link.show_command
+                )
+        return LaunchCommand(shortcut_path)
+
     @staticmethod
-    def open_app(shortcut_path: str) -> None:
-        """Opens an application using its shortcut path."""
+    def open_app(shortcut_path: str, command: Optional[LaunchCommand] = None) -> Optional[int]:
+        """Opens an application using its shortcut path and returns its process id.
+
+        Executables, and .lnk shortcuts whose target is an executable, are
+        started directly with the shortcut's arguments, working directory and
+        show command, so no shell process sits in between. Anything else is
+        handed to the shell; None is returned if it reports no process. Pass
+        the result of resolve_launch as command to skip resolving again.
+        """
         try:
-            subprocess.Popen(shortcut_path, shell=True)
+            if command is None:
+                command = WindowManager.resolve_launch(shortcut_path)
+            if command.executable.lower().endswith('.exe'):
+                return current_backend().create_process(command.executable, command.arguments,
+                                                        command.working_dir, command.show_command)
+            return current_backend().shell_execute(shortcut_path)
         except Exception as e:
             logger.error(f"Failed to open app {shortcut_path}: {e}")
             raise
 
     @staticmethod
-    def move_and_resize_window(executable_name: str, position: Tuple[int, int], size: Tuple[int, int]) -> None:
-        """Moves and resizes a window by its executable name."""
+    def wait_for_window(executable_name: str, timeout: float = 15.0, poll_interval: float = 0.1,
+                        cancel_event: Optional[threading.Event] = None) -> Optional[int]:
+        """Waits until the application's top window is visible and returns its handle.
+
+        Every check searches the whole desktop. Returns None if the wait is
+        cancelled through cancel_event.
+        """
+        backend = current_backend()
+        deadline = time.monotonic() + timeout
+        while True:
+            hwnd = backend.find_app_window(executable_name)
+            if hwnd is not None and backend.window_state(hwnd)[2]:
+                return hwnd
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"No window for {executable_name} after {timeout:.1f}s")
+            if cancel_event is None:
+                time.sleep(poll_interval)
+            elif cancel_event.wait(poll_interval):
+                return None
+
+    @staticmethod
+    def move_window(hwnd: int, position: Tuple[int, int], size: Tuple[int, int]) -> None:
+        """Moves and resizes an already resolved window."""
+        current_backend().move_window(hwnd, position, size)
+
+    @staticmethod
+    def move_and_resize_window(executable_name: str, position: Tuple[int, int], size: Tuple[int, int],
+                               snapshot: Optional[WindowSnapshot] = None, match: Optional[MatchRule] = None) -> None:
+        """Moves and resizes a window by its executable name.
+
+        When a shared snapshot or a match rule is given the window is looked up
+        in a window index instead of searching the desktop by path.
+        """
         try:
-            app = Application(backend='win32').connect(path=executable_name)
-            window = app.top_window()
-            window.move_window(x=position[0], y=position[1], width=size[0], height=size[1])
+            if snapshot is None and match is not None:
+                snapshot = WindowSnapshot()
+                snapshot.refresh()
+            if snapshot is not None:
+                config = AppConfig(executable_name, position, size, match=match)
+                info = WindowMatcher([config]).match(snapshot.visible_windows())[0]
+                if info is None:
+                    raise LookupError(f"No matching window for {executable_name} in snapshot")
+                hwnd = info.hwnd
+            else:
+                hwnd = current_backend().find_app_window(executable_name)
+                if hwnd is None:
+                    raise LookupError(f"No window for {executable_name}")
+            WindowManager.move_window(hwnd, position, size)
         except Exception as e:
             logger.error(f"Failed to move/resize window {executable_name}: {e}")
-            raise 
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def place_windows(placements: List[WindowPlacement]) -> List[PlacementOutcome]:
+        """Places a whole layout at once.
+
+        On Windows this is one deferred window-position transaction; windows
+        that cannot join it are moved one at a time. Every window gets its own
+        outcome; a failure never aborts the others.
+        """
+        return current_backend().place_windows(placements)
\ No newline at end of file
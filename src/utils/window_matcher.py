@@ -0,0 +1,97 @@
+import ntpath
+import re
+from typing import Collection, Dict, Iterable, List, Optional, Set
+
+from .config_manager import AppConfig, MatchRule
+from .shell_link import default_shortcut_cache
+from .window_snapshot import WindowInfo, exe_key
+
+class CompiledRule:
+    """A MatchRule with its title pattern compiled and its executable resolved."""
+
+    def __init__(self, rule: MatchRule, executable: Optional[str]):
+        self.title = re.compile(rule.title) if rule.title else None
+        self.class_name = rule.class_name
+        self.exe = exe_key(executable) if executable else ''
+        self.instance = rule.instance
+        self.launched_child = rule.launched_child
+
+    def matches(self, info: WindowInfo, pids: Optional[Collection[int]] = None) -> bool:
+        """Returns True if a window satisfies the rule.
+
+        pids are the processes of the app's launch; rules that require a
+        launched window never match without them.
+        """
+        if self.exe and self.exe not in (exe_key(info.exe), exe_key(ntpath.basename(info.exe))):
+            return False
+        if self.class_name is not None and info.class_name != self.class_name:
+            return False
+        if self.launched_child and (pids is None or info.pid not in pids):
+            return False
+        return self.title is None or self.title.search(info.title) is not None
+
+def compile_rule(shortcut_path: str, rule: Optional[MatchRule] = None) -> CompiledRule:
+    """Compiles a config's match rule; without one, windows match by the app's executable."""
+    rule = rule or MatchRule()
+    executable = rule.exe
+    if executable is None and not rule.launched_child:
+        executable = default_shortcut_cache().executable_for(shortcut_path)
+    return CompiledRule(rule, executable)
+
+class WindowMatcher:
+    """Assigns windows to a list of configs in one pass over an enumeration.
+
+    Rules are bucketed by executable (or window class), so each window is only
+    tested against the few rules that can possibly match it. Rules with an
+    instance index take that match first; the remaining configs then claim the
+    first matching window that no other config has taken.
+    """
+
+    def __init__(self, configs: List[AppConfig]):
+        self.rules = [compile_rule(config.shortcut_path, config.match) for config in configs]
+        self._by_exe: Dict[str, List[int]] = {}
+        self._by_class: Dict[str, List[int]] = {}
+        self._unkeyed: List[int] = []
+        for index, rule in enumerate(self.rules):
+            if rule.exe:
+                self._by_exe.setdefault(rule.exe, []).append(index)
+            elif rule.class_name is not None:
+                self._by_class.setdefault(rule.class_name, []).append(index)
+            else:
+                self._unkeyed.append(index)
+
+    def match(self, windows: Iterable[WindowInfo],
+              launched: Optional[Dict[int, Collection[int]]] = None) -> List[Optional[WindowInfo]]:
+        """Returns the window assigned to each config, or None.
+
+        launched maps config indexes to the process tree of their launch.
+        """
+        candidates: List[List[WindowInfo]] = [[] for _ in self.rules]
+        for info in windows:
+            indexes: List[int] = list(self._unkeyed)
+            if info.exe:
+                full, name = exe_key(info.exe), exe_key(ntpath.basename(info.exe))
+                indexes.extend(self._by_exe.get(full, ()))
+                if name != full:
+                    indexes.extend(self._by_exe.get(name, ()))
+            indexes.extend(self._by_class.get(info.class_name, ()))
+            for index in indexes:
+                pids = launched.get(index) if launched else None
+                if self.rules[index].matches(info, pids):
+                    candidates[index].append(info)
+
+        assigned: List[Optional[WindowInfo]] = [None] * len(self.rules)
+        claimed: Set[int] = set()
+        for index, rule in enumerate(self.rules):
+            if rule.instance is not None and rule.instance < len(candidates[index]):
+                window = candidates[index][rule.instance]
+                if window.hwnd not in claimed:
+                    assigned[index] = window
+                    claimed.add(window.hwnd)
+        for index, rule in enumerate(self.rules):
+            if rule.instance is None:
+                window = next((info for info in candidates[index] if info.hwnd not in claimed), None)
+                if window is not None:
+                    assigned[index] = window
+                    claimed.add(window.hwnd)
+        return assigned
\ No newline at end of file
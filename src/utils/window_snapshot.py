@@ -0,0 +1,145 @@
+import logging
+import ntpath
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .backend import current_backend
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class WindowInfo:
+    """A top-level window as seen by the last snapshot refresh."""
+    hwnd: int
+    pid: int
+    exe: str
+    class_name: str
+    title: str
+    rect: Tuple[int, int, int, int]
+    visible: bool
+
+def exe_key(path: str) -> str:
+    """Normalizes an executable path for case-insensitive lookups."""
+    return ntpath.normpath(path).lower() if path else ''
+
+class WindowSnapshot:
+    """An index of top-level windows built from a single desktop enumeration.
+
+    Windows are keyed by hwnd and indexed by pid, executable (full path and
+    file name) and title. ``refresh`` re-enumerates only the window handles and
+    reads full details for windows it has not seen before; known windows just
+    have their title, rect and visibility updated.
+    """
+
+    def __init__(self):
+        self.windows: Dict[int, WindowInfo] = {}
+        self.enumeration_count = 0
+        self._by_pid: Dict[int, List[int]] = {}
+        self._by_exe: Dict[str, List[int]] = {}
+        self._by_title: Dict[str, List[int]] = {}
+        self._exe_by_pid: Dict[int, str] = {}
+        self._lock = threading.RLock()
+
+    def refresh(self) -> None:
+        """Enumerates top-level windows once and applies the differences."""
+        handles = current_backend().list_windows()
+
+        with self._lock:
+            self.enumeration_count += 1
+            current = set(handles)
+            for hwnd in [hwnd for hwnd in self.windows if hwnd not in current]:
+                self._remove(hwnd)
+            for hwnd in handles:
+                self.update(hwnd)
+
+    def update(self, hwnd: int) -> Optional[WindowInfo]:
+        """Reads one window and updates the index; returns None if it is gone."""
+        backend = current_backend()
+        with self._lock:
+            try:
+                if not backend.is_window(hwnd):
+                    self._remove(hwnd)
+                    return None
+
+                info = self.windows.get(hwnd)
+                title, rect, visible = backend.window_state(hwnd)
+                if info is None:
+                    pid, class_name = backend.window_owner(hwnd)
+                    exe = self._exe_by_pid.get(pid)
+                    if exe is None:
+                        exe = self._exe_by_pid[pid] = backend.process_image_path(pid)
+                    info = WindowInfo(hwnd, pid, exe, class_name, title, rect, visible)
+                    self._add(info)
+                    return info
+
+                if info.title != title:
+                    self._unindex(self._by_title, info.title, hwnd)
+                    self._by_title.setdefault(title, []).append(hwnd)
+                    info.title = title
+                info.rect = rect
+                info.visible = visible
+                return info
+            except Exception as e:
+                # The window was destroyed while being read
+                logger.debug(f"Dropping window {hwnd}: {e}")
+                self._remove(hwnd)
+                return None
+
+    def get(self, hwnd: int) -> Optional[WindowInfo]:
+        """Returns a window by handle."""
+        return self.windows.get(hwnd)
+
+    def by_pid(self, pid: int) -> List[WindowInfo]:
+        """Returns the windows owned by a process, in discovery order."""
+        with self._lock:
+            return self._lookup(self._by_pid.get(pid, ()))
+
+    def by_exe(self, path: str) -> List[WindowInfo]:
+        """Returns the windows of an executable, given its full path or file name."""
+        with self._lock:
+            return self._lookup(self._by_exe.get(exe_key(path), ()))
+
+    def by_title(self, title: str) -> List[WindowInfo]:
+        """Returns the windows with exactly this title."""
+        with self._lock:
+            return self._lookup(self._by_title.get(title, ()))
+
+    def visible_windows(self) -> List[WindowInfo]:
+        """Returns every visible window in the snapshot."""
+        with self._lock:
+            return [info for info in self.windows.values() if info.visible]
+
+    def _lookup(self, handles: Iterable[int]) -> List[WindowInfo]:
+        return [self.windows[hwnd] for hwnd in handles if hwnd in self.windows]
+
+    def _add(self, info: WindowInfo) -> None:
+        self.windows[info.hwnd] = info
+        self._by_pid.setdefault(info.pid, []).append(info.hwnd)
+        self._by_title.setdefault(info.title, []).append(info.hwnd)
+        if info.exe:
+            self._by_exe.setdefault(exe_key(info.exe), []).append(info.hwnd)
+            self._by_exe.setdefault(exe_key(ntpath.basename(info.exe)), []).append(info.hwnd)
+
+    def _remove(self, hwnd: int) -> None:
+        info = self.windows.pop(hwnd, None)
+        if info is None:
+            return
+        self._unindex(self._by_pid, info.pid, hwnd)
+        self._unindex(self._by_title, info.title, hwnd)
+        if info.exe:
+            self._unindex(self._by_exe, exe_key(info.exe), hwnd)
+            self._unindex(self._by_exe, exe_key(ntpath.basename(info.exe)), hwnd)
+        if info.pid not in self._by_pid:
+            # PIDs are recycled once a process has no windows left
+            self._exe_by_pid.pop(info.pid, None)
+
+    @staticmethod
+    def _unindex(index: dict, key, hwnd: int) -> None:
+        handles = index.get(key)
+        if handles is None:
+            return
+        if hwnd in handles:
+            handles.remove(hwnd)
+        if not handles:
+            del index[key]
\ No newline at end of file
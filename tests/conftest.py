@@ -0,0 +1,25 @@
+import pytest
+
+from src.utils.backend import set_backend
+from src.utils.simulated_desktop import SimulatedDesktop
+
+@pytest.fixture
+def make_desktop(tmp_path, monkeypatch):
+    """Returns a factory of simulated desktops, each installed as the backend and closed after the test.
+
+    Startup histories and caches go to the test's temporary directory
+    instead of the per-user data directory.
+    """
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    desktops = []
+
+    def make(apps=(), monitors=None, **options) -> SimulatedDesktop:
+        desktop = SimulatedDesktop(apps, monitors=monitors, **options)
+        desktops.append(desktop)
+        set_backend(desktop)
+        return desktop
+
+    yield make
+    set_backend(None)
+    for desktop in desktops:
+        desktop.close()
\ No newline at end of file
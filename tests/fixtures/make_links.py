@@ -0,0 +1,86 @@
+"""
+Writes the .lnk fixtures used by test_shell_link.py.
+
+The files follow [MS-SHLLINK]; run this script again after changing it:
+
+    python tests/fixtures/make_links.py
+"""
+import os
+import struct
+
+LINK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+HAS_LINK_TARGET_ID_LIST = 0x01
+HAS_LINK_INFO = 0x02
+HAS_WORKING_DIR = 0x10
+HAS_ARGUMENTS = 0x20
+IS_UNICODE = 0x80
+HAS_EXP_STRING = 0x200
+SW_SHOWMAXIMIZED = 3
+SW_SHOWMINNOACTIVE = 7
+
+def header(flags: int, show_command: int) -> bytes:
+    return (struct.pack("<I", 0x4C) + LINK_CLSID + struct.pack("<II", flags, 0x20) + bytes(24)
+            + struct.pack("<IiI", 0, 0, show_command) + bytes(12))
+
+def id_list() -> bytes:
+    # One opaque item; the parser only has to skip it
+    item = struct.pack("<H", 6) + b"\x1f\x50\xaa\xbb"
+    items = item + b"\0\0"
+    return struct.pack("<H", len(items)) + items
+
+def volume_id() -> bytes:
+    return struct.pack("<IIII", 0x11, 3, 0x1234ABCD, 0x10) + b"\0"
+
+def link_info(ansi_base: str, unicode_base: str = None) -> bytes:
+    header_size = 0x24 if unicode_base is not None else 0x1C
+    volume = volume_id()
+    base = ansi_base.encode("cp1252") + b"\0"
+    suffix = b"\0"
+    volume_offset = header_size
+    base_offset = volume_offset + len(volume)
+    suffix_offset = base_offset + len(base)
+    body = volume + base + suffix
+    extra = b""
+    if unicode_base is not None:
+        unicode_base_offset = header_size + len(body)
+        unicode_suffix_offset = unicode_base_offset + len(unicode_base.encode("utf-16-le")) + 2
+        body += unicode_base.encode("utf-16-le") + b"\0\0" + b"\0\0"
+        extra = struct.pack("<II", unicode_base_offset, unicode_suffix_offset)
+    fields = struct.pack("<7I", header_size + len(body), header_size, 0x1, volume_offset, base_offset, 0,
+                         suffix_offset)
+    return fields + extra + body
+
+def string_data(text: str) -> bytes:
+    return struct.pack("<H", len(text)) + text.encode("utf-16-le")
+
+def environment_block(target: str) -> bytes:
+    ansi = target.encode("cp1252").ljust(260, b"\0")
+    unicode = target.encode("utf-16-le").ljust(520, b"\0")
+    return struct.pack("<II", 0x314, 0xA0000001) + ansi + unicode
+
+TERMINAL_BLOCK = bytes(4)
+
+FIXTURES = {
+    # An ANSI LinkInfo path with Unicode arguments and working directory
+    "notepad.lnk": (header(HAS_LINK_TARGET_ID_LIST | HAS_LINK_INFO | HAS_WORKING_DIR | HAS_ARGUMENTS | IS_UNICODE,
+                           SW_SHOWMAXIMIZED)
+                    + id_list() + link_info("C:\\Windows\\System32\\notepad.exe")
+                    + string_data("C:\\Users\\me\\Documents") + string_data("--new-window \"notes.txt\"")
+                    + TERMINAL_BLOCK),
+    # A LinkInfo with a Unicode local base path that the ANSI one cannot represent
+    "unicode.lnk": (header(HAS_LINK_INFO | IS_UNICODE, 1)
+                    + link_info("C:\\Programme\\B?ro\\app.exe", "C:\\Programme\\Büro\\编辑器.exe")
+                    + TERMINAL_BLOCK),
+    # No LinkInfo: the target only lives in an EnvironmentVariableDataBlock
+    "environment.lnk": (header(HAS_EXP_STRING | IS_UNICODE, SW_SHOWMINNOACTIVE)
+                        + environment_block("%ProgramFiles%\\Tool\\tool.exe") + TERMINAL_BLOCK),
+}
+
+def main() -> None:
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name, data in FIXTURES.items():
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(data)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.config_manager import ConfigManager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages the headless CLI must not import; they alone would exceed STARTUP_BUDGET_MS
+GUI_PACKAGES = ["pywinauto", "customtkinter", "tkinter", "_tkinter"]
+
+# Runs "python -m src <args>" and prints, as its last line, every GUI package import
+# attempted, including ones that fail because the package is not installed
+PROBE = """
+import json, runpy, sys
+
+packages = set(json.loads(sys.argv[1]))
+attempted = set()
+
+class Recorder:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in packages:
+            attempted.add(name)
+        return None
+
+sys.meta_path.insert(0, Recorder())
+sys.argv = ["src"] + sys.argv[2:]
+try:
+    runpy.run_module("src", run_name="__main__", alter_sys=True)
+except SystemExit:
+    pass
+print(json.dumps(sorted(attempted)))
+"""
+
+def gui_imports(tmp_path, *args: str) -> list:
+    env = dict(os.environ, XDG_DATA_HOME=str(tmp_path), XDG_RUNTIME_DIR=str(tmp_path))
+    completed = subprocess.run([sys.executable, "-c", PROBE, json.dumps(GUI_PACKAGES), *args], cwd=ROOT, env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.splitlines()[-1])
+
+def test_help_imports_no_gui_packages(tmp_path):
+    assert gui_imports(tmp_path, "--help") == []
+
+@pytest.mark.skipif(sys.platform == "win32", reason="would place windows on the real desktop")
+def test_apply_imports_no_gui_packages(tmp_path):
+    # An empty layout goes through the whole apply startup without touching any window
+    layout = str(tmp_path / "layout.json")
+    ConfigManager.save_configs([], layout)
+    assert gui_imports(tmp_path, "apply", layout, "--no-daemon") == []
\ No newline at end of file
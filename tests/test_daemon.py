@@ -0,0 +1,111 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from src.cli import main
+from src.utils.config_manager import AppConfig, ConfigManager
+from src.utils.daemon import DaemonClient, PlacementDaemon, default_state_path
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.placement_engine import PlacementEngine
+from src.utils.simulated_desktop import Latency, SimulatedApp
+from src.utils.stabilizer import PlacementStabilizer
+from src.utils.window_events import WinEventHookSource
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets")
+
+APPS = [SimulatedApp("C:\\Apps\\editor.exe", Latency(0.05)), SimulatedApp("C:\\Apps\\terminal.exe", Latency(0.1))]
+
+@pytest.fixture
+def desktop(make_desktop):
+    return make_desktop(APPS, seed=1)
+
+def serve(daemon: PlacementDaemon) -> threading.Thread:
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not os.path.exists(daemon.state_path):
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    return thread
+
+def start_daemon(tmp_path, event_source, stabilizer=None, state_path=None) -> PlacementDaemon:
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=event_source, stabilizer=stabilizer)
+    return PlacementDaemon(PlacementEngine(pipeline), str(tmp_path / "daemon.sock"), "AF_UNIX",
+                           state_path or str(tmp_path / "daemon.json"))
+
+def layout():
+    return [AppConfig("C:\\Apps\\editor.exe", (0, 0), (800, 600)),
+            AppConfig("C:\\Apps\\terminal.exe", (800, 0), (600, 400))]
+
+def test_apply_and_capture_round_trip(tmp_path, desktop):
+    daemon = start_daemon(tmp_path, desktop.create_event_source())
+    thread = serve(daemon)
+    try:
+        client = DaemonClient.discover(daemon.state_path)
+        assert client is not None
+
+        configs = layout()
+        response = client.request("apply", configs=[config.to_dict() for config in configs], incremental=True)
+        assert response["ok"], response
+        assert [item["success"] for item in response["results"]] == [True, True]
+        # Progress updates are not kept between requests
+        assert daemon.engine.updates.empty()
+
+        response = client.request("capture", configs=[config.to_dict() for config in configs])
+        assert response["ok"], response
+        captured = [AppConfig.from_dict(item) for item in response["configs"]]
+        assert [(config.position, config.size) for config in captured] == \
+               [(config.position, config.size) for config in configs]
+
+        # Everything is open now, so a second apply reuses every window
+        response = client.request("apply", configs=[config.to_dict() for config in configs], incremental=True)
+        assert all(item["reused"] for item in response["results"])
+        assert desktop.counters.launches == 2
+    finally:
+        daemon.shutdown()
+        thread.join(5)
+    assert not os.path.exists(daemon.state_path)
+
+def test_falls_back_to_polling_without_window_events(tmp_path, desktop):
+    # The Win32 hook cannot start here; the daemon must still serve
+    daemon = start_daemon(tmp_path, WinEventHookSource())
+    thread = serve(daemon)
+    try:
+        assert daemon.engine.pipeline.event_source is None
+        client = DaemonClient.discover(daemon.state_path)
+        response = client.request("apply", configs=[config.to_dict() for config in layout()], incremental=True)
+        assert [item["success"] for item in response["results"]] == [True, True]
+    finally:
+        daemon.shutdown()
+        thread.join(5)
+
+def test_cli_apply_options_reach_the_daemon(tmp_path, make_desktop):
+    restored = (5, 5, 505, 405)
+    desktop = make_desktop([SimulatedApp("C:\\Apps\\editor.exe", Latency(0.02), restore_rect=restored,
+                                         restore_delay=Latency(0.05))])
+    stabilizer = PlacementStabilizer(1.0, settle_delay=0.02)
+    daemon = start_daemon(tmp_path, desktop.create_event_source(), stabilizer, default_state_path())
+    thread = serve(daemon)
+    layout_path = str(tmp_path / "layout.json")
+    ConfigManager.save_configs([AppConfig("C:\\Apps\\editor.exe", (600, 0), (800, 600))], layout_path)
+    try:
+        # Not watched: the app is left to restore its own rect
+        assert main(["apply", layout_path, "--relaunch", "--watch", "0"]) == 0
+        first = next(iter(desktop.windows))
+        deadline = time.monotonic() + 5
+        while desktop.windows[first].rect != restored:
+            assert time.monotonic() < deadline, "the app did not restore its rect"
+            time.sleep(0.01)
+        assert stabilizer.watch_period == 1.0
+
+        # Watched: the app's move is undone before apply returns
+        assert main(["apply", layout_path, "--relaunch", "--watch", "0.3"]) == 0
+        second = list(desktop.windows)[-1]
+        assert second != first
+        assert desktop.windows[second].rect == (600, 0, 1400, 600)
+    finally:
+        daemon.shutdown()
+        thread.join(5)
\ No newline at end of file
@@ -0,0 +1,137 @@
+import threading
+import time
+
+from src.utils.config_manager import AppConfig
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.launch_scheduler import LaunchScheduler, LoadProbe
+from src.utils.placement_engine import PlacementEngine
+from src.utils.simulated_desktop import Latency, SimulatedApp
+
+APPS = [SimulatedApp(f"C:\\Apps\\app{index}.exe", Latency(0.05)) for index in range(8)]
+
+class RecordingScheduler(LaunchScheduler):
+    """Records the most capacity ever in use."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.peak = 0.0
+
+    def acquire(self, weight: float = 1.0, priority: int = 0, cancel_event=None) -> bool:
+        admitted = super().acquire(weight, priority, cancel_event)
+        with self._condition:
+            self.peak = max(self.peak, self.in_flight)
+        return admitted
+
+class FixedLoad(LoadProbe):
+    def __init__(self, load: float):
+        self.load = load
+
+    def sample(self) -> float:
+        return self.load
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+def start_waiter(scheduler: LaunchScheduler, admitted: list, priority: int = 0, weight: float = 1.0,
+                 cancel_event=None) -> threading.Thread:
+    """Queues one acquire on a thread; its (priority, result) is appended to admitted."""
+    queued = len(scheduler._waiting) + 1
+    thread = threading.Thread(target=lambda: admitted.append(
+        (priority, scheduler.acquire(weight, priority, cancel_event))), daemon=True)
+    thread.start()
+    wait_until(lambda: len(scheduler._waiting) == queued)
+    return thread
+
+def test_launches_stay_within_capacity(make_desktop):
+    desktop = make_desktop(APPS, seed=2)
+    scheduler = RecordingScheduler(2.0)
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=desktop.create_event_source(), scheduler=scheduler)
+    results = pipeline.run([AppConfig(app.executable, (0, 0), (400, 300)) for app in APPS])
+    assert all(result.success for result in results)
+    assert scheduler.peak == 2.0
+    assert scheduler.in_flight == 0.0
+
+def test_higher_priority_is_admitted_first():
+    scheduler = LaunchScheduler(1.0)
+    assert scheduler.acquire()
+    admitted = []
+    threads = [start_waiter(scheduler, admitted, priority) for priority in (0, 5, 1, 5)]
+    for count, expected in enumerate((5, 5, 1, 0), 1):
+        scheduler.release()
+        wait_until(lambda: len(admitted) == count)
+        assert admitted[-1] == (expected, True)
+    for thread in threads:
+        thread.join(1)
+
+def test_weights_share_the_capacity_in_queue_order():
+    scheduler = LaunchScheduler(4.0)
+    assert scheduler.acquire(3.0)
+    admitted = []
+    start_waiter(scheduler, admitted, priority=1, weight=2.0)
+    # A lighter launch that would fit waits behind the heavier one at the head of the queue
+    start_waiter(scheduler, admitted, priority=0, weight=1.0)
+    time.sleep(0.05)
+    assert admitted == []
+
+    scheduler.release(3.0)
+    wait_until(lambda: len(admitted) == 2)
+    assert admitted == [(1, True), (0, True)]
+    assert scheduler.in_flight == 3.0
+
+    # An app heavier than the whole capacity still starts once nothing else is starting
+    scheduler.release(3.0)
+    assert scheduler.acquire(10.0)
+    assert scheduler.in_flight == 10.0
+
+def test_cancel_unblocks_a_waiting_acquire():
+    scheduler = LaunchScheduler(1.0)
+    assert scheduler.acquire()
+    cancel = threading.Event()
+    admitted = []
+    thread = start_waiter(scheduler, admitted, cancel_event=cancel)
+    cancel.set()
+    scheduler.wake()
+    thread.join(1)
+    assert admitted == [(0, False)]
+    assert scheduler._waiting == []
+    assert scheduler.in_flight == 1.0
+
+def test_engine_cancel_releases_queued_launches(make_desktop):
+    desktop = make_desktop([SimulatedApp(app.executable, Latency(2.0)) for app in APPS[:4]], seed=2)
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=desktop.create_event_source(),
+                              scheduler=LaunchScheduler(1.0))
+    engine = PlacementEngine(pipeline)
+    engine.start([AppConfig(app.executable, (0, 0), (400, 300)) for app in APPS[:4]])
+    wait_until(lambda: desktop.counters.launches == 1)
+    engine.cancel()
+    assert engine.wait(1.0)
+    assert all(result.cancelled for result in engine.results)
+    assert desktop.counters.launches == 1
+
+def test_adaptive_admission_waits_for_load_to_drop():
+    probe = FixedLoad(1.0)
+    scheduler = LaunchScheduler(4.0, probe=probe, probe_interval=0.01)
+    # Nothing is starting yet, so load alone never holds the first launch back
+    assert scheduler.acquire()
+    admitted = []
+    start_waiter(scheduler, admitted)
+    time.sleep(0.05)
+    assert admitted == []
+
+    # The probe is sampled again without any release
+    probe.load = 0.2
+    wait_until(lambda: admitted == [(0, True)])
+    assert scheduler.in_flight == 2.0
+
+def test_failing_probe_does_not_block_launches():
+    class BrokenProbe(LoadProbe):
+        def sample(self) -> float:
+            raise OSError("counter unavailable")
+
+    scheduler = LaunchScheduler(4.0, probe=BrokenProbe())
+    assert scheduler.acquire()
+    assert scheduler.acquire()
+    assert scheduler.in_flight == 2.0
\ No newline at end of file
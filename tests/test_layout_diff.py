@@ -0,0 +1,33 @@
+import pytest
+
+from src.utils.config_manager import UNITS_MONITOR, UNITS_PERCENT, UNITS_PIXELS, AppConfig
+from src.utils.layout_diff import capture_positions
+from src.utils.monitors import Monitor
+from src.utils.window_snapshot import WindowSnapshot
+
+MONITORS = [Monitor("\\\\.\\DISPLAY1", (0, 0, 1920, 1080), (0, 0, 1920, 1040), 96, True),
+            Monitor("\\\\.\\DISPLAY2", (1920, 0, 3840, 1080), (1920, 0, 3840, 1080), 96, False)]
+
+@pytest.fixture
+def desktop(make_desktop):
+    return make_desktop(monitors=MONITORS)
+
+def capture(desktop, config, rect):
+    desktop.add_window(config.shortcut_path, rect)
+    snapshot = WindowSnapshot()
+    snapshot.refresh()
+    return capture_positions([config], snapshot)[0]
+
+def test_pixel_configs_take_the_window_rect(desktop):
+    config = capture(desktop, AppConfig("C:\\Apps\\editor.exe", (0, 0), (800, 600)), (10, 20, 810, 520))
+    assert (config.position, config.size, config.units, config.monitor) == ((10, 20), (800, 500), UNITS_PIXELS, None)
+
+def test_relative_configs_stay_relative_to_the_windows_monitor(desktop):
+    config = AppConfig("C:\\Apps\\editor.exe", (0, 0), (50, 50), monitor="0", units=UNITS_PERCENT)
+    config = capture(desktop, config, (1920 + 960, 0, 3840, 540))
+    assert (config.position, config.size, config.units, config.monitor) == ((50, 0), (50, 50), UNITS_PERCENT, "1")
+
+def test_monitor_units_stay_in_scaled_pixels(desktop):
+    config = AppConfig("C:\\Apps\\editor.exe", (0, 0), (100, 100), monitor="1", units=UNITS_MONITOR)
+    config = capture(desktop, config, (100, 40, 900, 640))
+    assert (config.position, config.size, config.units, config.monitor) == ((100, 40), (800, 600), UNITS_MONITOR, "0")
\ No newline at end of file
@@ -0,0 +1,74 @@
+import pytest
+
+from src.utils.config_manager import AppConfig, MatchRule
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.layout_diff import PlanAction, plan_layout
+from src.utils.process_tracker import ProcessTracker
+from src.utils.simulated_desktop import Latency, SimulatedApp
+from src.utils.window_matcher import compile_rule
+
+EDITOR = "C:\\Apps\\editor.exe"
+
+@pytest.fixture
+def desktop(make_desktop):
+    return make_desktop([SimulatedApp(EDITOR, Latency(0.05, 0.5))], seed=3)
+
+def test_instance_selects_among_matching_windows(desktop):
+    windows = [desktop.add_window(EDITOR) for _ in range(3)]
+    tracker = ProcessTracker()
+    tracker.refresh(force=True)
+    # No launched process owns them; the rule matches other processes' windows
+    found = [tracker.find_window(1, compile_rule(EDITOR, MatchRule(instance=index))) for index in range(4)]
+    assert sorted(found[:3]) == sorted(windows)
+    assert found[3] is None
+    assert tracker.find_window(1, compile_rule(EDITOR, MatchRule())) == found[0]
+
+def test_instance_counts_windows_open_before_the_launch(desktop):
+    existing = desktop.add_window(EDITOR, (0, 0, 400, 300))
+    config = AppConfig(EDITOR, (400, 0), (400, 300), match=MatchRule(instance=1))
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=desktop.create_event_source())
+    [result] = pipeline.run([config])
+    assert result.success
+    [launched] = [hwnd for hwnd in desktop.windows if hwnd != existing]
+    assert desktop.windows[launched].rect == (400, 0, 800, 300)
+    assert desktop.windows[existing].rect == (0, 0, 400, 300)
+
+    # A later incremental apply picks the same window for the same instance
+    pipeline.tracker.refresh(force=True)
+    [entry] = plan_layout([config], pipeline.tracker.snapshot)
+    assert entry.action == PlanAction.KEEP and entry.window.hwnd == launched
+
+def test_windows_open_before_a_run_are_enumerated_once(desktop):
+    desktop.add_window(EDITOR, (0, 0, 400, 300))
+    configs = [AppConfig(EDITOR, (index * 400, 300), (400, 300), match=MatchRule()) for index in range(6)]
+    # Waits are event driven, so only the run's own enumerations remain
+    pipeline = LaunchPipeline(window_timeout=5.0, tracker=ProcessTracker(min_refresh_interval=60.0),
+                              event_source=desktop.create_event_source())
+    desktop.counters.reset()
+    results = pipeline.run(configs)
+    assert all(result.success for result in results)
+    assert desktop.counters.enumerations <= 2
+    # The window that was open before the run is never taken by a launch
+    assert desktop.windows[next(iter(desktop.windows))].rect == (0, 0, 400, 300)
+
+def test_claimed_windows_are_skipped(desktop):
+    first, second = desktop.add_window(EDITOR), desktop.add_window(EDITOR)
+    tracker = ProcessTracker()
+    tracker.refresh(force=True)
+    rule = compile_rule(EDITOR, MatchRule())
+    claimed = set()
+    hwnd = tracker.find_window(1, rule, claimed=claimed)
+    assert claimed == {hwnd}
+    assert tracker.find_window(1, rule, claimed=claimed) == ({first, second} - {hwnd}).pop()
+    assert tracker.find_window(1, rule, claimed=claimed) is None
+    # An instance that another launch claimed is waited on, not replaced
+    assert tracker.find_window(1, compile_rule(EDITOR, MatchRule(instance=0)), claimed=claimed) is None
+
+def test_concurrent_launches_place_distinct_windows(desktop):
+    configs = [AppConfig(EDITOR, (index * 400, 0), (400, 300), match=MatchRule()) for index in range(4)]
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=desktop.create_event_source())
+    results = pipeline.run(configs)
+    assert all(result.success for result in results)
+    rects = sorted(window.rect for window in desktop.windows.values())
+    assert rects == sorted((x, y, x + w, y + h) for (x, y), (w, h) in
+                           ((config.position, config.size) for config in configs))
\ No newline at end of file
@@ -0,0 +1,127 @@
+import json
+import sqlite3
+
+import pytest
+
+from src.utils import profile_store
+from src.utils.config_manager import AppConfig, ConfigManager
+from src.utils.profile_store import DEFAULT_VARIANT, ProfileStore
+
+EDITOR = "C:\\Apps\\editor.exe"
+TERMINAL = "C:\\Apps\\terminal.exe"
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    yield store
+    store.close()
+
+def layout(x: int = 0):
+    return [AppConfig(EDITOR, (x, 0), (800, 600)), AppConfig(TERMINAL, (x + 800, 0), (600, 400), priority=2)]
+
+def dicts(configs):
+    return [config.to_dict() for config in configs]
+
+def test_save_load_and_delete(store):
+    store.save("work", layout())
+    assert dicts(store.load("work")) == dicts(layout())
+    # Saving again replaces the apps
+    store.save("work", layout(100)[:1])
+    assert dicts(store.load("work")) == dicts(layout(100)[:1])
+    [summary] = store.search()
+    assert (summary.name, summary.variant, summary.app_count) == ("work", DEFAULT_VARIANT, 1)
+
+    store.delete("work")
+    assert store.search() == []
+    with pytest.raises(KeyError):
+        store.load("work")
+
+def test_missing_variant_falls_back_to_the_default(store):
+    store.save("work", layout())
+    store.save("work", layout(100), variant="two-monitors")
+    assert dicts(store.load("work", "two-monitors")) == dicts(layout(100))
+    assert dicts(store.load("work", "laptop")) == dicts(layout())
+    assert dicts(store.load("work")) == dicts(layout())
+    assert store.variants("work") == [DEFAULT_VARIANT, "two-monitors"]
+
+    # Without a default variant only the exact monitor set matches
+    store.delete("work", DEFAULT_VARIANT)
+    assert dicts(store.load("work", "two-monitors")) == dicts(layout(100))
+    with pytest.raises(KeyError):
+        store.load("work", "laptop")
+
+def test_new_variants_share_the_profile_tags(store):
+    store.save("work", layout(), tags=["dev", "office"])
+    store.save("work", layout(100), variant="two-monitors")
+    assert {summary.variant: summary.tags for summary in store.search()} == \
+           {DEFAULT_VARIANT: ["dev", "office"], "two-monitors": ["dev", "office"]}
+
+    store.save("work", layout(100), tags=["focus"], variant="two-monitors")
+    assert all(summary.tags == ["dev", "focus", "office"] for summary in store.search())
+    store.set_tags("work", ["home"])
+    assert all(summary.tags == ["home"] for summary in store.search())
+    assert store.all_tags() == ["home"]
+
+def test_search_filters_by_every_tag(store):
+    store.save("alpha", layout(), tags=["dev", "office"])
+    store.save("beta", layout(), tags=["dev"])
+    store.save("gamma", layout())
+    assert [summary.name for summary in store.search(tags=["dev"])] == ["alpha", "beta"]
+    assert [summary.name for summary in store.search(tags=["dev", "office"])] == ["alpha"]
+    assert [summary.name for summary in store.search("a", tags=["office"])] == ["alpha"]
+    assert [summary.name for summary in store.search(limit=2, offset=1)] == ["beta", "gamma"]
+
+def test_search_matches_wildcards_literally(store):
+    for name in ("100% done", "100x done", "a_b", "axb", "back\\slash", "backslash"):
+        store.save(name, layout())
+    assert [summary.name for summary in store.search("%")] == ["100% done"]
+    assert [summary.name for summary in store.search("_")] == ["a_b"]
+    assert [summary.name for summary in store.search("\\")] == ["back\\slash"]
+    # Names match case-insensitively anywhere in the name
+    assert [summary.name for summary in store.search("DONE")] == ["100% done", "100x done"]
+
+def test_import_layout(store, tmp_path):
+    filepath = str(tmp_path / "Daily setup.json")
+    ConfigManager.save_configs(layout(), filepath)
+    assert store.import_layout(filepath, tags=["dev"]) == "Daily setup"
+    assert dicts(store.load("Daily setup")) == dicts(layout())
+    assert store.search("daily")[0].tags == ["dev"]
+
+    with open(filepath, "w") as f:
+        json.dump([{"shortcut_path": EDITOR}], f)
+    with pytest.raises(ValueError):
+        store.import_layout(filepath, name="broken")
+    assert store.variants("broken") == []
+
+def test_schema_is_created_and_kept_on_reopen(tmp_path):
+    path = str(tmp_path / "profiles.db")
+    store = ProfileStore(path)
+    store.save("work", layout(), tags=["dev"])
+    store.close()
+
+    store = ProfileStore(path)
+    assert store._db.execute("PRAGMA user_version").fetchone()[0] == profile_store.SCHEMA_VERSION
+    assert dicts(store.load("work")) == dicts(layout())
+    store.close()
+
+def test_pending_migrations_upgrade_an_old_database(tmp_path, monkeypatch):
+    path = str(tmp_path / "profiles.db")
+    store = ProfileStore(path)
+    store.save("work", layout())
+    store.close()
+
+    monkeypatch.setattr(profile_store, "MIGRATIONS",
+                        profile_store.MIGRATIONS + ["ALTER TABLE profiles ADD COLUMN notes TEXT;"])
+    monkeypatch.setattr(profile_store, "SCHEMA_VERSION", len(profile_store.MIGRATIONS))
+    store = ProfileStore(path)
+    assert store._db.execute("PRAGMA user_version").fetchone()[0] == 2
+    assert store._db.execute("SELECT name, notes FROM profiles").fetchall() == [("work", None)]
+    store.close()
+
+def test_newer_schema_is_refused(tmp_path):
+    path = str(tmp_path / "profiles.db")
+    db = sqlite3.connect(path)
+    db.execute(f"PRAGMA user_version = {profile_store.SCHEMA_VERSION + 1}")
+    db.close()
+    with pytest.raises(RuntimeError):
+        ProfileStore(path)
\ No newline at end of file
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from src.utils.backend import set_backend
+from src.utils.config_manager import AppConfig
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.placement_engine import PlacementEngine
+from src.utils.session_recording import SessionRecorder, SessionRecording
+from src.utils.simulated_desktop import Latency, SimulatedApp
+from src.utils.stabilizer import PlacementStabilizer
+from src.utils.startup_model import StartupHistory
+from src.utils.window_events import WindowEvent, WindowEventType
+
+EDITOR = "C:\\Apps\\editor.exe"
+RESTORED = (5, 5, 505, 405)
+
+@pytest.fixture
+def desktop(make_desktop):
+    return make_desktop([SimulatedApp(EDITOR, Latency(0.02), restore_rect=RESTORED, restore_delay=Latency(0.05))])
+
+def record(desktop, configs):
+    recorder = SessionRecorder(desktop)
+    set_backend(recorder)
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=recorder.create_event_source(),
+                              stabilizer=PlacementStabilizer(0.3, settle_delay=0.02))
+    engine = PlacementEngine(pipeline)
+    engine.set_history(StartupHistory())
+    recorder.begin(configs, True, 0.3)
+    results = engine.run(configs, incremental=True)
+    set_backend(desktop)
+    return recorder.finish(results)
+
+def test_records_launches_windows_and_app_moves(desktop):
+    existing = desktop.add_window("C:\\Apps\\other.exe")
+    recording = record(desktop, [AppConfig(EDITOR, (600, 0), (800, 600))])
+
+    assert existing in recording.initial
+    assert [launch.target for launch in recording.launches] == [EDITOR]
+    pid = recording.launches[0].pid
+    placed = recording.results[0].hwnd
+    assert recording.windows[placed][0] == pid
+    assert recording.processes[pid] == (desktop.processes[pid][0], EDITOR)
+    # The app's own move is an event; the placement code's moves are kept apart
+    moves = [event for event in recording.events if event.type == WindowEventType.LOCATION_CHANGE]
+    assert [(event.hwnd, event.state.rect) for event in moves] == [(placed, RESTORED)]
+    assert {hwnd for _, hwnd, _ in recording.moves} == {placed}
+
+    assert SessionRecording.from_dict(recording.to_dict()).to_dict() == recording.to_dict()
+
+def test_events_are_read_on_the_recorder_thread(desktop, monkeypatch):
+    recorder = SessionRecorder(desktop)
+    recorder.begin([], True)
+    hwnd = desktop.add_window(EDITOR)
+    readers = set()
+    window_state = desktop.window_state
+    monkeypatch.setattr(desktop, "window_state",
+                        lambda hwnd: readers.add(threading.current_thread().name) or window_state(hwnd))
+    recorder._on_event(WindowEvent(WindowEventType.SHOW, hwnd, recorder._origin + 0.1))
+    recording = recorder.finish([])
+    assert readers == {"session-recorder"}
+    assert [(event.type, event.hwnd) for event in recording.events] == [(WindowEventType.SHOW, hwnd)]
\ No newline at end of file
@@ -0,0 +1,71 @@
+import os
+import shutil
+
+import pytest
+
+from src.utils import shell_link
+from src.utils.shell_link import ShortcutCache, parse_shell_link, read_shell_link
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def fixture(name: str) -> str:
+    return os.path.join(FIXTURES, name)
+
+def test_link_info_local_path_and_string_data():
+    link = read_shell_link(fixture("notepad.lnk"))
+    assert link.target_path == "C:\\Windows\\System32\\notepad.exe"
+    assert link.arguments == '--new-window "notes.txt"'
+    assert link.working_dir == "C:\\Users\\me\\Documents"
+
+def test_show_command():
+    assert read_shell_link(fixture("notepad.lnk")).show_command == 3
+    assert read_shell_link(fixture("environment.lnk")).show_command == 7
+    # A link without a show command opens normally
+    assert read_shell_link(fixture("unicode.lnk")).show_command == 1
+
+def test_unicode_local_base_path_is_preferred():
+    link = read_shell_link(fixture("unicode.lnk"))
+    assert link.target_path == "C:\\Programme\\Büro\\编辑器.exe"
+    assert link.arguments == ""
+    assert link.working_dir is None
+
+def test_environment_variable_data_block():
+    link = read_shell_link(fixture("environment.lnk"))
+    assert link.target_path == "%ProgramFiles%\\Tool\\tool.exe"
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        parse_shell_link(b"MZ" + bytes(100))
+    with open(fixture("notepad.lnk"), "rb") as f:
+        truncated = f.read()[:90]
+    with pytest.raises(ValueError):
+        parse_shell_link(truncated)
+
+def test_cache_reparses_only_when_the_shortcut_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "app.lnk")
+    shutil.copy(fixture("notepad.lnk"), path)
+    cache_path = str(tmp_path / "shortcuts.json")
+    assert ShortcutCache(cache_path).resolve(path).target_path == "C:\\Windows\\System32\\notepad.exe"
+    assert os.path.exists(cache_path)
+
+    # A new cache instance answers from the file without parsing the shortcut again
+    def fail(path):
+        raise AssertionError(f"{path} was parsed again")
+
+    monkeypatch.setattr(shell_link, "read_shell_link", fail)
+    assert ShortcutCache(cache_path).resolve(path).working_dir == "C:\\Users\\me\\Documents"
+    monkeypatch.undo()
+
+    # Replacing the shortcut changes its mtime, which invalidates the entry
+    shutil.copy(fixture("environment.lnk"), path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache = ShortcutCache(cache_path)
+    assert cache.resolve(path).target_path == "%ProgramFiles%\\Tool\\tool.exe"
+    assert cache.executable_for(path) == os.path.expandvars("%ProgramFiles%\\Tool\\tool.exe")
+
+    # Another path is a separate entry
+    other = str(tmp_path / "other.lnk")
+    shutil.copy(fixture("unicode.lnk"), other)
+    assert cache.resolve(other).target_path == "C:\\Programme\\Büro\\编辑器.exe"
+    assert cache.resolve(path).show_command == 7
\ No newline at end of file
@@ -0,0 +1,65 @@
+import os
+
+from src.utils.desktop_capture import MINIMIZED_COORDINATE
+from src.utils.monitors import Monitor, MonitorTopology
+from src.utils.snapping import EdgeIndex, build_edge_index
+from src.utils.window_snapshot import WindowInfo
+
+OTHER_PID = os.getpid() + 1
+
+def window(rect, pid: int = OTHER_PID) -> WindowInfo:
+    return WindowInfo(1, pid, "C:\\Apps\\editor.exe", "Editor", "Editor", rect, True)
+
+def test_snap_span_moves_the_closer_end_onto_an_edge():
+    index = EdgeIndex([100, 305, 1000])
+    # The far end is closer: the span moves so it ends on 305
+    assert index.snap_span(108, 195) == 110
+    # The near end is closer
+    assert index.snap_span(97, 195) == 100
+    # Nothing within reach
+    assert index.snap_span(500, 100) == 500
+    assert index.snap_span(500, 100, distance=200) == 305
+
+def test_snap_span_ties_prefer_the_low_end():
+    index = EdgeIndex([100, 305])
+    # Both ends are 5 pixels off an edge
+    assert index.snap_span(105, 195) == 100
+    assert index.snap_span(95, 205) == 100
+
+def test_snap_span_uses_the_axis_edges():
+    index = EdgeIndex(x_edges=[0], y_edges=[50])
+    assert index.snap_span(45, 100, vertical=True) == 50
+    assert index.snap_span(45, 100) == 45
+
+def test_snap_end_resizes_onto_a_nearby_edge():
+    index = EdgeIndex([100, 400])
+    assert index.snap_end(100, 295) == 300
+    assert index.snap_end(100, 250) == 250
+
+def test_snap_end_never_collapses_the_span():
+    index = EdgeIndex([100])
+    # The only edge in reach is the span's own start
+    assert index.snap_end(100, 5) == 5
+    # Or lies before it
+    assert index.snap_end(104, 2) == 2
+
+def test_edges_of_other_windows_are_indexed():
+    index = build_edge_index(windows=[window((10, 20, 810, 620))])
+    assert index.x_edges == [10, 810]
+    assert index.y_edges == [20, 620]
+
+def test_own_minimized_and_empty_windows_are_left_out():
+    index = build_edge_index(windows=[
+        window((10, 20, 810, 620), pid=os.getpid()),
+        window((MINIMIZED_COORDINATE, MINIMIZED_COORDINATE, MINIMIZED_COORDINATE + 160, MINIMIZED_COORDINATE + 28)),
+        window((300, 300, 300, 500)),
+        window((50, 60, 70, 80)),
+    ])
+    assert index.x_edges == [50, 70]
+    assert index.y_edges == [60, 80]
+
+def test_monitor_edges_and_grid_lines_are_indexed():
+    topology = MonitorTopology([Monitor("\\\\.\\DISPLAY1", (0, 0, 1920, 1080), (0, 0, 1920, 1040), 96, True)])
+    index = build_edge_index(topology, grid=(2, 4))
+    assert index.x_edges == [0, 480, 960, 1440, 1920]
+    assert index.y_edges == [0, 260, 520, 780, 1040, 1080]
\ No newline at end of file
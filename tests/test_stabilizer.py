@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from src.utils.config_manager import AppConfig
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.placement_engine import PlacementEngine
+from src.utils.simulated_desktop import Latency, SimulatedApp
+from src.utils.stabilizer import PlacementStabilizer
+from src.utils.tracing import PlacementTrace
+from src.utils.window_events import WindowEventType
+
+EDITOR = "C:\\Apps\\editor.exe"
+
+@pytest.fixture
+def desktop(make_desktop):
+    # The editor restores its saved rect shortly after its window appears
+    return make_desktop([SimulatedApp(EDITOR, Latency(0.02), restore_rect=(5, 5, 505, 405),
+                                      restore_delay=Latency(0.05))])
+
+def test_location_changes_are_only_delivered_while_watching(desktop):
+    source = desktop.create_event_source()
+    moves = []
+    source.add_listener(lambda event: moves.append(event.hwnd) if event.type == WindowEventType.LOCATION_CHANGE
+                        else None)
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=source,
+                              stabilizer=PlacementStabilizer(0.3, settle_delay=0.02))
+    source.start()
+    other = desktop.add_window("C:\\Apps\\other.exe")
+    desktop.move_window(other, (0, 0), (300, 300))
+    assert not moves
+
+    config = AppConfig(EDITOR, (600, 0), (800, 600))
+    results = pipeline.run([config])
+    assert results[0].success
+    placed = next(hwnd for hwnd in desktop.windows if hwnd != other)
+    # The app's own move was seen and undone
+    assert placed in moves
+    assert desktop.windows[placed].rect == (600, 0, 1400, 600)
+
+    assert not source.wants_location_changes
+    moves.clear()
+    desktop.move_window(other, (10, 10), (300, 300))
+    assert not moves
+
+def test_reused_windows_are_watched(make_desktop):
+    # The app was started just before the layout is applied and restores its rect later
+    desktop = make_desktop([SimulatedApp(EDITOR, Latency(0.01), restore_rect=(5, 5, 505, 405),
+                                         restore_delay=Latency(0.3))])
+    desktop.create_process(EDITOR)
+    deadline = time.monotonic() + 5
+    while not desktop.windows:
+        assert time.monotonic() < deadline, "the app did not open a window"
+        time.sleep(0.01)
+
+    pipeline = LaunchPipeline(window_timeout=5.0, event_source=desktop.create_event_source(),
+                              stabilizer=PlacementStabilizer(1.0, settle_delay=0.02))
+    trace = PlacementTrace()
+    results = PlacementEngine(pipeline).run([AppConfig(EDITOR, (600, 0), (800, 600))], incremental=True, trace=trace)
+    assert [(result.success, result.reused) for result in results] == [(True, True)]
+    assert desktop.counters.launches == 1
+    # The app's restore was undone before the run returned
+    assert trace.counters["retries"] == 1
+    assert next(iter(desktop.windows.values())).rect == (600, 0, 1400, 600)
\ No newline at end of file
@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+
+from src.utils.config_manager import AppConfig
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.placement_engine import PlacementEngine
+from src.utils.simulated_desktop import Latency, SimulatedApp
+from src.utils.startup_model import StartupHistory, StartupStats
+
+EDITOR = "C:\\Apps\\editor.exe"
+TERMINAL = "C:\\Apps\\terminal.exe"
+
+def test_estimate_converges_to_the_current_startup_time():
+    history = StartupHistory(smoothing=0.3)
+    history.record(EDITOR, 2.0, 10.0)
+    assert history.get(EDITOR) == StartupStats(2.0, 10.0, 1)
+    history.record(EDITOR, 1.0, 1.0)
+    assert history.get(EDITOR).placed == pytest.approx(10.0 + 0.3 * (1.0 - 10.0))
+
+    # The app got faster for good; the estimate follows it
+    for _ in range(30):
+        history.record(EDITOR, 0.5, 1.0)
+    stats = history.get(EDITOR)
+    assert stats.samples == 32
+    assert stats.placed == pytest.approx(1.0, abs=1e-3)
+    assert stats.first_window == pytest.approx(0.5, abs=1e-3)
+    assert history.expected_duration(EDITOR) == stats.placed
+
+def test_history_survives_a_save_and_load(tmp_path):
+    path = str(tmp_path / "work.startup.json")
+    history = StartupHistory(path)
+    history.record(EDITOR, 1.5, 4.0)
+    history.record(EDITOR, 0.5, 2.0)
+    history.record(TERMINAL, 0.2, 0.3)
+    history.save()
+
+    loaded = StartupHistory(path)
+    for shortcut_path in (EDITOR, TERMINAL):
+        assert loaded.get(shortcut_path) == history.get(shortcut_path)
+    # Smoothing carries on from the stored estimate
+    history.record(EDITOR, 1.0, 3.0)
+    loaded.record(EDITOR, 1.0, 3.0)
+    assert loaded.get(EDITOR) == history.get(EDITOR)
+    assert not os.path.exists(path + ".tmp")
+
+def test_old_and_unreadable_histories(tmp_path):
+    path = str(tmp_path / "old.startup.json")
+    with open(path, "w") as f:
+        json.dump({EDITOR: {"first_window": 1.0, "stable_window": 2.5}}, f)
+    assert StartupHistory(path).get(EDITOR) == StartupStats(1.0, 2.5, 1)
+
+    with open(path, "w") as f:
+        f.write("{not json")
+    assert StartupHistory(path).get(EDITOR) is None
+
+def test_timeouts_poll_intervals_and_order_follow_the_history():
+    history = StartupHistory(default_estimate=2.0)
+    history.record(EDITOR, 4.0, 20.0)
+    history.record(TERMINAL, 0.1, 0.5)
+    # The configured timeout is a floor, and slow apps get more time up to the maximum
+    assert history.timeout_for(TERMINAL, 15.0) == 15.0
+    assert history.timeout_for(EDITOR, 15.0) == 60.0
+    assert history.timeout_for(EDITOR, 15.0, maximum=30.0) == 30.0
+    assert history.timeout_for("C:\\Apps\\new.exe", 15.0) == 15.0
+    assert history.poll_interval_for(EDITOR, 0.1) == 0.2
+    assert history.poll_interval_for(TERMINAL, 0.1) == 0.05
+    configs = [AppConfig(path, (0, 0), (100, 100)) for path in (TERMINAL, "C:\\Apps\\new.exe", EDITOR)]
+    assert [config.shortcut_path for config in history.critical_path_order(configs)] == \
+           [EDITOR, "C:\\Apps\\new.exe", TERMINAL]
+
+def test_runs_record_into_the_layout_history(make_desktop, tmp_path):
+    make_desktop([SimulatedApp(EDITOR, Latency(0.05))], seed=6)
+    layout_path = str(tmp_path / "work.json")
+    engine = PlacementEngine(LaunchPipeline(window_timeout=5.0))
+    results = engine.run([AppConfig(EDITOR, (0, 0), (800, 600))], layout_path=layout_path)
+    assert results[0].success
+
+    stats = StartupHistory.for_layout(layout_path).get(EDITOR)
+    assert stats.samples == 1
+    assert stats.first_window == pytest.approx(results[0].first_window)
+    assert stats.placed >= stats.first_window
+    assert os.path.exists(str(tmp_path / "work.startup.json"))
\ No newline at end of file
@@ -0,0 +1,103 @@
+import itertools
+import time
+
+import pytest
+
+from src.utils.config_manager import UNITS_PERCENT, UNITS_PIXELS, AppConfig, MatchRule, TileConstraints
+from src.utils.monitors import Monitor, MonitorTopology
+from src.utils.tiling import OPTIMAL_HARD_LIMIT, solve_tiling
+
+def monitors(count):
+    return [Monitor(f"\\\\.\\DISPLAY{index + 1}", (1920 * index, 0, 1920 * (index + 1), 1080),
+                    (1920 * index, 0, 1920 * (index + 1), 1040), 96, index == 0) for index in range(count)]
+
+def apps(count, **options):
+    return [AppConfig(f"C:\\Apps\\app{index}.exe", (0, 0), (100, 100), **options) for index in range(count)]
+
+def rect(config):
+    (x, y), (width, height) = config.position, config.size
+    return (x, y, x + width, y + height)
+
+def inside(inner, outer):
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+@pytest.mark.parametrize("mode, count", [("fast", 30), ("auto", 13), ("optimal", 10)])
+def test_windows_do_not_overlap_and_stay_in_work_areas(mode, count):
+    topology = MonitorTopology(monitors(2))
+    tiled = solve_tiling(apps(count), topology, gap=8, mode=mode)
+    rects = [rect(config) for config in tiled]
+    for first, second in itertools.combinations(rects, 2):
+        assert first[2] + 8 <= second[0] or second[2] + 8 <= first[0] or \
+               first[3] + 8 <= second[1] or second[3] + 8 <= first[1], (first, second)
+    assert all(any(inside(r, monitor.work_area) for monitor in topology.monitors) for r in rects)
+    # Both monitors are used
+    assert {topology.monitor_at(r[0], r[1]).device for r in rects} == {m.device for m in topology.monitors}
+
+@pytest.mark.parametrize("mode", ["fast", "optimal"])
+def test_min_and_max_sizes(mode):
+    configs = apps(4)
+    configs[0] = AppConfig(configs[0].shortcut_path, (0, 0), (1, 1), tile=TileConstraints(min_size=(1200, 700)))
+    configs[1] = AppConfig(configs[1].shortcut_path, (0, 0), (1, 1), tile=TileConstraints(max_size=(300, 200)))
+    tiled = solve_tiling(configs, MonitorTopology(monitors(1)), mode=mode)
+    assert tiled[0].size[0] >= 1200 and tiled[0].size[1] >= 700
+    assert tiled[1].size[0] <= 300 and tiled[1].size[1] <= 200
+
+def test_max_size_window_is_centered_in_its_cell():
+    config = AppConfig("C:\\Apps\\small.exe", (0, 0), (1, 1), tile=TileConstraints(max_size=(400, 300)))
+    tiled = solve_tiling([config], MonitorTopology(monitors(1)), gap=0)[0]
+    assert tiled.size == (400, 300)
+    assert tiled.position == ((1920 - 400) // 2, (1040 - 300) // 2)
+
+def test_preferred_monitor():
+    topology = MonitorTopology(monitors(3))
+    configs = apps(4)
+    configs[1] = AppConfig(configs[1].shortcut_path, (0, 0), (1, 1), tile=TileConstraints(monitor="2"))
+    configs[2] = AppConfig(configs[2].shortcut_path, (0, 0), (1, 1), tile=TileConstraints(monitor="\\\\.\\DISPLAY2"))
+    tiled = solve_tiling(configs, topology)
+    assert inside(rect(tiled[1]), topology.monitors[2].work_area)
+    assert inside(rect(tiled[2]), topology.monitors[1].work_area)
+
+@pytest.mark.parametrize("mode", ["fast", "optimal"])
+def test_priority_and_area(mode):
+    configs = apps(4)
+    configs[3] = AppConfig(configs[3].shortcut_path, (0, 0), (1, 1), priority=5, tile=TileConstraints(area=3.0))
+    tiled = solve_tiling(configs, MonitorTopology(monitors(1)), gap=0, mode=mode)
+    # The highest-priority app goes to the top left of the primary monitor, with three times the area
+    assert tiled[3].position == (0, 0)
+    areas = [config.size[0] * config.size[1] for config in tiled]
+    assert areas[3] == max(areas)
+    assert areas[3] > 2 * min(areas[:3])
+
+def test_results_are_pixel_configs():
+    config = AppConfig("C:\\Apps\\editor.exe", (10, 10), (50, 50), priority=2, match=MatchRule(title="Editor"),
+                       monitor="0", units=UNITS_PERCENT, retries=1)
+    tiled = solve_tiling([config], MonitorTopology(monitors(1)), gap=8)[0]
+    assert (tiled.units, tiled.monitor) == (UNITS_PIXELS, None)
+    assert (tiled.position, tiled.size) == ((8, 8), (1904, 1024))
+    assert (tiled.shortcut_path, tiled.priority, tiled.match, tiled.retries) == \
+           (config.shortcut_path, 2, config.match, 1)
+
+def test_optimal_mode_falls_back_above_the_hard_limit(caplog):
+    configs = apps(OPTIMAL_HARD_LIMIT + 4)
+    started = time.perf_counter()
+    tiled = solve_tiling(configs, MonitorTopology(monitors(1)), mode="optimal")
+    assert time.perf_counter() - started < 0.5
+    assert solve_tiling(configs, MonitorTopology(monitors(1)), mode="fast") == tiled
+    assert "too many to search every tiling" in caplog.text
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        solve_tiling(apps(2), MonitorTopology(monitors(1)), mode="best")
+
+@pytest.mark.parametrize("count", [16, 20, 24, 28, 48])
+def test_auto_mode_stays_interactive_across_monitors(count):
+    topology = MonitorTopology(monitors(4))
+    configs = apps(count)
+    # Best of three, so a busy test machine does not fail the guard
+    seconds = min(timeit(lambda: solve_tiling(configs, topology)) for _ in range(3))
+    assert seconds < 0.05
+
+def timeit(solve):
+    started = time.perf_counter()
+    solve()
+    return time.perf_counter() - started
\ No newline at end of file
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.utils.config_manager import AppConfig
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.launch_scheduler import LaunchScheduler
+from src.utils.placement_engine import PlacementEngine
+from src.utils.simulated_desktop import Latency, SimulatedApp
+from src.utils.tracing import LAYOUT_ROW, PlacementTrace
+
+EDITOR = "C:\\Apps\\editor.exe"
+TERMINAL = "C:\\Apps\\terminal.exe"
+
+def sample_trace() -> PlacementTrace:
+    trace = PlacementTrace()
+    first, second = AppConfig(EDITOR, (0, 0), (800, 600)), AppConfig(EDITOR, (800, 0), (800, 600))
+    trace.add_span(None, "launch", 0.0, 0.5, apps=2)
+    trace.add_span(first, "spawn", 0.01, 0.02, pid=100)
+    trace.add_span(first, "first window", 0.02, 0.3)
+    trace.add_span(second, "spawn", 0.015, 0.025, pid=101)
+    trace.add_span(second, "placed", 0.4, 0.41, hwnd=7)
+    trace.count("enumerations", 3)
+    trace.count("retries")
+    return trace
+
+def spans_of(trace: PlacementTrace) -> list:
+    return [(span.row, span.name, span.args) for span in trace.spans]
+
+def test_rows_are_numbered_per_app():
+    assert sample_trace().rows == [LAYOUT_ROW, "editor.exe", "editor.exe #2"]
+
+def test_round_trip_through_chrome_json():
+    trace = sample_trace()
+    restored = PlacementTrace.from_dict(json.loads(json.dumps(trace.to_dict())))
+    assert restored.rows == trace.rows
+    assert spans_of(restored) == spans_of(trace)
+    for span, original in zip(restored.spans, trace.spans):
+        assert (span.start, span.end) == (pytest.approx(original.start, abs=1e-6), pytest.approx(original.end, abs=1e-6))
+    assert restored.counters == trace.counters
+    assert restored.to_dict() == trace.to_dict()
+
+def test_merge_adds_rows_spans_and_counters():
+    trace = PlacementTrace()
+    trace.add_span(None, "resolve layout", 0.0, 0.001)
+    trace.count("enumerations")
+    daemon_trace = PlacementTrace.from_dict(sample_trace().to_dict())
+
+    trace.merge(daemon_trace)
+    assert trace.rows == [LAYOUT_ROW, "editor.exe", "editor.exe #2"]
+    assert spans_of(trace) == [(LAYOUT_ROW, "resolve layout", {})] + spans_of(daemon_trace)
+    assert trace.counters == {"enumerations": 4, "retries": 1}
+    totals = trace.phase_totals()
+    assert totals["editor.exe"]["first window"] == pytest.approx(0.28, abs=1e-6)
+    assert set(totals[LAYOUT_ROW]) == {"resolve layout", "launch"}
+
+    # Rows are not repeated by a second merge
+    trace.merge(daemon_trace)
+    assert trace.rows == [LAYOUT_ROW, "editor.exe", "editor.exe #2"]
+    assert trace.counters["enumerations"] == 7
+
+def test_traced_run_records_every_phase(make_desktop):
+    make_desktop([SimulatedApp(EDITOR, Latency(0.03)), SimulatedApp(TERMINAL, Latency(0.05))], seed=7)
+    pipeline = LaunchPipeline(window_timeout=5.0, scheduler=LaunchScheduler())
+    trace = PlacementTrace()
+    configs = [AppConfig(EDITOR, (0, 0), (800, 600)), AppConfig(TERMINAL, (800, 0), (600, 400))]
+    results = PlacementEngine(pipeline).run(configs, trace=trace)
+    assert all(result.success for result in results)
+
+    restored = PlacementTrace.from_dict(trace.to_dict())
+    for row in ("editor.exe", "terminal.exe"):
+        phases = [span.name for span in sorted((span for span in restored.spans if span.row == row),
+                                               key=lambda span: span.start)]
+        assert phases == ["queued", "resolve", "spawn", "first window", "matched", "placed"]
+    assert restored.counters["enumerations"] >= 1
+    assert "slowest app:" in restored.format_summary()
\ No newline at end of file
@@ -0,0 +1,61 @@
+import pytest
+
+from src.utils.config_manager import AppConfig
+from src.utils.launch_pipeline import LaunchPipeline
+from src.utils.placement_engine import PlacementEngine
+from src.utils.window_manager import WindowManager, WindowPlacement
+
+EDITOR = "C:\\Apps\\editor.exe"
+TERMINAL = "C:\\Apps\\terminal.exe"
+
+@pytest.fixture
+def desktop(make_desktop):
+    return make_desktop(seed=5)
+
+def test_batch_reports_an_outcome_per_window(desktop, monkeypatch):
+    windows = [desktop.add_window(EDITOR) for _ in range(4)]
+    destroyed, failing = windows[1], windows[2]
+    desktop.destroy_window(destroyed)
+    move = desktop.move_window
+
+    def move_window(hwnd, position, size):
+        if hwnd == failing:
+            raise OSError("Access is denied")
+        move(hwnd, position, size)
+
+    monkeypatch.setattr(desktop, "move_window", move_window)
+    never_existed = max(windows) + 100
+    placements = [WindowPlacement(hwnd, (index * 100, 0), (400, 300))
+                  for index, hwnd in enumerate(windows + [never_existed])]
+    outcomes = {outcome.hwnd: outcome for outcome in WindowManager.place_windows(placements)}
+
+    assert len(outcomes) == len(placements)
+    assert {hwnd: outcome.success for hwnd, outcome in outcomes.items()} == \
+           {windows[0]: True, destroyed: False, failing: False, windows[3]: True, never_existed: False}
+    assert outcomes[destroyed].error == outcomes[never_existed].error == "Window no longer exists"
+    assert outcomes[failing].error == "Access is denied"
+    # The failures did not stop the windows after them
+    assert desktop.windows[windows[0]].rect == (0, 0, 400, 300)
+    assert desktop.windows[windows[3]].rect == (300, 0, 700, 300)
+
+def test_empty_batch(desktop):
+    assert WindowManager.place_windows([]) == []
+
+def test_incremental_apply_reports_failed_moves(desktop, monkeypatch):
+    editor, terminal = desktop.add_window(EDITOR), desktop.add_window(TERMINAL)
+    move = desktop.move_window
+
+    def move_window(hwnd, position, size):
+        if hwnd == editor:
+            raise OSError("Access is denied")
+        move(hwnd, position, size)
+
+    monkeypatch.setattr(desktop, "move_window", move_window)
+    configs = [AppConfig(EDITOR, (0, 0), (800, 600)), AppConfig(TERMINAL, (800, 0), (600, 400))]
+    results = PlacementEngine(LaunchPipeline(window_timeout=1.0)).run(configs, incremental=True)
+    by_path = {result.config.shortcut_path: result for result in results}
+    assert (by_path[EDITOR].success, by_path[EDITOR].reused, by_path[EDITOR].error) == \
+           (False, True, "Access is denied")
+    assert (by_path[TERMINAL].success, by_path[TERMINAL].reused) == (True, True)
+    assert desktop.windows[terminal].rect == (800, 0, 1400, 400)
+    assert desktop.counters.launches == 0
\ No newline at end of file
@@ -0,0 +1,77 @@
+import pytest
+
+from src.utils.process_tracker import ProcessTracker
+from src.utils.window_snapshot import WindowSnapshot
+
+EDITOR = "C:\\Apps\\editor.exe"
+TERMINAL = "C:\\Tools\\terminal.exe"
+
+@pytest.fixture
+def desktop(make_desktop):
+    return make_desktop(seed=4)
+
+def indexes(snapshot: WindowSnapshot) -> tuple:
+    return tuple({key: sorted(handles) for key, handles in index.items()}
+                 for index in (snapshot._by_pid, snapshot._by_exe, snapshot._by_title))
+
+def assert_matches_desktop(snapshot: WindowSnapshot, desktop) -> None:
+    """Checks an incrementally updated snapshot against one built from scratch."""
+    fresh = WindowSnapshot()
+    fresh.refresh()
+    assert set(snapshot.windows) == set(desktop.windows)
+    assert snapshot.windows == fresh.windows
+    assert indexes(snapshot) == indexes(fresh)
+    assert set(snapshot._exe_by_pid) == {info.pid for info in fresh.windows.values()}
+
+def test_refresh_applies_created_and_destroyed_windows(desktop):
+    first = desktop.add_window(EDITOR, title="notes.txt - Editor")
+    second = desktop.add_window(TERMINAL)
+    snapshot = WindowSnapshot()
+    snapshot.refresh()
+    assert_matches_desktop(snapshot, desktop)
+
+    third = desktop.add_window(EDITOR, title="todo.txt - Editor")
+    desktop.destroy_window(first)
+    desktop.windows[second].title = "build"
+    snapshot.refresh()
+    assert_matches_desktop(snapshot, desktop)
+    assert [info.hwnd for info in snapshot.by_exe("editor.exe")] == [third]
+    assert snapshot.by_title("notes.txt - Editor") == []
+    assert [info.hwnd for info in snapshot.by_title("build")] == [second]
+
+    # A destroyed window's process is forgotten once it has no windows left
+    desktop.destroy_window(second)
+    snapshot.refresh()
+    assert_matches_desktop(snapshot, desktop)
+    assert snapshot.by_exe(TERMINAL) == []
+
+def test_known_windows_are_not_read_again_in_full(desktop, monkeypatch):
+    for _ in range(3):
+        desktop.add_window(EDITOR)
+    snapshot = WindowSnapshot()
+    snapshot.refresh()
+
+    owners = []
+    read_owner = desktop.window_owner
+    monkeypatch.setattr(desktop, "window_owner", lambda hwnd: owners.append(hwnd) or read_owner(hwnd))
+    new = desktop.add_window(TERMINAL)
+    snapshot.refresh()
+    assert owners == [new]
+    assert_matches_desktop(snapshot, desktop)
+
+def test_window_events_update_the_index_without_enumerating(desktop):
+    existing = desktop.add_window(EDITOR)
+    source = desktop.create_event_source()
+    tracker = ProcessTracker()
+    tracker.attach(source)
+    source.start()
+    tracker.refresh(force=True)
+    # Events are only applied while a launch is being tracked
+    tracker.track(1)
+    enumerations = tracker.snapshot.enumeration_count
+
+    created = desktop.add_window(TERMINAL)
+    desktop.destroy_window(existing)
+    assert tracker.snapshot.enumeration_count == enumerations
+    assert set(tracker.snapshot.windows) == {created}
+    assert_matches_desktop(tracker.snapshot, desktop)
\ No newline at end of file